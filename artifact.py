@@ -1,7 +1,7 @@
 from corpora import GravestoneDetails
 from belief import PersonMentalModel
 from evidence import Examination
-import random
+from rng import StablyHashed
 
 
 # ARTIFACTS ARE LIKE ITEMS IN THE SIMS, EXCEPT THEY ARE NOT COLLECTIONS OF AFFORDANCES,
@@ -22,7 +22,7 @@ import random
 # if they have glasses), upcoming dentist appointment (simulate dentist office bookkeeping).
 
 
-class Artifact(object):
+class Artifact(StablyHashed):
     """A base class that all artifact subclasses inherit from."""
 
     def __init__(self):
@@ -76,11 +76,11 @@ class Gravestone(Artifact):
         super(Gravestone, self).__init__()
         self.subject = subject
         if self.subject.extended_family:
-            self.header = GravestoneDetails.a_header() + '\n'
+            self.header = GravestoneDetails.a_header(rng=self.subject.game.rng.demographics) + '\n'
             self.family_inscription = self._generate_family_inscription()
-            self.epitaph = GravestoneDetails.an_epitaph() + '\n'
+            self.epitaph = GravestoneDetails.an_epitaph(rng=self.subject.game.rng.demographics) + '\n'
         else:
-            self.header = random.choice(['Here lies buried', 'Rest in peace']) + '\n'
+            self.header = self.subject.game.rng.demographics.choice(['Here lies buried', 'Rest in peace']) + '\n'
             self.family_inscription = ''
             self.epitaph = ''
         if (self.subject.occupations and
@@ -1,4 +1,3 @@
-import random
 from evidence import *
 from corpora import Names
 
@@ -11,6 +10,59 @@ from corpora import Names
 # TODO IF PEOPLE ARE WORKING ARE PEOPLE OBSERVING THEIR JOB?
 
 
+# The challengers of a belief facet that has none; this is an immutable set that is shared by all
+# such facets, since new sets of challengers are always built anew (see MentalModel.adopt_belief())
+NO_CHALLENGERS = frozenset()
+
+
+def compile_belief_facet_accessors(feature_type_to_attribute_path):
+    """Return a dictionary mapping feature types to (getter, setter) tuples for their belief facets.
+
+    @param feature_type_to_attribute_path: A dictionary mapping feature types to the dotted paths
+                                           of the attributes that hold their belief facets, relative
+                                           to a mental model (e.g., 'face.hair.color').
+    """
+    accessors = {}
+    for feature_type, attribute_path in feature_type_to_attribute_path.iteritems():
+        attribute_names = tuple(attribute_path.split('.'))
+        accessors[feature_type] = (
+            _compile_belief_facet_getter(attribute_names=attribute_names),
+            _compile_belief_facet_setter(attribute_names=attribute_names)
+        )
+    return accessors
+
+
+def _compile_belief_facet_getter(attribute_names):
+    """Return a function that gets the belief facet at the given attribute path of a mental model."""
+    attribute_name_on_mental_model, attribute_names_below = attribute_names[0], attribute_names[1:]
+
+    def get_belief_facet(mental_model):
+        # If the mental model hasn't been fully constructed yet -- i.e., this is one of the initial
+        # belief facets that will make up the initial mental model, so attribute hierarchies like
+        # MentalModel.Face.Hair.Color may not even be constructed yet -- or if the belief holding
+        # this facet hasn't been built yet (see PersonMentalModel.__getattr__()), which this won't
+        # do, there is no currently held belief facet
+        obj = mental_model.__dict__.get(attribute_name_on_mental_model)
+        for attribute_name in attribute_names_below:
+            if obj is None:
+                return None
+            obj = getattr(obj, attribute_name, None)
+        return obj
+    return get_belief_facet
+
+
+def _compile_belief_facet_setter(attribute_names):
+    """Return a function that sets the belief facet at the given attribute path of a mental model."""
+    attribute_names_of_parent, attribute_name = attribute_names[:-1], attribute_names[-1]
+
+    def set_belief_facet(mental_model, belief_facet):
+        obj = mental_model
+        for attribute_name_of_parent in attribute_names_of_parent:
+            obj = getattr(obj, attribute_name_of_parent)
+        setattr(obj, attribute_name, belief_facet)
+    return set_belief_facet
+
+
 class MentalModel(object):
     """A person's mental model of a person or place."""
 
@@ -19,6 +71,7 @@ class MentalModel(object):
         self.owner = owner
         self.subject = subject
         self.owner.mind.mental_models[self.subject] = self
+        self.owner.game.deterioration_scheduler.note_new_mental_model(mental_model=self)
         # This dictionary maps feature types (i.e., 'first name', 'hair color') to their
         # trajectories, meaning a list of the belief facets they've held for that attribute of the
         # subject in the order that they were held; facets may appear multiple times in the case
@@ -30,6 +83,14 @@ class MentalModel(object):
         """Return string representation."""
         return "{0}'s mental model of {1}".format(self.owner.name, self.subject.name)
 
+    def get_belief_facet_accessors(self, feature_type):
+        """Return a (getter, setter) tuple of functions that access the belief facet for this feature type."""
+        return self.belief_facet_accessors[feature_type]
+
+    def get_current_belief_facet(self, feature_type):
+        """Return the belief facet currently held for this feature type; if none, return None."""
+        return self.get_belief_facet_accessors(feature_type=feature_type)[0](self)
+
     def implant_knowledge(self, implant):
         """Implant knowledge into this person's mind.
 
@@ -39,7 +100,7 @@ class MentalModel(object):
         """
         config = self.owner.game.config
         for feature_type in config.salience_of_features_with_regard_to_implants:
-            if (random.random() <
+            if (self.owner.game.rng.knowledge.random() <
                     config.salience_of_features_with_regard_to_implants[feature_type] * implant.base_strength):
                 # Note: this Facet will automatically be adopted because it will be this character's
                 # first belief about this attribute; specifically, this will happen by a series of
@@ -101,10 +162,7 @@ class MentalModel(object):
                                       e.g., a belief of what dwelling place a person lives in.
         @param new_evidence: A Statement or Lie object that reifies this new evidence.
         """
-        command_to_access_my_current_belief = self.get_command_to_access_a_belief_facet(
-            feature_type=feature_type
-        )
-        current_belief_facet = eval(command_to_access_my_current_belief)
+        current_belief_facet = self.get_current_belief_facet(feature_type=feature_type)
         if current_belief_facet == feature_value:
             # This new evidence supports an existing belief, so attribute it accordingly
             current_belief_facet.attribute_new_evidence(new_evidence=new_evidence)
@@ -128,10 +186,7 @@ class MentalModel(object):
     def _consider_contradictory_evidence(self, feature_type, feature_value, feature_object_itself, new_evidence):
         """Consider new evidence that contradicts the currently held belief facet."""
         # Access the currently held belief facet
-        command_to_access_my_current_belief = self.get_command_to_access_a_belief_facet(
-            feature_type=feature_type
-        )
-        current_belief_facet = eval(command_to_access_my_current_belief)
+        current_belief_facet = self.get_current_belief_facet(feature_type=feature_type)
         # Check if this evidence supports any challenger to the currently held belief facet
         if any(challenger for challenger in current_belief_facet.challengers if challenger == feature_value):
             # It does, so attribute this new evidence, which may cause this challenger to overtake
@@ -151,13 +206,14 @@ class MentalModel(object):
 
     def adopt_belief(self, new_belief_facet, old_belief_facet=None):
         """Adopt a new belief facet; if an old facet is being overtaken, update it accordingly."""
-        command_to_access_my_current_belief = self.get_command_to_access_a_belief_facet(
-            feature_type=new_belief_facet.feature_type
-        )
-        command_to_instantiate_new_belief_facet = command_to_access_my_current_belief + ' = new_belief_facet'
-        exec command_to_instantiate_new_belief_facet
+        set_belief_facet = self.get_belief_facet_accessors(feature_type=new_belief_facet.feature_type)[1]
+        set_belief_facet(self, new_belief_facet)
         # Update your belief trajectory
         self._update_belief_trajectory(new_belief_facet=new_belief_facet)
+        # The new belief facet will deteriorate on its own schedule
+        self.owner.game.deterioration_scheduler.note_adopted_belief(
+            mental_model=self, feature_type=new_belief_facet.feature_type
+        )
         # Attribute a predecessor (or lack thereof) to the new belief facet
         new_belief_facet.predecessor = old_belief_facet
         # Update the challenger status of the facet(s)
@@ -173,10 +229,10 @@ class MentalModel(object):
             if old_belief_facet == '':
                 new_belief_facet.challengers.remove(old_belief_facet)
         else:
-            new_belief_facet.challengers = set()
+            new_belief_facet.challengers = NO_CHALLENGERS
         # Remove all challengers to the old facet (if it's reinstated, it will inherit in this same way)
         if old_belief_facet is not None:
-            old_belief_facet.challengers = set()
+            old_belief_facet.challengers = NO_CHALLENGERS
 
     def _update_belief_trajectory(self, new_belief_facet):
         """Update the belief trajectory for feature_type by appending new_belief_facet to it."""
@@ -208,7 +264,9 @@ class MentalModel(object):
         """Deteriorate a belief facet, either by mutation, transference, or forgetting."""
         config = self.owner.game.config
         if current_belief_facet != '' and current_belief_facet is not None:
-            result = self._decide_how_knowledge_will_pollute_or_be_forgotten(config=config)
+            result = self._decide_how_knowledge_will_pollute_or_be_forgotten(
+                config=config, rng=self.owner.game.rng.knowledge
+            )
             entity_to_transfer_belief_facet_from = (
                 self._decide_entity_to_transfer_belief_facet_from(feature_type=feature_type)
             )
@@ -235,6 +293,52 @@ class MentalModel(object):
             )
         return belief_facet_obj
 
+    def deteriorate(self):
+        """Deteriorate the components of this mental model (potentially) by mutation, transference, or forgetting."""
+        rng = self.owner.game.rng.knowledge
+        # (None of the feature types subject to deterioration are looked up specially, so their
+        # accessors can be used directly; see get_belief_facet_accessors())
+        belief_facet_accessors = self.belief_facet_accessors
+        for feature_type, strength_floor in self.features_subject_to_deterioration():
+            current_belief_facet = belief_facet_accessors[feature_type][0](self)
+            chance_of_memory_deterioration = self.chance_of_deterioration(
+                feature_type=feature_type,
+                strength=None if current_belief_facet is None else current_belief_facet.strength,
+                strength_floor=strength_floor
+            )
+            if rng.random() < chance_of_memory_deterioration:
+                # Instantiate a new belief facet that represents a deterioration of
+                # the existing one (which itself may be a deterioration already) --
+                # when the facet object's init() method is called, it will call
+                # attribute_new_evidence(), which will automatically call adopt_belief()
+                # because its initial evidence will be of a deterioration type
+                self.deteriorate_belief_facet(feature_type=feature_type, current_belief_facet=current_belief_facet)
+
+    def features_subject_to_deterioration(self):
+        """This method gets overridden by the subclasses to this base class."""
+        return ()
+
+    def chance_of_deterioration(self, feature_type, strength, strength_floor=None):
+        """Return the chance that a facet of the given type deteriorates on a given timestep.
+
+        The chance starts from a base value that gets affected by the owner's memory and the
+        strength of the belief facet.
+
+        @param feature_type: A string representing the type of feature the facet is about.
+        @param strength: The strength of the currently held belief facet, or None if there is none.
+        @param strength_floor: If not None, the facet deteriorates as if its strength were never below this.
+        """
+        config = self.owner.game.config
+        if strength is None:
+            strength = 1
+        elif strength_floor is not None and strength < strength_floor:
+            strength = strength_floor
+        return (
+            config.chance_of_memory_deterioration_on_a_given_timestep[feature_type] /
+            self.owner.mind.memory /
+            strength
+        )
+
     def _confabulate_belief_facet(self, feature_type, current_belief_facet):
         """This method gets overridden by the subclasses to this base class."""
         pass
@@ -288,9 +392,9 @@ class MentalModel(object):
         pass
 
     @staticmethod
-    def _decide_how_knowledge_will_pollute_or_be_forgotten(config):
+    def _decide_how_knowledge_will_pollute_or_be_forgotten(config, rng):
         """Decide whether knowledge will succumb to degradation or transference or forgetting."""
-        x = random.random()
+        x = rng.random()
         pollution_type_probabilities = config.memory_pollution_probabilities
         result = next(  # See config.py to understand what this is doing
             pollution_type[1] for pollution_type in pollution_type_probabilities if
@@ -311,10 +415,9 @@ class MentalModel(object):
             chance_it_gets_remembered_perfectly = chance_cap
         return chance_it_gets_remembered_perfectly
 
-    @staticmethod
-    def get_command_to_access_a_belief_facet(feature_type):
-        """This method gets overridden by the subclasses to this base class."""
-        return ''
+    # Maps feature types to (getter, setter) tuples of functions that access their belief
+    # facets; this gets overridden by the subclasses to this base class
+    belief_facet_accessors = {}
 
 
 class BusinessMentalModel(MentalModel):
@@ -382,53 +485,42 @@ class BusinessMentalModel(MentalModel):
             )
         return business_facet
 
-    def deteriorate(self):
-        """Deteriorate the components of this belief (potentially) by mutation, transference, and/or forgetting."""
-        config = self.owner.game.config
+    def features_subject_to_deterioration(self):
+        """Return (feature type, strength floor) for each facet of this mental model that may deteriorate."""
         for feature in self.__dict__:  # Iterates over all attributes defined in __init__()
             if feature not in ("owner", "subject", "employees", "belief_trajectories"):
-                current_belief_facet = self.__dict__[feature]
-                if current_belief_facet is not None:
-                    feature_type_str = current_belief_facet.feature_type
-                    belief_facet_strength = current_belief_facet.strength
-                    # Determine the chance of memory deterioration, which starts from a base value
-                    # that gets affected by the person's memory and the strength of the belief facet
-                    chance_of_memory_deterioration = (
-                        config.chance_of_memory_deterioration_on_a_given_timestep[feature_type_str] /
-                        self.owner.mind.memory /
-                        belief_facet_strength
-                    )
-                else:  # Could still confabulate
-                    feature_type_str = self.attribute_to_feature_type(attribute=feature)
-                    chance_of_memory_deterioration = config.chance_of_confabulation_on_a_given_timestep
-                if random.random() < chance_of_memory_deterioration:
-                    # Instantiate a new belief facet that represents a deterioration of
-                    # the existing one (which itself may be a deterioration already) --
-                    # when the facet object's init() method is called, it will call
-                    # attribute_new_evidence(), which will automatically call adopt_belief()
-                    # because its initial evidence will be of a deterioration type
-                    self.deteriorate_belief_facet(
-                        feature_type=feature_type_str, current_belief_facet=current_belief_facet
-                    )
+                yield self.attribute_to_feature_type(attribute=feature), None
+
+    def chance_of_deterioration(self, feature_type, strength, strength_floor=None):
+        """Return the chance that a facet of the given type deteriorates on a given timestep.
+
+        @param feature_type: A string representing the type of feature the facet is about.
+        @param strength: The strength of the currently held belief facet, or None if there is none.
+        @param strength_floor: Ignored, since no facets of business mental models have one.
+        """
+        if strength is None:  # Could still confabulate
+            return self.owner.game.config.chance_of_confabulation_on_a_given_timestep
+        return super(BusinessMentalModel, self).chance_of_deterioration(feature_type=feature_type, strength=strength)
 
     def _confabulate_belief_facet(self, feature_type, current_belief_facet):
         """Confabulate a facet to a belief about a dwelling place."""
         config = self.owner.game.config
+        rng = self.owner.game.rng.knowledge
         confabulation = Confabulation(subject=self.subject, source=self.owner)
         if feature_type == "business name":
             # TODO author confabulation procedure for this
             confabulated_feature_str = "CONFABULATED BUSINESS NAME"
             confabulated_object_itself = None
         elif feature_type == "business block":
-            random_block = random.choice(list(self.owner.city.blocks))
+            random_block = rng.choice(list(self.owner.city.blocks))
             confabulated_feature_str = str(random_block)
             confabulated_object_itself = None
         else:  # business address
-            house_number = int(random.random() * config.largest_possible_house_number) + 1
+            house_number = int(rng.random() * config.largest_possible_house_number) + 1
             while house_number < config.smallest_possible_house_number:
-                house_number += int(random.random() * 500)
+                house_number += int(rng.random() * 500)
             house_number = min(house_number, config.largest_possible_house_number)
-            random_street = random.choice(list(self.owner.city.streets))
+            random_street = rng.choice(list(self.owner.city.streets))
             confabulated_feature_str = "{} {}".format(house_number, random_street)
             confabulated_object_itself = None
         belief_facet_object = Facet(
@@ -463,18 +555,19 @@ class BusinessMentalModel(MentalModel):
 
     def _mutate_business_block_facet(self, facet_being_mutated):
         """Mutate a belief facet pertaining to a person's home block."""
+        rng = self.owner.game.rng.knowledge
         # Add 100-300 to block number
         block_number_first_digit = int(str(facet_being_mutated)[0])
-        if random.random() < 0.5:
-            change_to_block_number = random.randint(1, 3)
+        if rng.random() < 0.5:
+            change_to_block_number = rng.randint(1, 3)
         else:
-            change_to_block_number = random.randint(-3, -1)
+            change_to_block_number = rng.randint(-3, -1)
         block_number_first_digit += change_to_block_number
         if block_number_first_digit < 1:
             block_number_first_digit = 1
         elif block_number_first_digit > 8:
             block_number_first_digit = 8
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             # Also mutate street to a nearby street
             street_of_current_facet = next(
                 s for s in self.owner.city.streets if s.name == str(facet_being_mutated).split(' of ')[1]
@@ -492,11 +585,12 @@ class BusinessMentalModel(MentalModel):
     def _mutate_business_address_facet(self, facet_being_mutated):
         """Mutate a belief facet pertaining to a person's home address."""
         config = self.owner.game.config
+        rng = self.owner.game.rng.knowledge
         # Change the house number
         digits_of_house_number = list(str(facet_being_mutated)[:3])
         for i in xrange(3):
-            if random.random() < 0.3:
-                if random.random() < 0.5:
+            if rng.random() < 0.3:
+                if rng.random() < 0.5:
                     change_to_digit = 1
                 else:
                     change_to_digit = -1
@@ -514,7 +608,7 @@ class BusinessMentalModel(MentalModel):
         while mutated_house_number > config.largest_possible_house_number:
             mutated_house_number -= 100
         mutated_house_number = str(mutated_house_number)
-        if random.random() < 0.1:
+        if rng.random() < 0.1:
             # Also mutate street to a nearby street
             street_of_current_facet = next(
                 # Get out just the street name (strip away house number and apartment unit number, if any)
@@ -550,7 +644,7 @@ class BusinessMentalModel(MentalModel):
                     biz for biz in other_business_mental_models if biz.__class__ is self.subject.__class__
                 )
             else:
-                business_belief_will_transfer_from = random.choice(other_business_mental_models)
+                business_belief_will_transfer_from = self.owner.game.rng.knowledge.choice(other_business_mental_models)
         else:
             business_belief_will_transfer_from = None
         return business_belief_will_transfer_from
@@ -581,15 +675,11 @@ class BusinessMentalModel(MentalModel):
         elif feature_type == "business address":
             return self.address
 
-    @staticmethod
-    def get_command_to_access_a_belief_facet(feature_type):
-        """Return a command that will allow the belief facet for this feature type to be directly modified."""
-        feature_type_to_command = {
-            "business name": "self.name",
-            "business block": "self.block",
-            "business address": "self.address",
-        }
-        return feature_type_to_command[feature_type]
+    belief_facet_accessors = compile_belief_facet_accessors({
+        "business name": "name",
+        "business block": "block",
+        "business address": "address",
+    })
 
 
 class DwellingPlaceModel(MentalModel):
@@ -657,54 +747,32 @@ class DwellingPlaceModel(MentalModel):
             )
         return home_facet
 
-    def deteriorate(self):
-        """Deteriorate the components of this belief (potentially) by mutation, transference, and/or forgetting."""
-        config = self.owner.game.config
+    def features_subject_to_deterioration(self):
+        """Return (feature type, strength floor) for each facet of this mental model that may deteriorate."""
         for feature in self.__dict__:  # Iterates over all attributes defined in __init__()
             if feature not in ("owner", "subject", "residents", "belief_trajectories"):
-                current_belief_facet = self.__dict__[feature]
-                if current_belief_facet is not None:
-                    feature_type_str = current_belief_facet.feature_type
-                    belief_facet_strength = current_belief_facet.strength
-                else:
-                    feature_type_str = self.attribute_to_feature_type(attribute=feature)
-                    belief_facet_strength = 1
-                # Determine the chance of memory deterioration, which starts from a base value
-                # that gets affected by the person's memory and the strength of the belief facet
-                chance_of_memory_deterioration = (
-                    config.chance_of_memory_deterioration_on_a_given_timestep[feature_type_str] /
-                    self.owner.mind.memory /
-                    belief_facet_strength
-                )
-                if random.random() < chance_of_memory_deterioration:
-                    # Instantiate a new belief facet that represents a deterioration of
-                    # the existing one (which itself may be a deterioration already) --
-                    # when the facet object's init() method is called, it will call
-                    # attribute_new_evidence(), which will automatically call adopt_belief()
-                    # because its initial evidence will be of a deterioration type
-                    self.deteriorate_belief_facet(
-                        feature_type=feature_type_str, current_belief_facet=current_belief_facet
-                    )
+                yield self.attribute_to_feature_type(attribute=feature), None
 
     def _confabulate_belief_facet(self, feature_type, current_belief_facet):
         """Confabulate a facet to a belief about a dwelling place."""
         config = self.owner.game.config
+        rng = self.owner.game.rng.knowledge
         confabulation = Confabulation(subject=self.subject, source=self.owner)
         if feature_type == "home is apartment":
-            confabulated_feature_str = random.choice(["yes", "no"])
+            confabulated_feature_str = rng.choice(["yes", "no"])
             confabulated_object_itself = None
         elif feature_type == "home block":
-            random_block = random.choice(list(self.owner.city.blocks))  # 98989
+            random_block = rng.choice(list(self.owner.city.blocks))  # 98989
             confabulated_feature_str = str(random_block)
             confabulated_object_itself = None
         else:  # home address
-            house_number = int(random.random() * config.largest_possible_house_number) + 1
+            house_number = int(rng.random() * config.largest_possible_house_number) + 1
             while house_number < config.smallest_possible_house_number:
-                house_number += int(random.random() * 500)
+                house_number += int(rng.random() * 500)
             house_number = min(house_number, config.largest_possible_house_number)
-            random_street = random.choice(list(self.owner.city.streets))
-            if random.random() > 0.5:
-                unit_number = int(random.random() * config.number_of_apartment_units_in_new_complex_max)
+            random_street = rng.choice(list(self.owner.city.streets))
+            if rng.random() > 0.5:
+                unit_number = int(rng.random() * config.number_of_apartment_units_in_new_complex_max)
                 confabulated_feature_str = "{} {} (Unit #{})".format(house_number, random_street, unit_number)
             else:
                 confabulated_feature_str = "{} {}".format(house_number, random_street)
@@ -744,18 +812,19 @@ class DwellingPlaceModel(MentalModel):
 
     def _mutate_home_block_facet(self, facet_being_mutated):
         """Mutate a belief facet pertaining to a person's home block."""
+        rng = self.owner.game.rng.knowledge
         # Add 100-300 to block number
         block_number_first_digit = int(str(facet_being_mutated)[0])
-        if random.random() < 0.5:
-            change_to_block_number = random.randint(1, 3)
+        if rng.random() < 0.5:
+            change_to_block_number = rng.randint(1, 3)
         else:
-            change_to_block_number = random.randint(-3, -1)
+            change_to_block_number = rng.randint(-3, -1)
         block_number_first_digit += change_to_block_number
         if block_number_first_digit < 1:
             block_number_first_digit = 1
         elif block_number_first_digit > 8:
             block_number_first_digit = 8
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             # Also mutate street to a nearby street
             street_of_current_facet = next(
                 s for s in self.owner.city.streets if s.name == str(facet_being_mutated).split(' of ')[1]
@@ -773,11 +842,12 @@ class DwellingPlaceModel(MentalModel):
     def _mutate_home_address_facet(self, facet_being_mutated):
         """Mutate a belief facet pertaining to a person's home address."""
         config = self.owner.game.config
+        rng = self.owner.game.rng.knowledge
         # Change the house number
         digits_of_house_number = list(str(facet_being_mutated)[:3])
         for i in xrange(3):
-            if random.random() < 0.3:
-                if random.random() < 0.5:
+            if rng.random() < 0.3:
+                if rng.random() < 0.5:
                     change_to_digit = 1
                 else:
                     change_to_digit = -1
@@ -795,7 +865,7 @@ class DwellingPlaceModel(MentalModel):
         while mutated_house_number > config.largest_possible_house_number:
             mutated_house_number -= 100
         mutated_house_number = str(mutated_house_number)
-        if random.random() < 0.1:
+        if rng.random() < 0.1:
             # Also mutate street to a nearby street
             street_of_current_facet = next(
                 # Get out just the street name (strip away house number and apartment unit number, if any)
@@ -813,6 +883,7 @@ class DwellingPlaceModel(MentalModel):
 
     def _decide_entity_to_transfer_belief_facet_from(self, feature_type):
         """Decide a person to transfer a belief facet from."""
+        rng = self.owner.game.rng.knowledge
         # TODO make transference of a name feature be more likely for familiar names
         # TODO notion of person similarity should be at play here
         # Find an entity to transfer from that is a dwelling place, is not the subject,
@@ -830,7 +901,7 @@ class DwellingPlaceModel(MentalModel):
                     res for res in other_dwelling_place_mental_models if res.house == self.subject.house
                 )
             else:
-                dwelling_place_belief_will_transfer_from = random.choice(other_dwelling_place_mental_models)
+                dwelling_place_belief_will_transfer_from = rng.choice(other_dwelling_place_mental_models)
         else:
             dwelling_place_belief_will_transfer_from = None
         return dwelling_place_belief_will_transfer_from
@@ -861,15 +932,11 @@ class DwellingPlaceModel(MentalModel):
         elif feature_type == "home address":
             return self.address
 
-    @staticmethod
-    def get_command_to_access_a_belief_facet(feature_type):
-        """Return a command that will allow the belief facet for this feature type to be directly modified."""
-        feature_type_to_command = {
-            "home is apartment": "self.apartment",
-            "home block": "self.block",
-            "home address": "self.address",
-        }
-        return feature_type_to_command[feature_type]
+    belief_facet_accessors = compile_belief_facet_accessors({
+        "home is apartment": "apartment",
+        "home block": "block",
+        "home address": "address",
+    })
 
 
 class PersonMentalModel(MentalModel):
@@ -883,13 +950,9 @@ class PersonMentalModel(MentalModel):
                                           the beliefs composing this mental model originate.
         """
         super(PersonMentalModel, self).__init__(owner, subject)
-        # Prepare the belief hierarchy encapsulated by this object
-        self.status = StatusBelief(person_model=self)
-        self.age = AgeBelief(person_model=self)
-        self.name = NameBelief(person_model=self)
-        self.occupation = WorkBelief(person_model=self)
-        self.face = FaceBelief(person_model=self)
-        self.whereabouts = WhereaboutsBelief(person_model=self)
+        # The belief hierarchy encapsulated by this object (.status, .age, .name, .occupation,
+        # .face, and .whereabouts) gets built one belief at a time, as each is first accessed
+        # (see __getattr__()), since many mental models only ever come to hold a few facets
         # These are currently stragglers because there's only one or two facets to each concept
         self.home = None
         # Establish initial belief facets according to an initial observation/reflection
@@ -902,6 +965,28 @@ class PersonMentalModel(MentalModel):
         elif implant:
             self.implant_knowledge(implant=implant)
 
+    def __getattr__(self, attribute):
+        """Build a belief that is part of this mental model, the first time it is accessed.
+
+        This only gets called when the attribute isn't found the normal way, which for these
+        beliefs means they haven't been built yet.
+        """
+        belief_classes = {
+            "status": StatusBelief,
+            "age": AgeBelief,
+            "name": NameBelief,
+            "occupation": WorkBelief,
+            "face": FaceBelief,
+            "whereabouts": WhereaboutsBelief,
+        }
+        if attribute not in belief_classes:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(self.__class__.__name__, attribute)
+            )
+        belief = belief_classes[attribute](person_model=self)
+        setattr(self, attribute, belief)
+        return belief
+
     def _init_home_facet(self, observation_or_reflection):
         """Establish a belief, or lack of belief, pertaining to a person's home."""
         if observation_or_reflection and observation_or_reflection.type == "reflection":
@@ -928,13 +1013,20 @@ class PersonMentalModel(MentalModel):
         self.whereabouts.build_up(new_observation_or_reflection=new_observation_or_reflection)
         self._build_up_other_belief_facets(new_observation_or_reflection=new_observation_or_reflection)
 
-    def deteriorate(self):
-        """Deteriorate a mental model from time passing."""
-        self.name.deteriorate()
-        self.occupation.deteriorate()
-        self.face.deteriorate()
-        # Manually deteriorate the home one (and other stragglers that may be defined later)
-        self._deteriorate_other_belief_facets()
+    def features_subject_to_deterioration(self):
+        """Return (feature type, strength floor) for each facet of this mental model that may deteriorate.
+
+        Facets pertaining to a person's status, age, and whereabouts don't deteriorate; facets
+        pertaining to a person's face deteriorate as if their strength were never below 1.
+        """
+        for belief_class in (NameBelief, WorkBelief):
+            for feature in belief_class.attributes:
+                yield belief_class.attribute_to_feature_type(attribute=feature), None
+        for feature_type in FaceBelief.feature_types:
+            yield feature_type, 1
+        # Stragglers (home, and others that may be defined later)
+        for feature in ("home",):
+            yield self.attribute_to_feature_type(attribute=feature), None
 
     def _build_up_other_belief_facets(self, new_observation_or_reflection):
         """Build up other beliefs facets that are components of this mental model.
@@ -960,37 +1052,6 @@ class PersonMentalModel(MentalModel):
                     # likely to deteriorate in this future
                     current_belief_facet.attribute_new_evidence(new_evidence=new_observation_or_reflection)
 
-    def _deteriorate_other_belief_facets(self):
-        """Deteriorate other beliefs facets that are components of this mental model.
-        By other facets, I mean ones that don't get deteriorated elsewhere, as, e.g.,
-        facets to WorkBeliefs do.
-        """
-        config = self.owner.game.config
-        for feature in ("home",):
-            current_belief_facet = self.__dict__[feature]
-            if current_belief_facet is not None:
-                feature_type_str = current_belief_facet.feature_type
-                belief_facet_strength = current_belief_facet.strength
-            else:
-                feature_type_str = self.attribute_to_feature_type(attribute=feature)
-                belief_facet_strength = 1
-            # Determine the chance of memory deterioration, which starts from a base value
-            # that gets affected by the person's memory and the strength of the belief facet
-            chance_of_memory_deterioration = (
-                config.chance_of_memory_deterioration_on_a_given_timestep[feature_type_str] /
-                self.owner.mind.memory /
-                belief_facet_strength
-            )
-            if random.random() < chance_of_memory_deterioration:
-                # Instantiate a new belief facet that represents a deterioration of
-                # the existing one (which itself may be a deterioration already) --
-                # when the facet object's init() method is called, it will call
-                # attribute_new_evidence(), which will automatically call adopt_belief()
-                # because its initial evidence will be of a deterioration type
-                self.deteriorate_belief_facet(
-                    feature_type=feature_type_str, current_belief_facet=current_belief_facet
-                )
-
     def _confabulate_belief_facet(self, feature_type, current_belief_facet):
         """Confabulate a new belief facet of the given type.
         This is done using the feature distributions that are used to generate the features
@@ -1020,7 +1081,7 @@ class PersonMentalModel(MentalModel):
                 distribution = config.facial_feature_distributions_male[feature_type]
             else:
                 distribution = config.facial_feature_distributions_female[feature_type]
-            x = random.random()
+            x = self.owner.game.rng.knowledge.random()
             confabulated_feature_str = next(  # See config.py to understand what this is doing
                 feature_type[1] for feature_type in distribution if
                 feature_type[0][0] <= x <= feature_type[0][1]
@@ -1035,11 +1096,12 @@ class PersonMentalModel(MentalModel):
 
     def _confabulate_status_facet(self, feature_type):
         """Confabulate a facet to a belief about a person's name."""
+        rng = self.owner.game.rng.knowledge
         if feature_type == "status":
             # I guess just confabulate a random choice? Unfortunately confabulation
             # is currently a fallback, so every feature type has to have a way to be
             # confabulated
-            return random.choice(['alive', 'dead', 'departed'])
+            return rng.choice(['alive', 'dead', 'departed'])
         elif feature_type == "marital status":
             # Confabulate a roughly likely status given the subject's age
             subject = self.subject
@@ -1058,8 +1120,8 @@ class PersonMentalModel(MentalModel):
             else:  # You are confabulating that they recently departed when they didn't
                 base_year = self.subject.game.year
             max_offset = self.owner.game.config.age_confabulation_max_offset(subject=self.subject)
-            offset = min(1, int(random.random() * max_offset))
-            if random.random() < 0.5:
+            offset = min(1, int(rng.random() * max_offset))
+            if rng.random() < 0.5:
                 offset *= -1
             confabulated_year = base_year + offset
             if confabulated_year > self.subject.game.year-1:
@@ -1069,6 +1131,7 @@ class PersonMentalModel(MentalModel):
 
     def _confabulate_age_facet(self, feature_type):
         """Confabulate a facet to a belief about a person's name."""
+        rng = self.owner.game.rng.knowledge
         if feature_type == "birth year" or feature_type == "death year":
             # Confabulate a birth/death year a few years off from the actual year, with how
             # many 'a few' is depending on the person's actual age (so that someone doesn't
@@ -1080,8 +1143,8 @@ class PersonMentalModel(MentalModel):
             else:  # You are confabulating that they recently died when they didn't
                 birth_or_death_year = self.subject.game.year
             max_offset = self.owner.game.config.age_confabulation_max_offset(subject=self.subject)
-            offset = min(1, int(random.random() * max_offset))
-            if random.random() < 0.5:
+            offset = min(1, int(rng.random() * max_offset))
+            if rng.random() < 0.5:
                 offset *= -1
             confabulated_year = birth_or_death_year + offset
             if confabulated_year > self.subject.game.year-1:
@@ -1089,29 +1152,30 @@ class PersonMentalModel(MentalModel):
             confabulated_feature_str = str(confabulated_year)
         else:  # approximate
             subject_age_decade = self.subject.age / 10  # Don't use float here
-            offset = random.choice([-1, 1])
+            offset = rng.choice([-1, 1])
             confabulated_age_decade = subject_age_decade + offset
             confabulated_feature_str = '{}0s'.format(confabulated_age_decade)
         return confabulated_feature_str
 
     def _confabulate_name_facet(self, feature_type):
         """Confabulate a facet to a belief about a person's name."""
+        rng = self.owner.game.rng.knowledge
         if feature_type == "last name":
-            confabulated_feature_str = Names.any_surname()
+            confabulated_feature_str = Names.any_surname(rng=rng)
         elif feature_type == "first name" or feature_type == "middle name":
             if self.subject.male:
                 # Confabulate a name that is appropriate given the subject's birth year
-                confabulated_feature_str = Names.a_masculine_name(year=self.subject.birth_year)
+                confabulated_feature_str = Names.a_masculine_name(year=self.subject.birth_year, rng=rng)
             else:
-                confabulated_feature_str = Names.a_feminine_name(year=self.subject.birth_year)
+                confabulated_feature_str = Names.a_feminine_name(year=self.subject.birth_year, rng=rng)
         elif feature_type == "suffix":
-            if self.subject.male and random.random() < self.owner.game.config.chance_someone_confabulates_a_suffix:
-                confabulated_feature_str = random.choice(['II', 'III'])
+            if self.subject.male and rng.random() < self.owner.game.config.chance_someone_confabulates_a_suffix:
+                confabulated_feature_str = rng.choice(['II', 'III'])
             else:
                 confabulated_feature_str = 'None'
         elif feature_type == "surname ethnicity":
             # Randomly choose another ethnicity  -- TODO choose according to distribution in the town
-            confabulated_feature_str = random.choice(['English', 'French', 'German', 'Irish', 'Scandinavian'])
+            confabulated_feature_str = rng.choice(['English', 'French', 'German', 'Irish', 'Scandinavian'])
         else:  # hyphenated surname
             # Confabulate according to the distribution in the town
             n_people_in_town_with_hyphenated_surnames = len([
@@ -1120,7 +1184,7 @@ class PersonMentalModel(MentalModel):
             percentage_of_people_in_town_with_hyphenated_surnames = (
                 n_people_in_town_with_hyphenated_surnames/float(self.owner.city.population)
             )
-            if random.random() < percentage_of_people_in_town_with_hyphenated_surnames:
+            if rng.random() < percentage_of_people_in_town_with_hyphenated_surnames:
                 confabulated_feature_str = 'yes'
             else:
                 confabulated_feature_str = 'no'
@@ -1128,16 +1192,17 @@ class PersonMentalModel(MentalModel):
 
     def _confabulate_work_facet(self, feature_type):
         """Confabulate a facet to a belief about a person's work life."""
+        rng = self.owner.game.rng.knowledge
         if feature_type == "workplace":
-            confabulated_company = random.choice(list(self.subject.city.companies))
+            confabulated_company = rng.choice(list(self.subject.city.companies))
             confabulated_feature_str = confabulated_company.name
             confabulated_object_itself = confabulated_company
         elif feature_type == "job shift":
-            confabulated_feature_str = random.choice(["day", "day", "night"])
+            confabulated_feature_str = rng.choice(["day", "day", "night"])
             confabulated_object_itself = None
         elif feature_type == "job title":
-            random_company = random.choice(list(self.owner.city.companies))
-            random_job_title = random.choice(list(random_company.employees)).__class__.__name__
+            random_company = rng.choice(list(self.owner.city.companies))
+            random_job_title = rng.choice(list(random_company.employees)).__class__.__name__
             confabulated_feature_str = random_job_title
             confabulated_object_itself = None
         else:  # job status
@@ -1153,7 +1218,7 @@ class PersonMentalModel(MentalModel):
 
     def _confabulate_home_facet(self, feature_type):
         """Confabulate a facet to a belief about a person's home."""
-        confabulated_home = random.choice(list(self.subject.city.dwelling_places))
+        confabulated_home = self.owner.game.rng.knowledge.choice(list(self.subject.city.dwelling_places))
         confabulated_feature_str = confabulated_home.name
         confabulated_object_itself = confabulated_home
         return confabulated_feature_str, confabulated_object_itself
@@ -1185,7 +1250,7 @@ class PersonMentalModel(MentalModel):
                 feature_type=feature_type, facet_being_mutated=facet_being_mutated
             )
         else:  # Appearance facet
-            x = random.random()
+            x = self.owner.game.rng.knowledge.random()
             possible_mutations = config.memory_mutations[feature_type][str(facet_being_mutated)]
             mutated_feature_str = next(  # See config.py to understand what this is doing
                 mutation[1] for mutation in possible_mutations if
@@ -1202,6 +1267,7 @@ class PersonMentalModel(MentalModel):
 
     def _mutate_status_belief_facet(self, feature_type, feature_being_mutated_from_str):
         """Mutate a belief facet pertaining to a person's name."""
+        rng = self.owner.game.rng.knowledge
         # Only status feature type that can be mutated is departure year; here, we
         # mutate to a year that is a few off from the subject's actual year (note:
         # this is currently the same exact procedure as confabulation for this
@@ -1211,8 +1277,8 @@ class PersonMentalModel(MentalModel):
         else:  # You are confabulating that they recently departed when they didn't
             base_year = self.subject.game.year
         max_offset = self.owner.game.config.age_confabulation_max_offset(subject=self.subject)
-        offset = min(1, int(random.random() * max_offset))
-        if random.random() < 0.5:
+        offset = min(1, int(rng.random() * max_offset))
+        if rng.random() < 0.5:
             offset *= -1
         mutated_year = base_year + offset
         if mutated_year > self.subject.game.year-1:
@@ -1222,6 +1288,7 @@ class PersonMentalModel(MentalModel):
 
     def _mutate_age_belief_facet(self, feature_type, feature_being_mutated_from_str):
         """Mutate a belief facet pertaining to a person's name."""
+        rng = self.owner.game.rng.knowledge
         # Mutate to a year that is a few off from the subject's actual year (note:
         # this is currently the same exact procedure as confabulation for these
         # feature types)
@@ -1232,8 +1299,8 @@ class PersonMentalModel(MentalModel):
         else:  # You are confabulating that they recently died when they didn't
             birth_or_death_year = self.subject.game.year
         max_offset = self.owner.game.config.age_confabulation_max_offset(subject=self.subject)
-        offset = min(1, int(random.random() * max_offset))
-        if random.random() < 0.5 or self.subject.game:
+        offset = min(1, int(rng.random() * max_offset))
+        if rng.random() < 0.5 or self.subject.game:
             offset *= -1
         mutated_year = birth_or_death_year + offset
         if mutated_year > self.subject.game.year-1:
@@ -1243,25 +1310,26 @@ class PersonMentalModel(MentalModel):
 
     def _mutate_name_belief_facet(self, feature_type, feature_being_mutated_from_str):
         """Mutate a belief facet pertaining to a person's name."""
+        rng = self.owner.game.rng.knowledge
         if feature_type in ("first name", "middle name"):
             # Mutate to a name that sounds like the subject's name (shares the same first
             # letter) and is appropriate given the subject's birth year
             if self.subject.male:
                 mutated_feature_str = Names.a_masculine_name_starting_with(
-                    letter=feature_being_mutated_from_str[0], year=self.subject.birth_year
+                    letter=feature_being_mutated_from_str[0], year=self.subject.birth_year, rng=rng
                 )
             else:
                 mutated_feature_str = Names.a_feminine_name_starting_with(
-                    letter=feature_being_mutated_from_str[0], year=self.subject.birth_year
+                    letter=feature_being_mutated_from_str[0], year=self.subject.birth_year, rng=rng
                 )
         elif feature_type == "last name":
             # Choose a surname of the same ethnicity that starts with the same letter
-            mutated_feature_str = Names.a_surname_sounding_like(source_name=feature_being_mutated_from_str)
+            mutated_feature_str = Names.a_surname_sounding_like(source_name=feature_being_mutated_from_str, rng=rng)
         elif feature_type == "surname ethnicity":
             # Randomly choose another ethnicity
             mutated_feature_str = feature_being_mutated_from_str
             while mutated_feature_str == feature_being_mutated_from_str:
-                mutated_feature_str = random.choice(['English', 'French', 'German', 'Irish', 'Scandinavian'])
+                mutated_feature_str = rng.choice(['English', 'French', 'German', 'Irish', 'Scandinavian'])
         else:  # "hyphenated surname"
             # Switch from yes to no, or vice versa
             mutated_feature_str = 'yes' if feature_being_mutated_from_str == 'no' else 'no'
@@ -1292,7 +1360,7 @@ class PersonMentalModel(MentalModel):
                     mutated_feature_str = 'employed'
                     mutated_object_itself = None
             else:  # 'retired'
-                mutated_feature_str = random.choice(['employed', 'unemployed'])
+                mutated_feature_str = self.owner.game.rng.knowledge.choice(['employed', 'unemployed'])
                 mutated_object_itself = None
         return mutated_feature_str, mutated_object_itself
 
@@ -1308,7 +1376,7 @@ class PersonMentalModel(MentalModel):
                 b is not facet_being_mutated
             )
         else:
-            mutated_object_itself = random.choice(list(self.owner.city.companies))
+            mutated_object_itself = self.owner.game.rng.knowledge.choice(list(self.owner.city.companies))
         mutated_feature_str = mutated_object_itself.name
         return mutated_feature_str, mutated_object_itself
 
@@ -1316,7 +1384,7 @@ class PersonMentalModel(MentalModel):
         """Mutate a belief facet pertaining to a person's home."""
         # TODO make this more realistic, e.g., mutate to a relative's house
         # For now, only thing that makes sense is to just do the same thing as Confabulating a new home
-        random_home = random.choice(list(self.subject.city.dwelling_places))
+        random_home = self.owner.game.rng.knowledge.choice(list(self.subject.city.dwelling_places))
         mutated_feature_str = random_home.name
         mutated_object_itself = random_home
         return mutated_feature_str, mutated_object_itself
@@ -1339,7 +1407,7 @@ class PersonMentalModel(MentalModel):
                     person for person in other_people_mental_models if person.male == self.subject.male
                 )
             else:
-                person_belief_will_transfer_from = random.choice(other_people_mental_models)
+                person_belief_will_transfer_from = self.owner.game.rng.knowledge.choice(other_people_mental_models)
         else:
             person_belief_will_transfer_from = None
         return person_belief_will_transfer_from
@@ -1356,39 +1424,17 @@ class PersonMentalModel(MentalModel):
         """Return the facet to this mental model of the given type."""
         if feature_type == "sex":
             return 'male' if self.subject.male else 'female'
-        # Status
-        if feature_type == "status":
-            return self.status.status
-        elif feature_type == "departure year":
-            return self.status.departure_year
-        elif feature_type == "marital status":
-            return self.status.marital_status
-        # Age
-        elif feature_type == "birth year":
-            return self.age.birth_year
-        elif feature_type == "death year":
-            return self.age.death_year
-        elif feature_type == "approximate age":
-            return self.age.approximate
-        # Names
-        elif feature_type == "first name":
-            return self.name.first_name
-        elif feature_type == "middle name":
-            return self.name.middle_name
-        elif feature_type == "last name":
-            return self.name.last_name
-        # Work life
-        elif feature_type == "workplace":
-            return self.occupation.company
-        elif feature_type == "job title":
-            return self.occupation.job_title
-        elif feature_type == "job shift":
-            return self.occupation.shift
-        elif feature_type == "job status":
-            return self.occupation.status
-        # Home
-        elif feature_type == "home":
-            return self.home
+        # Status, age, names, work life, home, and appearance (these are looked up without building
+        # any belief that hasn't been built yet; see __getattr__())
+        if feature_type in (
+            "status", "departure year", "marital status", "birth year", "death year", "approximate age",
+            "first name", "middle name", "last name", "workplace", "job title", "job shift", "job status", "home",
+            "skin color", "head size", "head shape", "hair length", "hair color", "eyebrow size", "eyebrow color",
+            "mouth size", "ear size", "ear angle", "nose size", "nose shape", "eye size", "eye shape",
+            "eye color", "eye horizontal settedness", "eye vertical settedness", "facial hair style", "freckles",
+            "birthmark", "scar", "tattoo", "glasses", "sunglasses",
+        ):
+            return self.get_current_belief_facet(feature_type=feature_type)
         elif feature_type == "home address":
             if self.home.mental_model:
                 return self.home.mental_model.address
@@ -1399,55 +1445,6 @@ class PersonMentalModel(MentalModel):
                 return self.home.mental_model.block
             else:
                 return None
-        # Appearance
-        elif feature_type == "skin color":
-            return self.face.skin.color
-        elif feature_type == "head size":
-            return self.face.head.size
-        elif feature_type == "head shape":
-            return self.face.head.shape
-        elif feature_type == "hair length":
-            return self.face.hair.length
-        elif feature_type == "hair color":
-            return self.face.hair.color
-        elif feature_type == "eyebrow size":
-            return self.face.eyebrows.size
-        elif feature_type == "eyebrow color":
-            return self.face.eyebrows.color
-        elif feature_type == "mouth size":
-            return self.face.mouth.size
-        elif feature_type == "ear size":
-            return self.face.ears.size
-        elif feature_type == "ear angle":
-            return self.face.ears.angle
-        elif feature_type == "nose size":
-            return self.face.nose.size
-        elif feature_type == "nose shape":
-            return self.face.nose.shape
-        elif feature_type == "eye size":
-            return self.face.eyes.size
-        elif feature_type == "eye shape":
-            return self.face.eyes.shape
-        elif feature_type == "eye color":
-            return self.face.eyes.color
-        elif feature_type == "eye horizontal settedness":
-            return self.face.eyes.horizontal_settedness
-        elif feature_type == "eye vertical settedness":
-            return self.face.eyes.vertical_settedness
-        elif feature_type == "facial hair style":
-            return self.face.facial_hair.style
-        elif feature_type == "freckles":
-            return self.face.distinctive_features.freckles
-        elif feature_type == "birthmark":
-            return self.face.distinctive_features.birthmark
-        elif feature_type == "scar":
-            return self.face.distinctive_features.scar
-        elif feature_type == "tattoo":
-            return self.face.distinctive_features.tattoo
-        elif feature_type == "glasses":
-            return self.face.distinctive_features.glasses
-        elif feature_type == "sunglasses":
-            return self.face.distinctive_features.sunglasses
         # These are convenience wrappers for Bad News that allow the wizard
         # to quickly compose 'people_i_believe_are_named()' features; they also afford
         # queries regarding binned skin color and age
@@ -1547,68 +1544,86 @@ class PersonMentalModel(MentalModel):
         }
         return attribute_to_belief_type[attribute]
 
+    belief_facet_accessors = compile_belief_facet_accessors({
+        # Status
+        "status": "status.status",
+        "marital status": "status.marital_status",
+        "departure year": "status.departure_year",
+        # Age
+        "birth year": "age.birth_year",
+        "death year": "age.death_year",
+        "approximate age": "age.approximate",
+        # Name
+        "first name": "name.first_name",
+        "middle name": "name.middle_name",
+        "last name": "name.last_name",
+        "suffix": "name.suffix",
+        "surname ethnicity": "name.surname_ethnicity",
+        "hyphenated surname": "name.hyphenated_surname",
+        # Occupation
+        "workplace": "occupation.company",
+        "job title": "occupation.job_title",
+        "job shift": "occupation.shift",
+        "job status": "occupation.status",
+        # Home
+        "home": "home",
+        # Appearance
+        "skin color": "face.skin.color",
+        "head size": "face.head.size",
+        "head shape": "face.head.shape",
+        "hair length": "face.hair.length",
+        "hair color": "face.hair.color",
+        "eyebrow size": "face.eyebrows.size",
+        "eyebrow color": "face.eyebrows.color",
+        "mouth size": "face.mouth.size",
+        "ear size": "face.ears.size",
+        "ear angle": "face.ears.angle",
+        "nose size": "face.nose.size",
+        "nose shape": "face.nose.shape",
+        "eye size": "face.eyes.size",
+        "eye shape": "face.eyes.shape",
+        "eye color": "face.eyes.color",
+        "eye horizontal settedness": "face.eyes.horizontal_settedness",
+        "eye vertical settedness": "face.eyes.vertical_settedness",
+        "facial hair style": "face.facial_hair.style",
+        "freckles": "face.distinctive_features.freckles",
+        "birthmark": "face.distinctive_features.birthmark",
+        "scar": "face.distinctive_features.scar",
+        "tattoo": "face.distinctive_features.tattoo",
+        "glasses": "face.distinctive_features.glasses",
+        "sunglasses": "face.distinctive_features.sunglasses",
+    })
+    def get_belief_facet_accessors(self, feature_type):
+        """Return a (getter, setter) tuple of functions that access the belief facet for this feature type."""
+        accessors = self.belief_facet_accessors.get(feature_type)
+        if accessors is None:
+            accessors = self._compile_whereabouts_belief_facet_accessors(feature_type=feature_type)
+        return accessors
+
     @staticmethod
-    def get_command_to_access_a_belief_facet(feature_type):
-        """Return a command that will allow the belief facet for this feature type to be directly modified."""
-        feature_type_to_command = {
-            # Status
-            "status": "self.status.status",
-            "marital status": "self.status.marital_status",
-            "departure year": "self.status.departure_year",
-            # Age
-            "birth year": "self.age.birth_year",
-            "death year": "self.age.death_year",
-            "approximate age": "self.age.approximate",
-            # Name
-            "first name": "self.name.first_name",
-            "middle name": "self.name.middle_name",
-            "last name": "self.name.last_name",
-            "suffix": "self.name.suffix",
-            "surname ethnicity": "self.name.surname_ethnicity",
-            "hyphenated surname": "self.name.hyphenated_surname",
-            # Occupation
-            "workplace": "self.occupation.company",
-            "job title": "self.occupation.job_title",
-            "job shift": "self.occupation.shift",
-            "job status": "self.occupation.status",
-            # Home
-            "home": "self.home",
-            # Appearance
-            "skin color": "self.face.skin.color",
-            "head size": "self.face.head.size",
-            "head shape": "self.face.head.shape",
-            "hair length": "self.face.hair.length",
-            "hair color": "self.face.hair.color",
-            "eyebrow size": "self.face.eyebrows.size",
-            "eyebrow color": "self.face.eyebrows.color",
-            "mouth size": "self.face.mouth.size",
-            "ear size": "self.face.ears.size",
-            "ear angle": "self.face.ears.angle",
-            "nose size": "self.face.nose.size",
-            "nose shape": "self.face.nose.shape",
-            "eye size": "self.face.eyes.size",
-            "eye shape": "self.face.eyes.shape",
-            "eye color": "self.face.eyes.color",
-            "eye horizontal settedness": "self.face.eyes.horizontal_settedness",
-            "eye vertical settedness": "self.face.eyes.vertical_settedness",
-            "facial hair style": "self.face.facial_hair.style",
-            "freckles": "self.face.distinctive_features.freckles",
-            "birthmark": "self.face.distinctive_features.birthmark",
-            "scar": "self.face.distinctive_features.scar",
-            "tattoo": "self.face.distinctive_features.tattoo",
-            "glasses": "self.face.distinctive_features.glasses",
-            "sunglasses": "self.face.distinctive_features.sunglasses",
-        }
+    def _compile_whereabouts_belief_facet_accessors(feature_type):
+        """Return a (getter, setter) tuple of functions that access a whereabouts belief facet.
+
+        These are built anew on each call, rather than cached, since whereabouts feature types are
+        indexed by timestep, so that a cache would grow with every timestep ever asked about.
+
+        @param feature_type: A string representing a whereabouts feature type, e.g., 'whereabouts 723099-1'.
+        """
         # Have to do special thing for whereabouts, because they are indexed by date;
         # specifically, we parse the feature type, which will look something like
         # 'whereabouts 723099-1'
-        if 'whereabouts' in feature_type:
-            timestep = feature_type[12:]
-            ordinal_date, day_or_night_bit = timestep.split('-')
-            tuple_string = '({}, {})'.format(ordinal_date, day_or_night_bit)
-            return 'self.whereabouts.date[{}]'.format(tuple_string)
-        else:
-            return feature_type_to_command[feature_type]
+        ordinal_date, day_or_night_bit = feature_type[12:].split('-')
+        timestep = (int(ordinal_date), int(day_or_night_bit))
+
+        def get_belief_facet(mental_model):
+            # If this person does not already hold some belief about subject's whereabouts on
+            # that timestep, there will be no entry in the dictionary for it
+            whereabouts = mental_model.__dict__.get('whereabouts')
+            return whereabouts.date.get(timestep) if whereabouts else None
+
+        def set_belief_facet(mental_model, belief_facet):
+            mental_model.whereabouts.date[timestep] = belief_facet
+        return get_belief_facet, set_belief_facet
 
     @property
     def basic_description(self):
@@ -1661,7 +1676,7 @@ class PersonMentalModel(MentalModel):
             elif feature_type == 'skin color':
                 self._outline_skin_tone()
             else:
-                facet = eval(self.get_command_to_access_a_belief_facet(feature_type=feature_type))
+                facet = self.get_current_belief_facet(feature_type=feature_type)
                 if facet == '':
                     facet = '[forgot]'
                 print "{feature_type}: {value} ({confidence})".format(
@@ -1760,8 +1775,11 @@ class Belief(object):
     """A base class that all belief subclasses inherit from.
 
     A belief is a collection of facets pertaining to the same aspect of the
-    subject of a mental model, e.g., a person's name.
+    subject of a mental model, e.g., a person's name. Since there are about a dozen beliefs
+    for every mental model of a person, these classes (and the components of FaceBelief)
+    declare __slots__, rather than each carrying a __dict__ around.
     """
+    __slots__ = ('person_model',)
     attributes = None  # This gets overridden by subclasses to this base class
 
     def __init__(self, person_model):
@@ -1790,67 +1808,37 @@ class Belief(object):
     def establish(self, observation_or_reflection):
         """Establish initial belief facets in response to an initial observation/reflection."""
         for attribute in self.__class__.attributes:
-            self.__dict__[attribute] = self._init_facet(
+            setattr(self, attribute, self._init_facet(
                 feature_type=self.attribute_to_feature_type(attribute=attribute),
                 observation_or_reflection=observation_or_reflection
-            )
+            ))
 
     def build_up(self, new_observation_or_reflection):
         """Build up the components of this belief by potentially filling in missing information
         and/or repairing wrong information, or else by updating the evidence for already correct facets.
         """
-        for feature in self.__dict__:  # Iterates over all attributes defined in __init__()
-            if feature != 'person_model':  # This should be the only one that doesn't resolve to a belief type
-                feature_type = self.attribute_to_feature_type(feature)
-                if self.person_model.owner.game.config.feature_is_observable[feature_type](
-                        subject=self.person_model.subject
-                ):
-                    current_belief_facet = self.__dict__[feature]
-                    if current_belief_facet is None or not current_belief_facet.accurate:
-                        feature_type = self.attribute_to_feature_type(attribute=feature)
-                        # Adopt a new, accurate belief facet (unless init_belief_facet returns None) --
-                        # if a Facet object is instantiated, it will automatically be adopted because
-                        # it's initial evidence will be a reflection or observation; specifically,
-                        # Facet.init() will call attribute_new_evidence() which will call adopt_belief()
-                        self.person_model.init_belief_facet(
-                            feature_type=feature_type,
-                            observation_or_reflection=new_observation_or_reflection
-                        )
-                    else:
-                        # Belief facet is already accurate, but update its evidence to point to the new
-                        # observation or reflection (which will slow any potential deterioration) -- this
-                        # will also increment the strength of the belief facet, which will make it less
-                        # likely to deteriorate in this future
-                        current_belief_facet.attribute_new_evidence(new_evidence=new_observation_or_reflection)
-
-    def deteriorate(self):
-        """Deteriorate the components of this belief (potentially) by mutation, transference, and/or forgetting."""
-        config = self.person_model.owner.game.config
-        for feature in self.__dict__:  # Iterates over all attributes defined in __init__()
-            if feature != 'person_model':  # This should be the only one that doesn't resolve to a belief type
-                current_belief_facet = self.__dict__[feature]
-                if current_belief_facet is not None:
-                    feature_type_str = current_belief_facet.feature_type
-                    belief_facet_strength = current_belief_facet.strength
-                else:
-                    feature_type_str = self.attribute_to_feature_type(attribute=feature)
-                    belief_facet_strength = 1
-                # Determine the chance of memory deterioration, which starts from a base value
-                # that gets affected by the person's memory and the strength of the belief facet
-                chance_of_memory_deterioration = (
-                    config.chance_of_memory_deterioration_on_a_given_timestep[feature_type_str] /
-                    self.person_model.owner.mind.memory /
-                    belief_facet_strength
-                )
-                if random.random() < chance_of_memory_deterioration:
-                    # Instantiate a new belief facet that represents a deterioration of
-                    # the existing one (which itself may be a deterioration already) --
-                    # when the facet object's init() method is called, it will call
-                    # attribute_new_evidence(), which will automatically call adopt_belief()
-                    # because its initial evidence will be of a deterioration type
-                    self.person_model.deteriorate_belief_facet(
-                        feature_type=feature_type_str, current_belief_facet=current_belief_facet
+        for feature in self.__class__.attributes:
+            feature_type = self.attribute_to_feature_type(feature)
+            if self.person_model.owner.game.config.feature_is_observable[feature_type](
+                    subject=self.person_model.subject
+            ):
+                current_belief_facet = getattr(self, feature)
+                if current_belief_facet is None or not current_belief_facet.accurate:
+                    feature_type = self.attribute_to_feature_type(attribute=feature)
+                    # Adopt a new, accurate belief facet (unless init_belief_facet returns None) --
+                    # if a Facet object is instantiated, it will automatically be adopted because
+                    # it's initial evidence will be a reflection or observation; specifically,
+                    # Facet.init() will call attribute_new_evidence() which will call adopt_belief()
+                    self.person_model.init_belief_facet(
+                        feature_type=feature_type,
+                        observation_or_reflection=new_observation_or_reflection
                     )
+                else:
+                    # Belief facet is already accurate, but update its evidence to point to the new
+                    # observation or reflection (which will slow any potential deterioration) -- this
+                    # will also increment the strength of the belief facet, which will make it less
+                    # likely to deteriorate in this future
+                    current_belief_facet.attribute_new_evidence(new_evidence=new_observation_or_reflection)
 
     @staticmethod
     def attribute_to_feature_type(attribute):
@@ -1861,6 +1849,7 @@ class Belief(object):
 class StatusBelief(Belief):
     """A person's mental model of a person's basic status, namely, whether they are in town and alive."""
     attributes = ("status", "departure_year", "marital_status")
+    __slots__ = attributes
 
     def __init__(self, person_model):
         """Initialize a StatusBelief object."""
@@ -1883,6 +1872,7 @@ class StatusBelief(Belief):
 class AgeBelief(Belief):
     """A person's mental model of a person's age."""
     attributes = ("birth_year", "death_year", "approximate")
+    __slots__ = attributes
 
     def __init__(self, person_model):
         """Initialize a NameBelief object."""
@@ -1919,6 +1909,7 @@ class NameBelief(Belief):
         "first_name", "middle_name", "last_name", "suffix",
         "surname_ethnicity", "hyphenated_surname"
     )
+    __slots__ = attributes
 
     def __init__(self, person_model):
         """Initialize a NameBelief object."""
@@ -1970,6 +1961,7 @@ class NameBelief(Belief):
 class WorkBelief(Belief):
     """A person's mental model of a person's work life."""
     attributes = ("company", "job_title", "shift", "status")
+    __slots__ = attributes
 
     def __init__(self, person_model):
         """Initialize a WorkBelief object."""
@@ -1994,6 +1986,7 @@ class WorkBelief(Belief):
 
 class WhereaboutsBelief(Belief):
     """A person's mental model of another person's past whereabouts."""
+    __slots__ = ('date',)
     attributes = None  # Belief.establish() gets overridden in this subclass
 
     def __init__(self, person_model):
@@ -2008,8 +2001,9 @@ class WhereaboutsBelief(Belief):
         location_str = self.person_model.owner.location.name
         location_obj = self.person_model.owner.location
         day_or_night_id = 0 if self.person_model.owner.game.time_of_day == "day" else 1
-        # Generate a unique key so that we can maintain a trajectory for this belief
-        feature_type = "whereabouts {}-{}".format(self.person_model.owner.game.ordinal_date, day_or_night_id)
+        # Generate a unique key so that we can maintain a trajectory for this belief (interned,
+        # since everyone who observes this person at this timestep will hold a facet of this type)
+        feature_type = intern("whereabouts {}-{}".format(self.person_model.owner.game.ordinal_date, day_or_night_id))
         self.date[(self.person_model.owner.game.ordinal_date, day_or_night_id)] = Facet(
             value=location_str, owner=self.person_model.owner, subject=self.person_model.subject,
             feature_type=feature_type, initial_evidence=observation_or_reflection,
@@ -2022,8 +2016,11 @@ class WhereaboutsBelief(Belief):
             location_str = self.person_model.owner.location.name
             location_obj = self.person_model.owner.location
             day_or_night_id = 0 if self.person_model.owner.game.time_of_day == "day" else 1
-            # Generate a unique hash so that we can maintain a trajectory for this belief
-            feature_type = "whereabouts {}-{}".format(self.person_model.owner.game.ordinal_date, day_or_night_id)
+            # Generate a unique hash so that we can maintain a trajectory for this belief (interned,
+            # since everyone who observes this person at this timestep will hold a facet of this type)
+            feature_type = intern(
+                "whereabouts {}-{}".format(self.person_model.owner.game.ordinal_date, day_or_night_id)
+            )
             self.date[(self.person_model.owner.game.ordinal_date, day_or_night_id)] = Facet(
                 value=location_str, owner=self.person_model.owner, subject=self.person_model.subject,
                 feature_type=feature_type, initial_evidence=new_observation_or_reflection,
@@ -2033,7 +2030,17 @@ class WhereaboutsBelief(Belief):
 
 class FaceBelief(Belief):
     """A person's mental model of a person's face."""
+    __slots__ = (
+        'skin', 'head', 'hair', 'eyebrows', 'eyes', 'ears', 'nose', 'mouth', 'facial_hair', 'distinctive_features'
+    )
     attributes = None  # Belief.establish() gets overridden by this subclass
+    # The feature types of the facets held by the components of this belief
+    feature_types = (
+        "skin color", "head size", "head shape", "hair length", "hair color", "eyebrow size", "eyebrow color",
+        "eye size", "eye shape", "eye horizontal settedness", "eye vertical settedness", "eye color",
+        "ear size", "ear angle", "nose size", "nose shape", "mouth size", "facial hair style",
+        "freckles", "birthmark", "scar", "tattoo", "glasses", "sunglasses",
+    )
 
     def __init__(self, person_model):
         """Initialize a FaceBelief object."""
@@ -2064,67 +2071,35 @@ class FaceBelief(Belief):
         """Build up the components of this belief by potentially filling in missing information
         and/or repairing wrong information, or else by updating the evidence for already correct facets.
         """
-        for belief_type in self.__dict__:  # Iterates over all attributes defined in __init__()
-            if belief_type != 'person_model':  # This should be the only one that doesn't resolve to a belief type
-                belief = self.__dict__[belief_type]
-                for feature in belief.__dict__:
-                    if feature != 'face_belief':  # This should be the only one that doesn't resolve to a belief facet
-                        feature_type = belief.attribute_to_feature_type(attribute=feature)
-                        if self.person_model.owner.game.config.feature_is_observable[feature_type](
-                                subject=self.person_model.subject
-                        ):
-                            belief_facet = belief.__dict__[feature]
-                            if belief_facet is None or not belief_facet.accurate:
-                                feature_type = belief.attribute_to_feature_type(attribute=feature)
-                                # Adopt a new, accurate belief facet (unless init_belief_facet returns None)
-                                belief.__dict__[feature] = (
-                                    belief.face_belief.person_model.init_belief_facet(
-                                        feature_type=feature_type,
-                                        observation_or_reflection=new_observation_or_reflection
-                                    )
+        for belief_type in self.__slots__:
+            belief = getattr(self, belief_type)
+            for feature in belief.__slots__:
+                if feature != 'face_belief':  # This should be the only one that doesn't resolve to a belief facet
+                    feature_type = belief.attribute_to_feature_type(attribute=feature)
+                    if self.person_model.owner.game.config.feature_is_observable[feature_type](
+                            subject=self.person_model.subject
+                    ):
+                        belief_facet = getattr(belief, feature)
+                        if belief_facet is None or not belief_facet.accurate:
+                            feature_type = belief.attribute_to_feature_type(attribute=feature)
+                            # Adopt a new, accurate belief facet (unless init_belief_facet returns None)
+                            setattr(belief, feature, (
+                                belief.face_belief.person_model.init_belief_facet(
+                                    feature_type=feature_type,
+                                    observation_or_reflection=new_observation_or_reflection
                                 )
-                            else:
-                                # Belief facet is already accurate, but update its evidence to point to the new
-                                # observation or reflection (which will slow any potential deterioration) -- this
-                                # will also increment the strength of the belief facet, which will make it less
-                                # likely to deteriorate in this future
-                                belief_facet.attribute_new_evidence(new_evidence=new_observation_or_reflection)
-
-    def deteriorate(self):
-        """Deteriorate the components of this belief (potentially) by mutation, transference, and/or forgetting."""
-        config = self.person_model.owner.game.config
-        for belief_type in self.__dict__:  # Iterates over all attributes defined in __init__()
-            if belief_type != 'person_model':  # This should be the only one that doesn't resolve to a belief type
-                belief = self.__dict__[belief_type]
-                for feature in belief.__dict__:
-                    if feature != 'face_belief':  # This should be the only one that doesn't resolve to a belief facet
-                        belief_facet = belief.__dict__[feature]
-                        if belief_facet is not None:
-                            feature_type_str = belief_facet.feature_type
-                            belief_facet_strength = belief_facet.strength
+                            ))
                         else:
-                            feature_type_str = belief.attribute_to_feature_type(attribute=feature)
-                            belief_facet_strength = 1
-                        if belief_facet_strength < 1:
-                            belief_facet_strength = 1
-                        # Determine the chance of memory deterioration, which starts from a base value
-                        # that gets affected by the person's memory and the strength of the belief facet
-                        chance_of_memory_deterioration = (
-                            config.chance_of_memory_deterioration_on_a_given_timestep[feature_type_str] /
-                            self.person_model.owner.mind.memory /
-                            belief_facet_strength
-                        )
-                        if random.random() < chance_of_memory_deterioration:
-                            # Instantiate a new belief facet that represents a deterioration of
-                            # the existing one (which itself may be a deterioration already)
-                            deteriorated_belief_facet = self.person_model.deteriorate_belief_facet(
-                                feature_type=feature_type_str, current_belief_facet=belief_facet
-                            )
-                            belief.__dict__[feature] = deteriorated_belief_facet
+                            # Belief facet is already accurate, but update its evidence to point to the new
+                            # observation or reflection (which will slow any potential deterioration) -- this
+                            # will also increment the strength of the belief facet, which will make it less
+                            # likely to deteriorate in this future
+                            belief_facet.attribute_new_evidence(new_evidence=new_observation_or_reflection)
 
 
 class SkinBelief(object):
     """A person's mental model of a person's skin."""
+    __slots__ = ('face_belief', 'color')
 
     def __init__(self, face_belief):
         """Initialize a Skin object.
@@ -2150,6 +2125,7 @@ class SkinBelief(object):
 
 class HeadBelief(object):
     """A person's mental model of a person's head."""
+    __slots__ = ('face_belief', 'size', 'shape')
 
     def __init__(self, face_belief):
         """Initialize a Head object.
@@ -2180,6 +2156,7 @@ class HeadBelief(object):
 
 class HairBelief(object):
     """A person's mental model of a person's hair (on his or her head)."""
+    __slots__ = ('face_belief', 'length', 'color')
 
     def __init__(self, face_belief):
         """Initialize a Hair object.
@@ -2210,6 +2187,7 @@ class HairBelief(object):
 
 class EyebrowsBelief(object):
     """A person's mental model of a person's eyebrows."""
+    __slots__ = ('face_belief', 'size', 'color')
 
     def __init__(self, face_belief):
         """Initialize a Eyebrows object.
@@ -2240,6 +2218,7 @@ class EyebrowsBelief(object):
 
 class MouthBelief(object):
     """A person's mental model of a person's mouth."""
+    __slots__ = ('face_belief', 'size')
 
     def __init__(self, face_belief):
         """Initialize a Mouth object.
@@ -2265,6 +2244,7 @@ class MouthBelief(object):
 
 class EarsBelief(object):
     """A person's mental model of a person's ears."""
+    __slots__ = ('face_belief', 'size', 'angle')
 
     def __init__(self, face_belief):
         """Initialize an Ears object.
@@ -2295,6 +2275,7 @@ class EarsBelief(object):
 
 class NoseBelief(object):
     """A person's mental model of a person's nose."""
+    __slots__ = ('face_belief', 'size', 'shape')
 
     def __init__(self, face_belief):
         """Initialize a Nose object.
@@ -2325,6 +2306,7 @@ class NoseBelief(object):
 
 class EyesBelief(object):
     """A person's mental model of a person's eyes."""
+    __slots__ = ('face_belief', 'size', 'shape', 'horizontal_settedness', 'vertical_settedness', 'color')
 
     def __init__(self, face_belief):
         """Initialize an Eyes object.
@@ -2370,6 +2352,7 @@ class EyesBelief(object):
 
 class FacialHairBelief(object):
     """A person's mental model of a person's facial hair."""
+    __slots__ = ('face_belief', 'style')
 
     def __init__(self, face_belief):
         """Initialize a FacialHair style.
@@ -2395,6 +2378,7 @@ class FacialHairBelief(object):
 
 class DistinctiveFeaturesBelief(object):
     """A person's mental model of a person's distinguishing features."""
+    __slots__ = ('face_belief', 'freckles', 'birthmark', 'scar', 'tattoo', 'glasses', 'sunglasses')
 
     def __init__(self, face_belief):
         """Initialize a DistinctiveFeatures object.
@@ -2464,7 +2448,8 @@ class Facet(str):
         """
         super(Facet, self).__init__()
         self.owner = owner
-        self.owner.all_belief_facets.add(self)  # Used to make batch calls to decay_strength()
+        self.owner.all_belief_facets.add(self)
+        self.owner.game.profiler.note_creation(object_category='Facet')
         self.subject = subject
         self.feature_type = feature_type
         # Only currently held belief facets are attributed a predecessor -- if you are merely
@@ -2492,7 +2477,9 @@ class Facet(str):
         # belief accordingly (by .attribute_new_evidence) and relegate this belief to challenger
         # status. Upon adoption, a Facet that was a challenger inherits the challengers of
         # its predecessor, excluding itself
-        self.challengers = set()  # Default value; may get changed by MentalModel.adopt_belief()
+        # Default value (shared by every facet that has no challengers, which is most of them, to save
+        # memory); may get changed by MentalModel.adopt_belief()
+        self.challengers = NO_CHALLENGERS
         self.evidence = set()
         self.object_itself = object_itself
         if object_itself:
@@ -2512,8 +2499,11 @@ class Facet(str):
             self.mental_model = None
         # The strength of a belief will increment commensurately to the strength of each
         # new piece of evidence that gets attributed (by attribute_new_evidence) and will
-        # decay as time passes (by decay_strength)
-        self.strength = 0.0
+        # decay as time passes; rather than decaying every belief facet in town each day,
+        # we store the strength along with the date on which it was last set, and work out
+        # how much it has decayed since then whenever it's read (see the .strength property)
+        self._strength = 0.0
+        self.ordinal_date_strength_was_set = self.owner.game.ordinal_date
         # Finally, attribute the initial evidence to this new belief facet, which may cause a
         # currently held belief to shift to challenger status, and this new belief to the
         # character's actual current belief
@@ -2523,6 +2513,10 @@ class Facet(str):
         """Do str stuff."""
         return str.__new__(cls, value)
 
+    def __getnewargs__(self):
+        """Return the arguments to pass to __new__() when unpickling (other attributes get restored after)."""
+        return str(self), None, None, None, None, None
+
     @property
     def accurate(self):
         """Return whether this belief is accurate."""
@@ -2532,6 +2526,20 @@ class Facet(str):
         else:
             return False
 
+    @property
+    def strength(self):
+        """Return the strength of this belief, as decayed by the days that have passed since it was last set."""
+        days_elapsed = self.owner.game.ordinal_date - self.ordinal_date_strength_was_set
+        if not days_elapsed:
+            return self._strength
+        return self._strength * self.owner.game.config.decay_rate_of_belief_strength_per_day**days_elapsed
+
+    @strength.setter
+    def strength(self, value):
+        """Set the strength of this belief as of today."""
+        self._strength = value
+        self.ordinal_date_strength_was_set = self.owner.game.ordinal_date
+
     @property
     def strength_str(self):
         """Return a short description of the strength of this belief."""
@@ -2548,10 +2556,6 @@ class Facet(str):
         else:
             return "not confident"
 
-    def decay_strength(self):
-        """Decay the strength of this belief due to time passing."""
-        self.strength *= self.owner.game.config.decay_rate_of_belief_strength_per_day
-
     def attribute_new_evidence(self, new_evidence):
         """Attribute new evidence that supports this belief facet."""
         self.evidence.add(new_evidence)
@@ -2600,38 +2604,7 @@ class Facet(str):
     def _get_currently_held_belief(self):
         """Return the belief facet that is currently held for this feature type; if none, return None."""
         mental_model = self.owner.mind.mental_models[self.subject]
-        command_to_access_currently_held_belief = mental_model.get_command_to_access_a_belief_facet(
-            feature_type=self.feature_type
-        )
-        # Have to swap out 'self' in this command, because the return value for
-        # mental_model.get_command_to_access_a_belief_facet() is relative to mental model
-        # being referenceable by 'self'
-        command_to_access_currently_held_belief = (
-            command_to_access_currently_held_belief.replace('self', 'mental_model')
-        )
-        try:
-            currently_held_belief = eval(command_to_access_currently_held_belief)
-        except AttributeError:
-            # This error gets raised when the mental model has not even been fully constructed
-            # yet -- i.e., this is one of the initial belief facets that will make up the initial
-            # mental model, so attribute hierarchies like MentalModel.Face.Hair.Color are not even
-            # constructed yet (and thus cannot be accessed); in this case, we can safely assert that
-            # there is no currently held belief for this attribute
-            currently_held_belief = None
-        except KeyError:
-            # This error gets raised when an attempt is made (by evaluating command_to_access_
-            # currently_held_belief) to access a non-existent whereabouts belief; i.e., the
-            # command will specify accessing a WhereaboutsBelief.date dictionary with a key for
-            # the timestep in question, but if this person did not already hold some belief about
-            # subject's whereabouts on that timestep, then a KeyError will be raised, since there
-            # will be no entry in the dictionary associated with that key;  in this case, we can
-            # safely assert that there is no currently held belief for this attribute
-            assert 'whereabouts' in self.feature_type, (
-                "A KeyError was raised outside of the context of an attempt to access a "
-                "non-existent whereabouts belief."
-            )
-            currently_held_belief = None
-        return currently_held_belief
+        return mental_model.get_current_belief_facet(feature_type=self.feature_type)
 
     def why(self):
         """Pretty-print why this character holds this particular belief."""
@@ -0,0 +1,214 @@
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+import traceback
+from belief import MentalModel, PersonMentalModel
+from game import Game
+
+
+# The town sizes that a benchmark can be run at, each specified as a number of quadtree samples
+# that overrides the one in config.py (more samples make for a denser town, with more lots and
+# fewer tracts; the quadtree size itself can't be changed, since citygen assumes it); 'medium'
+# is the size of the towns that are generated during actual gameplay
+TOWN_SIZES = {
+    'small': 12,
+    'medium': 32,
+    'large': 64,
+}
+
+
+def benchmark_worldgen(seeds, town_sizes, output_filename, quiet=True):
+    """Benchmark worldgen for every combination of the given seeds and town sizes, and write the results to a file.
+
+    Each town is generated in a fresh worker process, and only one town is generated at a
+    time, so that the timings of one town aren't disturbed by the generation of another and
+    the peak memory of each phase reflects that town alone. The results are written as JSON.
+
+    @param seeds: An iterable of seeds for the random number generator.
+    @param town_sizes: An iterable of town sizes, each of which must be a key in TOWN_SIZES.
+    @param output_filename: The path to which the results will be written.
+    @param quiet: Whether to silence the worldgen progress output of the worker processes.
+    @return: A list of results (dictionaries), one per generated town.
+    """
+    jobs = [(seed, town_size, quiet) for town_size in town_sizes for seed in seeds]
+    pool = multiprocessing.Pool(processes=1, maxtasksperchild=1)
+    try:
+        runs = pool.map(_benchmark_town, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    results = {
+        'date': datetime.datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': runs,
+    }
+    with open(output_filename, 'w') as output_file:
+        json.dump(results, output_file, indent=2, sort_keys=True)
+    return runs
+
+
+def _benchmark_town(job):
+    """Generate a single town phase by phase, and return the timings of each phase."""
+    seed, town_size, quiet = job
+    if quiet:
+        sys.stdout = open(os.devnull, 'w')
+    run = {
+        'seed': seed, 'town_size': town_size, 'error': None,
+        'phases': [], 'population': None, 'n_events': None, 'bytes_per_mental_model': None,
+    }
+    game = None
+    try:
+        game = Game(seed=seed)
+        game.config.quadtree_samples = TOWN_SIZES[town_size]
+        _time_phase(run, 'city', game.generate_city)
+        _time_phase(run, 'settlers', game.establish_settlers)
+        for decade, n_timesteps in _decades_of_lo_fi_simulation(game):
+            _time_phase(
+                run, 'lo_fi_{decade}s'.format(decade=decade), game.enact_lo_fi_simulation, n_timesteps=n_timesteps
+            )
+        _time_phase(run, 'implant_knowledge', game.implant_knowledge)
+        _time_phase(run, 'hi_fi_week', game.enact_final_week_of_worldgen)
+        run['population'] = game.city.population
+        run['n_events'] = len(game.events)
+        run['bytes_per_mental_model'] = bytes_per_mental_model(game)
+    except Exception:
+        # Don't let one bad town sink the whole benchmark
+        run['error'] = traceback.format_exc()
+    finally:
+        # Worker processes exit without running atexit handlers, so the event store
+        # has to be closed here (which deletes its log from disk)
+        if game:
+            game.events.close()
+    return run
+
+
+def _decades_of_lo_fi_simulation(game):
+    """Return a list of (decade, number of timesteps) tuples that together span the lo-fi simulation."""
+    ordinal_date_hi_fi_simulation_begins = game.ordinal_date + game.n_timesteps_until_hi_fi_simulation_begins/2
+    ordinal_date = game.ordinal_date
+    decade = game.year - game.year % 10
+    decades = []
+    while ordinal_date < ordinal_date_hi_fi_simulation_begins:
+        ordinal_date_decade_ends = min(
+            datetime.date(decade+10, 1, 1).toordinal(), ordinal_date_hi_fi_simulation_begins
+        )
+        decades.append((decade, (ordinal_date_decade_ends-ordinal_date)*2))
+        ordinal_date = ordinal_date_decade_ends
+        decade += 10
+    return decades
+
+
+def _time_phase(run, phase, function, **kwargs):
+    """Call the given function, and record its wall time and peak memory as a phase of the given run."""
+    _reset_peak_memory()
+    start_time = time.time()
+    function(**kwargs)
+    run['phases'].append({
+        'phase': phase,
+        'wall_time': time.time() - start_time,
+        'peak_memory_kb': _peak_memory(),
+    })
+
+
+def bytes_per_mental_model(game):
+    """Return the average number of bytes taken up by a resident's mental model of another person.
+
+    This counts the mental model itself, its beliefs, and every belief facet that can be reached
+    from them (along with the containers holding all of these, e.g., a facet's set of evidence),
+    as measured by sys.getsizeof(); the people, places, and evidence that these refer to are
+    shared with the rest of the game, and so they aren't counted.
+
+    @param game: A Game object whose residents have formed mental models of one another.
+    @return: The average number of bytes per mental model, or None if there aren't any.
+    """
+    total_bytes = n_mental_models = 0
+    for person in game.city.residents:
+        for subject, mental_model in person.mind.mental_models.iteritems():
+            if subject is not person and isinstance(mental_model, PersonMentalModel):
+                total_bytes += _footprint(mental_model)
+                n_mental_models += 1
+    return total_bytes / n_mental_models if n_mental_models else None
+
+
+def _footprint(mental_model):
+    """Return the number of bytes taken up by the objects making up the given mental model."""
+    total_bytes = 0
+    visited = set()
+    to_visit = [mental_model]
+    while to_visit:
+        obj = to_visit.pop()
+        if id(obj) in visited:
+            continue
+        visited.add(id(obj))
+        total_bytes += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            referents = obj.keys() + obj.values()
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            referents = list(obj)
+        else:
+            referents = []
+            if hasattr(obj, '__dict__'):
+                total_bytes += sys.getsizeof(obj.__dict__)
+                referents += obj.__dict__.values()
+            for cls in type(obj).__mro__:
+                referents += [getattr(obj, slot, None) for slot in cls.__dict__.get('__slots__', ())]
+        for referent in referents:
+            if isinstance(referent, (dict, list, tuple, set, frozenset)):
+                to_visit.append(referent)
+            elif type(referent).__module__ == 'belief' and not isinstance(referent, MentalModel):
+                to_visit.append(referent)  # A belief or belief facet (not some other mental model)
+    return total_bytes
+
+
+def _reset_peak_memory():
+    """Reset the peak resident set size of this process, if the platform allows it (Linux does)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as clear_refs:
+            clear_refs.write('5')
+    except IOError:
+        pass
+
+
+def _peak_memory():
+    """Return the peak resident set size of this process (since it was last reset), in kilobytes."""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except IOError:
+        pass
+    # Otherwise, fall back to the peak over the lifetime of the process (which is
+    # reported in kilobytes on Linux, but in bytes on OS X)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform == 'darwin' else peak
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark worldgen, phase by phase.')
+    parser.add_argument('seeds', type=int, nargs='+', help='a seed for each town to generate')
+    parser.add_argument(
+        '--sizes', nargs='+', default=['medium'], choices=sorted(TOWN_SIZES), help='town sizes to generate'
+    )
+    parser.add_argument('--out', default='benchmark.json', help='file to write the results to')
+    arguments = parser.parse_args()
+    for town_run in benchmark_worldgen(
+            seeds=arguments.seeds, town_sizes=arguments.sizes, output_filename=arguments.out
+    ):
+        if town_run['error']:
+            print 'Seed {seed} ({town_size}): failed\n{error}'.format(**town_run)
+            continue
+        print (
+            'Seed {seed} ({town_size}): pop. {population}, {n_events} events, '
+            '{bytes_per_mental_model} bytes per mental model'.format(**town_run)
+        )
+        for phase in town_run['phases']:
+            print '    {phase:<20} {wall_time:8.2f}s {peak_memory_kb:10d} KB'.format(**phase)
+    print 'Wrote results to {}'.format(arguments.out)
@@ -2,6 +2,7 @@ import heapq
 from occupation import *
 from person import PersonExNihilo
 from residence import *
+from rng import StablyHashed
 
 # Objects of a business class represents both the company itself and the building
 # at which it is headquartered. All business subclasses inherit generic attributes
@@ -9,7 +10,7 @@ from residence import *
 # appropriate.
 
 
-class Business(object):
+class Business(StablyHashed):
     """A business in a city (representing both the notion of a company and its physical building)."""
 
     def __init__(self, owner):
@@ -17,6 +18,7 @@ class Business(object):
 
         @param owner: The owner of this business.
         """
+        rng = owner.game.rng.demographics
         self.id = owner.game.current_place_id
         owner.game.current_place_id += 1
         config = owner.game.config
@@ -37,7 +39,7 @@ class Business(object):
             # and then construct this company's building on that lot
             acquired_lot = self._init_acquire_currently_occupied_lot()
             if self.city.businesses_of_type('ConstructionFirm'):
-                demolition_company = random.choice(self.city.businesses_of_type('ConstructionFirm'))
+                demolition_company = rng.choice(self.city.businesses_of_type('ConstructionFirm'))
             else:
                 demolition_company = None
             demolition_preceding_construction_of_this_business = Demolition(
@@ -114,6 +116,7 @@ class Business(object):
     def _init_get_named(self):
         """Get named by the owner of this building (the client for which it was constructed)."""
         config = self.city.game.config
+        rng = self.city.game.rng.demographics
         class_to_company_name_component = {
             ApartmentComplex: 'Apartments',
             Bank: 'Bank',
@@ -175,7 +178,7 @@ class Business(object):
             Restaurant, University, Park, Farm
         )
         if self.__class__ not in classes_that_get_special_names:
-            if random.random() < config.chance_company_gets_named_after_owner:
+            if rng.random() < config.chance_company_gets_named_after_owner:
                 prefix = self.owner.person.last_name
             else:
                 prefix = self.street_address_is_on.name
@@ -193,14 +196,14 @@ class Business(object):
             )
             name = "{0} {1}".format(class_to_company_name_component[LawFirm], suffix)
         elif self.__class__ is Bar:
-            name = Names.a_bar_name()
+            name = Names.a_bar_name(rng=rng)
             # if self.city.game.year > 1968:
             #     # Choose a name from the corpus of bar names
             #     name = Names.a_bar_name()
             # else:
             #     name = self.owner.person.last_name + "'s"
         elif self.__class__ is Restaurant:
-            name = Names.a_restaurant_name()
+            name = Names.a_restaurant_name(rng=rng)
             # if self.city.game.year > 1968:
             #     # Choose a name from the corpus of restaurant names
             #     name = Names.a_restaurant_name()
@@ -213,7 +216,7 @@ class Business(object):
                 business_here_previously = list(self.lot.former_buildings)[-1]
                 owner = business_here_previously.owner.person
                 if business_here_previously.__class__ is Farm:
-                    x = random.random()
+                    x = rng.random()
                     if x < 0.25:
                         name = '{} {} Park'.format(
                             owner.first_name, owner.last_name
@@ -240,7 +243,7 @@ class Business(object):
                     else:
                         name = '{} Park'.format(self.city.name)
                 elif business_here_previously.__class__ is Quarry:
-                    x = random.random()
+                    x = rng.random()
                     if x < 0.25:
                         name = '{} {} Park'.format(
                             owner.first_name, owner.last_name
@@ -267,7 +270,7 @@ class Business(object):
                     else:
                         name = '{} Park'.format(self.city.name)
                 elif business_here_previously.__class__ is CoalMine:
-                    x = random.random()
+                    x = rng.random()
                     if x < 0.25:
                         name = '{} {} Park'.format(
                             owner.first_name, owner.last_name
@@ -319,18 +322,19 @@ class Business(object):
 
     def _init_acquire_currently_occupied_lot(self):
         """If there are no vacant lots in town, acquire a lot and demolish the home currently on it."""
+        rng = self.city.game.rng.demographics
         lot_scores = self._rate_all_occupied_lots()
         if len(lot_scores) >= 3:
             # Pick from top three
             top_three_choices = heapq.nlargest(3, lot_scores, key=lot_scores.get)
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 choice = top_three_choices[0]
-            elif random.random() < 0.9:
+            elif rng.random() < 0.9:
                 choice = top_three_choices[1]
             else:
                 choice = top_three_choices[2]
         elif lot_scores:
-            choice = max(lot_scores)
+            choice = max(lot_scores, key=lot_scores.get)
         else:
             raise Exception("A company attempted to secure an *occupied* lot in town but somehow could not.")
         return choice
@@ -352,6 +356,7 @@ class Business(object):
         one of the top three. TODO: Probabilistically select from all lots using
         the scores to derive likelihoods of selecting each.
         """
+        rng = self.city.game.rng.demographics
         if self.__class__ in self.city.game.config.companies_that_get_established_on_tracts:
             vacant_lots_or_tracts = self.city.vacant_tracts
         else:
@@ -365,14 +370,14 @@ class Business(object):
         if len(lot_scores) >= 3:
             # Pick from top three
             top_three_choices = heapq.nlargest(3, lot_scores, key=lot_scores.get)
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 choice = top_three_choices[0]
-            elif random.random() < 0.9:
+            elif rng.random() < 0.9:
                 choice = top_three_choices[1]
             else:
                 choice = top_three_choices[2]
         elif lot_scores:
-            choice = max(lot_scores)
+            choice = max(lot_scores, key=lot_scores.get)
         else:
             raise Exception("A company attempted to secure a lot in town when in fact none are vacant.")
         return choice
@@ -475,7 +480,9 @@ class Business(object):
             job_candidates_in_town = self._assemble_job_candidates(occupation_of_need=occupation_of_need)
             if job_candidates_in_town:
                 candidate_scores = self._rate_all_job_candidates(candidates=job_candidates_in_town)
-                selected_candidate = self._select_candidate(candidate_scores=candidate_scores)
+                selected_candidate = self._select_candidate(
+                    candidate_scores=candidate_scores, rng=self.city.game.rng.demographics
+                )
             else:
                 selected_candidate = self._find_candidate_from_outside_the_city(occupation_of_need=occupation_of_need)
         return selected_candidate
@@ -540,19 +547,19 @@ class Business(object):
             selected_candidate.move_into_the_city(hiring_that_instigated_move=hiring)
 
     @staticmethod
-    def _select_candidate(candidate_scores):
+    def _select_candidate(candidate_scores, rng):
         """Select a person to serve in a certain occupational capacity."""
         if len(candidate_scores) >= 3:
             # Pick from top three
             top_three_choices = heapq.nlargest(3, candidate_scores, key=candidate_scores.get)
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 chosen_candidate = top_three_choices[0]
-            elif random.random() < 0.9:
+            elif rng.random() < 0.9:
                 chosen_candidate = top_three_choices[1]
             else:
                 chosen_candidate = top_three_choices[2]
         else:
-            chosen_candidate = max(candidate_scores)
+            chosen_candidate = max(candidate_scores, key=candidate_scores.get)
         return chosen_candidate
 
     def _find_candidate_from_outside_the_city(self, occupation_of_need):
@@ -678,7 +685,7 @@ class ApartmentComplex(Business):
     def _init_apartment_units(self):
         """Instantiate objects for the individual units in this apartment complex."""
         config = self.city.game.config
-        n_units_to_build = random.randint(
+        n_units_to_build = self.city.game.rng.demographics.randint(
             config.number_of_apartment_units_in_new_complex_min,
             config.number_of_apartment_units_in_new_complex_max
         )
@@ -1,26 +1,17 @@
-import random
 from business import *
 from residence import *
 from occupation import *
 import pyqtree
-from random import gauss,randrange
 from corpora import Names
 from config import Config
-import heapq
+from person import rank_most_salient, update_ranking_of_most_salient
+import array
+import operator
+from rng import StablyHashed
 
 
-class PriorityQueue:
-    def __init__(self):
-        self.elements = []
-    
-    def empty(self):
-        return len(self.elements) == 0
-    
-    def put(self, item, priority):
-        heapq.heappush(self.elements, (priority, item))
-    
-    def get(self):
-        return heapq.heappop(self.elements)[1]
+# The hop count recorded between two parcels that are not connected by any path
+UNREACHABLE = 0xFFFF
 
 
 def clamp(val, minimum, maximum):
@@ -38,6 +29,8 @@ class City(object):
         self.residents = set()
         self.departed = set()  # People who left the city (i.e., left the simulation)
         self.deceased = set()  # People who died in in the city
+        self.prominent_people = set()  # People who have ever had public prominence (see Person.public_prominence)
+        self.most_prominent_people = None  # Top of a ranking of prominent people; built when first needed
         self.companies = set()
         self.former_companies = set()
         self.lots = set()
@@ -51,17 +44,16 @@ class City(object):
             lot.set_neighboring_lots_for_citygen()
             lot.init_generate_address()
         # Survey all city lots to instantiate conventional city blocks
+        blocks_by_street_and_number = {}
         for lot in self.lots | self.tracts:
             number, street = lot.parcel_address_is_on.number, lot.parcel_address_is_on.street
             try:
-                city_block = next(b for b in self.blocks if b.number == number and b.street is street)
-                city_block.lots.append(lot)
-                lot.block = city_block
-            except StopIteration:
-                city_block = Block(number=number, street=street)
+                city_block = blocks_by_street_and_number[(street, number)]
+            except KeyError:
+                city_block = blocks_by_street_and_number[(street, number)] = Block(number=number, street=street)
                 self.blocks.add(city_block)
-                city_block.lots.append(lot)
-                lot.block = city_block
+            city_block.lots.append(lot)
+            lot.block = city_block
         for block in self.blocks:
             block.lots.sort(key=lambda lot: lot.house_number)
         # Fill in any missing blocks, which I think gets caused by tracts being so
@@ -73,12 +65,20 @@ class City(object):
             largest_block_number = max(street.blocks, key=lambda block: block.number).number
             while current_block_number != largest_block_number:
                 current_block_number += 100
-                if not any(b for b in street.blocks if b.number == current_block_number):
+                if (street, current_block_number) not in blocks_by_street_and_number:
                     self.blocks.add(Block(number=current_block_number, street=street))
             # Sort one last time to facilitate easy navigation during gameplay
             street.blocks.sort(key=lambda block: block.number)
-        self.paths = {}
+        # Compute the distances between all pairs of parcels, which are what distances between
+        # lots are derived from
+        self.parcels_by_index = []  # Parcels in the order of their rows in self.parcel_distances
+        self.parcel_distances = None
         self.generatePaths()
+        # From these, compute the distances between all pairs of lots (including tracts), which
+        # are what so much decision making (where to live, where to build, where to run errands) rests on
+        self.lots_by_index = []  # Lots and tracts in the order of their rows in self.lot_distances
+        self.lot_distances = None
+        self._determine_lot_distances()
         # Determine coordinates for each lot in the city, which are crucial when
         # displaying the city
         self._determine_lot_coordinates()
@@ -183,31 +183,86 @@ class City(object):
 
     def dist_from_downtown(self,lot):
         
-        return self.distance_between(lot,self.downtown)
+        return self.lot_distances[self.downtown.index][lot.index]
 
     def generatePaths(self):
-        for start in self.parcels:
-            for goal in self.parcels:
-                if (start == goal):
-                     self.paths[(start,goal)] = 0
-                else :
-                    if ((start,goal) not in self.paths):
-                        came_from, cost_so_far = City.a_star_search(start,goal)
-                        current  = goal
-                        count = 0
-                        while (current != start):
-                            current = came_from[current]
-                            count += 1
-                        self.paths[(start,goal)] =count
-                        self.paths[(goal,start)] =count
-                        
+        """Compute the number of hops along the shortest path between every pair of parcels in this city.
+
+        Because the parcel graph is unweighted, a single breadth-first search from each parcel yields
+        its distances to all the others. The resulting hop counts are stored as a flat matrix in an
+        array of unsigned shorts, where the distance from the parcel with index i to the one with
+        index j is found at i*P + j, P being the number of parcels.
+        """
+        self.parcels_by_index = sorted(self.parcels, key=lambda p: p.id)
+        for index, parcel in enumerate(self.parcels_by_index):
+            parcel.index = index
+        n_parcels = len(self.parcels_by_index)
+        distances = array.array('H', [UNREACHABLE]) * (n_parcels * n_parcels)
+        for start in self.parcels_by_index:
+            row_offset = start.index * n_parcels
+            distances[row_offset + start.index] = 0
+            frontier = [start]
+            hops = 0
+            while frontier:
+                hops += 1
+                next_frontier = []
+                for parcel in frontier:
+                    for neighbor in parcel.neighbors:
+                        if distances[row_offset + neighbor.index] == UNREACHABLE:
+                            distances[row_offset + neighbor.index] = hops
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+        self.parcel_distances = distances
+
+    def distance_between_parcels(self, parcel1, parcel2):
+        """Return the number of hops along the shortest path between two parcels."""
+        return self.parcel_distances[parcel1.index * len(self.parcels_by_index) + parcel2.index]
+
+    def _determine_lot_distances(self):
+        """Compute the distance between every pair of lots (and tracts) in this city.
+
+        The distance between two lots is the shortest distance between any parcel of the one and any
+        parcel of the other. Each lot gets a row of these distances, stored as an array of unsigned
+        shorts that is indexed by the other lots' indices.
+        """
+        self.lots_by_index = sorted(self.lots | self.tracts, key=lambda l: l.id)
+        for index, lot in enumerate(self.lots_by_index):
+            lot.index = index
+        n_parcels = len(self.parcels_by_index)
+        parcel_rows = [
+            self.parcel_distances[i*n_parcels:(i+1)*n_parcels] for i in xrange(n_parcels)
+        ]
+        # Most lots are on one or two parcels, so we first take every lot's distance to be its
+        # first parcel's distance, and then correct this for the lots that are on further parcels
+        first_parcel_of_each_lot = operator.itemgetter(*[lot.parcels[0].index for lot in self.lots_by_index])
+        lots_on_multiple_parcels = [
+            (lot.index, [parcel.index for parcel in lot.parcels]) for lot in self.lots_by_index if len(lot.parcels) > 1
+        ]
+        self.lot_distances = []
+        for lot in self.lots_by_index:
+            # Determine this lot's distance to each parcel, i.e., the distance from whichever
+            # of its own parcels is closest to that parcel
+            if len(lot.parcels) == 1:
+                distances_to_parcels = parcel_rows[lot.parcels[0].index]
+            else:
+                distances_to_parcels = map(min, *[parcel_rows[parcel.index] for parcel in lot.parcels])
+            row = array.array('H', first_parcel_of_each_lot(distances_to_parcels))
+            for other_lot_index, parcel_indices in lots_on_multiple_parcels:
+                row[other_lot_index] = min([distances_to_parcels[i] for i in parcel_indices])
+            self.lot_distances.append(row)
+
     def distance_between(self, lot1, lot2):
-        min_dist = float("inf")
-        for parcel in lot1.parcels:
-            for other_parcel in lot2.parcels:
-                if self.paths[(parcel, other_parcel)] < min_dist:
-                    min_dist = self.paths[(parcel, other_parcel)]
-        return min_dist
+        """Return the distance between two lots (or tracts)."""
+        return self.lot_distances[lot1.index][lot2.index]
+
+    def distances_from(self, lot):
+        """Return the distances from a lot (or tract) to every lot in the city.
+
+        This is for scoring many lots against the same one; the distance to a lot is found at
+        its index in the returned array. Because distances are symmetric, these are also the
+        distances to the given lot from every lot in the city.
+        """
+        return self.lot_distances[lot.index]
 
     def nearest_business_of_type(self, lot, business_type):
         """Return the Manhattan distance between this lot and the nearest company of the given type.
@@ -216,7 +271,8 @@ class City(object):
         """
         businesses_of_this_type = self.businesses_of_type(business_type)
         if businesses_of_this_type:
-            return min(businesses_of_this_type, key=lambda b: self.distance_between(lot, b.lot))
+            distances = self.distances_from(lot)
+            return min(businesses_of_this_type, key=lambda b: distances[b.lot.index])
         else:
             return None
         
@@ -228,8 +284,9 @@ class City(object):
                           are the ones making the call to this method, as they try to decide where
                           to put their lot.
         """
+        distances_from_lot = self.distances_from(lot)
         distances = [
-            self.distance_between(lot, company.lot) for company in self.companies if isinstance(company, business_type)
+            distances_from_lot[company.lot.index] for company in self.companies if isinstance(company, business_type)
             and company is not exclusion
         ]
         if distances:
@@ -274,16 +331,17 @@ class City(object):
         return tertiary_density
         
     def generate_lots(self, config):
+        rng = self.game.rng.citygen
         loci = config.quadtree_loci
         samples = config.quadtree_samples
         size = config.quadtree_size
         lociLocations = []
         for ii in range(loci):
-            lociLocations.append([gauss(size/2.0,size/6.0), gauss(size/2.0,size/6.0)])
+            lociLocations.append([rng.gauss(size/2.0,size/6.0), rng.gauss(size/2.0,size/6.0)])
         tree = pyqtree.Index(bbox=[0,0,size,size])
         for ii in range(samples):
-            center = lociLocations[randrange(len(lociLocations))]
-            point = [clamp(gauss(center[0],size/6.0),0,size-1),clamp(gauss(center[1],size/6.0),0,size-1)]
+            center = lociLocations[rng.randrange(len(lociLocations))]
+            point = [clamp(rng.gauss(center[0],size/6.0),0,size-1),clamp(rng.gauss(center[1],size/6.0),0,size-1)]
             point.append(point[0]+1)
             point.append(point[1]+1)
             tree.insert(point,point)
@@ -405,13 +463,13 @@ class City(object):
             for ii in range(0,size_of_parcel+1):
                 
                 insertOnce(Parcels,(ew,ns+ii,'NS'),Parcel( nsStreets[(ew,ns)], (ii+ns)*100,(ew,ns+ii)))
-                insertOnce(Numberings,(ew,ns+ii,'E'),Parcel.determine_house_numbering( (ii+ns)*100,'E', config))
+                insertOnce(Numberings,(ew,ns+ii,'E'),Parcel.determine_house_numbering( (ii+ns)*100,'E', config, rng))
                 insertOnce(Parcels,(ew+ii,ns,'EW'),Parcel( ewStreets[(ew,ns)], (ii+ew)*100,(ew+ii,ns)))
-                insertOnce(Numberings,(ew+ii,ns,'N'),Parcel.determine_house_numbering( (ii+ew)*100,'N', config))
+                insertOnce(Numberings,(ew+ii,ns,'N'),Parcel.determine_house_numbering( (ii+ew)*100,'N', config, rng))
                 insertOnce(Parcels,(ew+size_of_parcel,ns+ii,'NS'),Parcel( nsStreets[(ew+size_of_parcel,ns)], (ii+ns)*100,(ew+size_of_parcel,ns+ii)))
-                insertOnce(Numberings,(ew+size_of_parcel,ns+ii,'W'),Parcel.determine_house_numbering( (ii+ns)*100,'W', config))
+                insertOnce(Numberings,(ew+size_of_parcel,ns+ii,'W'),Parcel.determine_house_numbering( (ii+ns)*100,'W', config, rng))
                 insertOnce(Parcels,(ew+ii,ns+size_of_parcel,'EW'),Parcel( ewStreets[(ew,ns+size_of_parcel)], (ii+ew)*100,(ew+ii,ns+size_of_parcel)))
-                insertOnce(Numberings,(ew+ii,ns+size_of_parcel,'S'),Parcel.determine_house_numbering( (ii+ew)*100,'S', config))
+                insertOnce(Numberings,(ew+ii,ns+size_of_parcel,'S'),Parcel.determine_house_numbering( (ii+ew)*100,'S', config, rng))
                 if (tract != None):
                     tract.add_parcel(Parcels[(ew,ns+ii,'NS')],Numberings[(ew,ns+ii,'E')][n_buildings_per_parcel],'E',0)
                     tract.add_parcel( Parcels[(ew+ii,ns,'EW')],Numberings[(ew+ii,ns,'N')][n_buildings_per_parcel] ,'N',0)
@@ -531,6 +589,36 @@ class City(object):
             # Attribute these coordinates to the lot
             lot.coordinates = (x_coordinate, y_coordinate)
 
+    def get_most_prominent_people(self):
+        """Return the ranking of the most publicly prominent people in this city, building it if need be.
+
+        This works like Person.get_most_salient_people(), but it ranks public prominence (which is
+        a part of everyone's salience for a person) rather than any one person's personal salience.
+        """
+        if self.most_prominent_people is None:
+            self.most_prominent_people = rank_most_salient(
+                entities_and_saliences=((person, person.public_prominence) for person in self.prominent_people),
+                size=self.game.config.number_of_most_salient_people_to_rank
+            )
+        return self.most_prominent_people
+
+    def prominence_ranking_floor(self):
+        """Return the highest public prominence that anyone missing from the ranking of prominent people may have."""
+        ranking = self.get_most_prominent_people()
+        if len(ranking) < len(self.prominent_people):
+            return ranking[-1][0]
+        return 0.0
+
+    def note_change_in_public_prominence(self, person):
+        """Update the ranking of prominent people to reflect a change to the given person's public prominence."""
+        self.prominent_people.add(person)
+        if self.most_prominent_people is not None:
+            self.most_prominent_people = update_ranking_of_most_salient(
+                ranking=self.most_prominent_people, entity=person, salience=person.public_prominence,
+                number_of_entities=len(self.prominent_people),
+                size=self.game.config.number_of_most_salient_people_to_rank
+            )
+
     @property
     def pop(self):
         """Return the number of residents living in the city."""
@@ -598,39 +686,8 @@ class City(object):
         ]
         return businesses_of_this_type
 
-    @staticmethod
-    def heuristic(a, b):
-        (x1, y1) = a.coords
-        (x2, y2) = b.coords
-        return abs(x1 - x2) + abs(y1 - y2)
-
-    @staticmethod
-    def a_star_search(start, goal):
-        frontier = PriorityQueue()
-        frontier.put(start, 0)
-        came_from = {}
-        cost_so_far = {}
-        came_from[start] = None
-        cost_so_far[start] = 0
-        
-        while not frontier.empty():
-            current = frontier.get()
-            
-            if current == goal:
-                break
-            
-            for next in current.neighbors:
-                new_cost = cost_so_far[current] + 1
-                if next not in cost_so_far or new_cost < cost_so_far[next]:
-                    cost_so_far[next] = new_cost
-                    priority = new_cost + City.heuristic(goal, next)
-                    frontier.put(next, priority)
-                    came_from[next] = current
-        
-        return came_from, cost_so_far
-
 
-class Street(object):
+class Street(StablyHashed):
     """A street in a city."""
 
     counter = 0
@@ -650,28 +707,29 @@ class Street(object):
     def generate_name(self, number, direction):
         """Generate a street name."""
         config = self.city.game.config
+        rng = self.city.game.rng.citygen
         number_to_ordinal = {
             1: '1st', 2: '2nd', 3: '3rd', 4: '4th', 5: '5th',
             6: '6th', 7: '7th', 8: '8th', 9: '9th'
         }
         if direction == 'E' or direction == 'W':
             street_type = 'Street'
-            if random.random() < config.chance_street_gets_numbered_name:
+            if rng.random() < config.chance_street_gets_numbered_name:
                 name = number_to_ordinal[number]
             else:
-                if random.random() < 0.5:
-                    name = Names.any_surname()
+                if rng.random() < 0.5:
+                    name = Names.any_surname(rng=rng)
                 else:
-                    name = Names.a_place_name()
+                    name = Names.a_place_name(rng=rng)
         else:
             street_type = 'Avenue'
-            if random.random() < config.chance_avenue_gets_numbered_name:
+            if rng.random() < config.chance_avenue_gets_numbered_name:
                 name = number_to_ordinal[number]
             else:
-                if random.random() < 0.5:
-                    name = Names.any_surname()
+                if rng.random() < 0.5:
+                    name = Names.any_surname(rng=rng)
                 else:
-                    name = Names.a_place_name()
+                    name = Names.a_place_name(rng=rng)
         # name = "{0} {1} {2}".format(name, street_type, direction)
         name = "{0} {1}".format(name, street_type)
         return name
@@ -681,7 +739,7 @@ class Street(object):
         return self.name
 
 
-class Parcel(object):
+class Parcel(StablyHashed):
     """A collection of between zero and four contiguous lots in a city."""
 
     counter = 0
@@ -695,9 +753,10 @@ class Parcel(object):
         self.lots = []
         self.neighbors = []
         self.coords = coords
+        self.index = None  # Position of this parcel in the distance matrix; set by City.generatePaths()
 
     @staticmethod
-    def determine_house_numbering(block_number, side_of_street, config):
+    def determine_house_numbering(block_number, side_of_street, config, rng):
         """Devise an appropriate house numbering scheme given the number of buildings on the block."""
         n_buildings = config.n_buildings_per_parcel+1
         house_numbers = []
@@ -705,7 +764,7 @@ class Parcel(object):
         even_or_odd = 0 if side_of_street == "E" or side_of_street == "N" else 1
         for i in xrange(n_buildings):
             base_house_number = (i * house_number_increment) - 1
-            house_number = base_house_number + int(random.random() * house_number_increment)
+            house_number = base_house_number + int(rng.random() * house_number_increment)
             if house_number % 2 == (1-even_or_odd):
                 house_number += 1
             if house_number < 1+even_or_odd:
@@ -720,7 +779,7 @@ class Parcel(object):
         self.neighbors.append(other)
 
 
-class Block(object):
+class Block(StablyHashed):
     """A city block in the conventional sense, e.g., the 400 block of Hennepin Ave."""
 
     def __init__(self, number, street):
@@ -752,7 +811,7 @@ class Block(object):
         return [lot.building for lot in self.lots if lot.building]
 
 
-class Lot(object):
+class Lot(StablyHashed):
     """A lot on a city block (and multiple parcels) in a city, upon which buildings and houses get erected."""
 
     counter = 0
@@ -774,6 +833,7 @@ class Lot(object):
         # will be either 0 or 1, indicating whether this is the leftmost/topmost lot on its side
         # of the street of its city block or else rightmost/bottommost
         self.positions_in_city_blocks = []
+        self.index = None  # Position of this lot in the city's distance matrix; set by City._determine_lot_distances()
         # This one gets set by City.set_neighboring_lots_for_citygen() after all lots have
         # been generated
         self.neighboring_lots = set()
@@ -830,7 +890,7 @@ class Lot(object):
 
     def init_generate_address(self):
         """Generate an address, given the lot building is on."""
-        self.index_of_street_address_will_be_on = random.randint(0, len(self.streets)-1)
+        self.index_of_street_address_will_be_on = self.city.game.rng.citygen.randint(0, len(self.streets)-1)
         house_number = self.house_numbers[self.index_of_street_address_will_be_on]
         self.house_number = int(house_number)
         street = self.streets[self.index_of_street_address_will_be_on]
@@ -40,12 +40,18 @@ class Config(object):
         self.boost_to_the_founders_conception_chance = 0.2
         # City establishment and early development
         self.number_of_apartment_complexes_founder_builds_downtown = 3
+        # Event store (older events get spilled to disk)
+        self.n_recent_events_held_in_memory = 10000
+        self.n_archived_events_per_index_segment = 100000  # Their secondary indexes get sealed to disk together
 
                 ############
                 ##  SIM   ##
                 ############
 
         self.chance_of_a_timestep_being_simulated = 0.005  # 3.6 timesteps a year on average
+        # Which engine drives lo-fi simulation: 'timestep' walks through every timestep in turn, while
+        # 'scheduled' jumps from one scheduled happening (a birth, a business closing, etc.) to the next
+        self.lo_fi_simulation_engine = 'timestep'
         # Daily routines
         self.chance_someone_locks_their_door = lambda neuroticism: neuroticism  # If random.random() > neuro: True
         self.chance_someone_calls_in_sick_to_work = 0.03
@@ -1159,7 +1165,7 @@ class Config(object):
 
         # People ex nihilo
         self.function_to_determine_person_ex_nihilo_age_given_job_level = (
-            lambda job_level: 18 + random.randint(2*job_level, 7*job_level)
+            lambda job_level, rng: 18 + rng.randint(2*job_level, 7*job_level)
         )
         # self.function_to_determine_chance_person_ex_nihilo_starts_with_family = (
         #     lambda age: (age / 100.0) * 1.4
@@ -1715,6 +1721,11 @@ class Config(object):
             'job title', 'status', 'approximate age', 'suffix', 'marital status', 'business name'
         }
         self.decay_rate_of_belief_strength_per_day = 0.95  # Lose 5% of strength every day
+        # Which engine drives the deterioration of mental models during hi-fi simulation: 'timestep'
+        # throws a coin for every belief facet on every timestep, while 'scheduled' samples when each
+        # facet will next deteriorate and only visits the ones that are due (see scheduler.py); the
+        # two are alike in distribution, but not in the random draws they make
+        self.mental_model_deterioration_engine = 'scheduled'
         three_fourths_strength_of_firsthand_observation = (
             self.base_strength_of_evidence_types['observation'] /
             self.base_strength_of_evidence_types["statement"] *
@@ -1746,6 +1757,9 @@ class Config(object):
         self.chance_someone_lies_cap = 0.2
         self.amount_of_people_people_talk_about_floor = 2
         # self.amount_of_people_people_talk_about_cap = 7  # CAP IS NOW NATURALLY AT 7
+        # How many of their most salient people each person keeps ranked, so that conversation partners
+        # can decide who to talk about without scoring everyone that either of them knows about
+        self.number_of_most_salient_people_to_rank = 10
         self.chance_someones_feature_comes_up_in_conversation_about_them = (
             ("status",                      1.00),
             ("first name",                  0.80),
@@ -2637,6 +2651,15 @@ class Config(object):
         # Juke Joint parameters that have to live here
         self.summative_thought_receptor_voltage_threshold = 17
 
+    def __reduce__(self):
+        """Return instructions for pickling this object.
+
+        Many config parameters are lambda functions, which cannot be pickled, so
+        rather than saving its attributes, we have a pickled Config object be
+        reconstructed anew (from the values specified in this file) when it's unpickled.
+        """
+        return Config, ()
+
     @staticmethod
     def fit_probability_distribution(relative_frequencies_dictionary):
         """Return a probability distribution fitted to the given relative-frequencies dictionary."""
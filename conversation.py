@@ -1,4 +1,3 @@
-import random
 import time
 from event import Event
 from evidence import Statement, Declaration, Lie, Eavesdropping
@@ -182,11 +181,12 @@ class Conversation(Event):
 
     def allocate_turn(self):
         """Allocate the next turn."""
+        rng = self.game.rng.nlg
         targeted_obligation = None
         targeted_goal = None
         # If both conversational parties have obligations, randomly allocate the turn
         if self.obligations[self.initiator] and self.obligations[self.recipient]:
-            next_speaker = random.choice(self.participants)
+            next_speaker = rng.choice(self.participants)
             targeted_obligation = list(self.obligations[next_speaker])[0]
             if self.debug:
                 print (
@@ -208,7 +208,7 @@ class Conversation(Event):
                 print '[Allocating turn according to {}]'.format(targeted_obligation)
         # If both conversational parties have goals whose plans are not on hold, allocate randomly
         elif self.goals_not_on_hold[self.initiator] and self.goals_not_on_hold[self.recipient]:
-            next_speaker = random.choice(self.participants)
+            next_speaker = rng.choice(self.participants)
             targeted_goal = list(self.goals_not_on_hold[next_speaker])[0]
         # If the initiator has a goal whose plan is not on hold, allocate to them
         elif self.goals_not_on_hold[self.initiator]:
@@ -226,7 +226,7 @@ class Conversation(Event):
         # turn with consideration given to the parties' relative extroversion values
         # TODO IMPROVE THE REASONING ABOUT ALLOCATION HERE
         else:
-            if random.random() < 0.75:
+            if rng.random() < 0.75:
                 next_speaker = max(self.participants, key=lambda p: p.personality.extroversion)
             else:
                 next_speaker = min(self.participants, key=lambda p: p.personality.extroversion)
@@ -418,6 +418,7 @@ class Turn(object):
 
     def _decide_what_to_say(self):
         """Have the speaker select a line of dialogue to deploy on this turn."""
+        rng = self.conversation.game.rng.nlg
         if self.targeted_obligation:
             selected_line = self.targeted_obligation.target()
         elif self.targeted_goal:
@@ -434,7 +435,7 @@ class Turn(object):
             selected_line = self.conversation.target_topic()
         else:
             # Either engage in small talk or adopt a goal to end the conversation
-            if random.random() < max(self.speaker.personality.extroversion, 0.05):  # TODO PUT MAGIC NUMBER IN CONFIG.PY
+            if rng.random() < max(self.speaker.personality.extroversion, 0.05):  # TODO PUT MAGIC NUMBER IN CONFIG.PY
                 selected_line = self.conversation.target_move(move_name='make small talk')
             else:
                 new_goal_to_end_conversation = Goal(
@@ -464,10 +465,11 @@ class Turn(object):
 
     def _potentially_be_eavesdropped(self):
         """Potentially have the line of dialogue asserting this proposition be eavesdropped by a nearby character."""
+        rng = self.conversation.game.rng.nlg
         # TODO maybe affect this by how salient subject is to eavesdropper
         people_in_earshot = self.conversation.speaker.location.people_here_now - {self.speaker, self.interlocutor}
-        eavesdropper = None if not people_in_earshot else random.choice(list(people_in_earshot))
-        if eavesdropper and random.random() < self.speaker.game.config.chance_someone_eavesdrops_statement_or_lie:
+        eavesdropper = None if not people_in_earshot else rng.choice(list(people_in_earshot))
+        if eavesdropper and rng.random() < self.speaker.game.config.chance_someone_eavesdrops_statement_or_lie:
             if self.conversation.debug:
                 print '-- Eavesdropped by {}'.format(eavesdropper.name)
             return eavesdropper
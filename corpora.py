@@ -1,12 +1,15 @@
 import os
 import pickle
-import random
 import math
 
 cwd = os.path.dirname(os.path.realpath(__file__))
 
 class Names(object):
-    """A class that accesses names corpora to return random names."""
+    """A class that accesses names corpora to return random names.
+
+    The methods of this class take an 'rng' argument, which should be the stream
+    of the game's RNG that corresponds to the subsystem requesting a name.
+    """
     names_by_decade = pickle.load(open(
         cwd+'/corpora/american_names_by_decade_with_'
         'fitted_probability_distributions.dat', 'rb'
@@ -62,15 +65,15 @@ class Names(object):
     )
 
     @classmethod
-    def a_masculine_name(cls, year):
+    def a_masculine_name(cls, year, rng):
         """Return a random masculine first name befitting the in-game year."""
         if year < 1880:
             year = 1880
         decade = int(math.floor(year/10)*10)  # Determine the current decade
-        x = random.random()
+        x = rng.random()
         if x > 0.99:
             # Choose any masculine name (allows rare ones to be used occasionally)
-            name = random.choice(cls.miscellaneous_masculine_forenames)
+            name = rng.choice(cls.miscellaneous_masculine_forenames)
         else:
             # Choose using the actual distribution of American names this decade
             probability_distribution_for_this_decade = cls.names_by_decade[decade]['M']
@@ -82,15 +85,15 @@ class Names(object):
         return name
 
     @classmethod
-    def a_feminine_name(cls, year):
+    def a_feminine_name(cls, year, rng):
         """Return a random feminine first name befitting the in-game year."""
         if year < 1880:
             year = 1880
         decade = int(math.floor(year/10)*10)  # Determine the current decade
-        x = random.random()
+        x = rng.random()
         if x > 0.99:
             # Choose any masculine name (allows rare ones to be used occasionally)
-            name = random.choice(cls.miscellaneous_masculine_forenames)
+            name = rng.choice(cls.miscellaneous_masculine_forenames)
         else:
             # Choose using the actual distribution of American names this decade
             probability_distribution_for_this_decade = cls.names_by_decade[decade]['F']
@@ -102,47 +105,47 @@ class Names(object):
         return name
 
     @classmethod
-    def an_english_surname(cls):
+    def an_english_surname(cls, rng):
         """Return a random English surname."""
-        return random.choice(cls.english_surnames)
+        return rng.choice(cls.english_surnames)
 
     @classmethod
-    def a_french_surname(cls):
+    def a_french_surname(cls, rng):
         """Return a random French surname."""
-        return random.choice(cls.french_surnames)
+        return rng.choice(cls.french_surnames)
 
     @classmethod
-    def a_german_surname(cls):
+    def a_german_surname(cls, rng):
         """Return a random German surname."""
-        return random.choice(cls.german_surnames)
+        return rng.choice(cls.german_surnames)
 
     @classmethod
-    def an_irish_surname(cls):
+    def an_irish_surname(cls, rng):
         """Return a random Irish surname."""
-        return random.choice(cls.irish_surnames)
+        return rng.choice(cls.irish_surnames)
 
     @classmethod
-    def an_italian_surname(cls):
+    def an_italian_surname(cls, rng):
         """Return a random Italian surname."""
-        return random.choice(cls.italian_surnames)
+        return rng.choice(cls.italian_surnames)
 
     @classmethod
-    def a_scandinavian_surname(cls):
+    def a_scandinavian_surname(cls, rng):
         """Return a random Scandinavian surname."""
-        return random.choice(cls.scandinavian_surnames)
+        return rng.choice(cls.scandinavian_surnames)
 
     @classmethod
-    def any_surname(cls):
+    def any_surname(cls, rng):
         """Return a random surname of any ethnicity."""
-        return random.choice(cls.all_surnames)
+        return rng.choice(cls.all_surnames)
 
     @classmethod
-    def a_masculine_name_starting_with(cls, letter, year):
+    def a_masculine_name_starting_with(cls, letter, year, rng):
         """Return a random masculine name starting with the given letter and befitting the given year."""
         if year < 1880:
             year = 1880
         decade = int(math.floor(year/10)*10)  # Determine the current decade
-        x = random.random()
+        x = rng.random()
         # Choose using the actual distribution of American names this decade
         probability_distribution_for_this_decade = cls.names_by_decade[decade]['M']
         try:
@@ -153,16 +156,16 @@ class Names(object):
                 name[0].lower() == letter[0]
             )
         except StopIteration:
-            if random.random() < 0.5:
+            if rng.random() < 0.5:
                 # Choose any miscellaneous name starting with the same letter
                 names_that_start_with_that_letter = [
                     name for name in cls.miscellaneous_masculine_forenames if
                     name[0].lower() == letter.lower()
                 ]
-                name = random.choice(names_that_start_with_that_letter)
+                name = rng.choice(names_that_start_with_that_letter)
             else:
                 # Choose any name befitting the era of the person's birth
-                x = random.random()
+                x = rng.random()
                 name = next(
                     name for name in probability_distribution_for_this_decade if
                     probability_distribution_for_this_decade[name][0] <= x <=
@@ -171,12 +174,12 @@ class Names(object):
         return name
 
     @classmethod
-    def a_feminine_name_starting_with(cls, letter, year):
+    def a_feminine_name_starting_with(cls, letter, year, rng):
         """Return a random feminine name starting with the given letter and befitting the given year."""
         if year < 1880:
             year = 1880
         decade = int(math.floor(year/10)*10)  # Determine the current decade
-        x = random.random()
+        x = rng.random()
         # Choose using the actual distribution of American names this decade
         probability_distribution_for_this_decade = cls.names_by_decade[decade]['F']
         try:
@@ -187,16 +190,16 @@ class Names(object):
                 name[0].lower() == letter[0]
             )
         except StopIteration:
-            if random.random() < 0.5:
+            if rng.random() < 0.5:
                 # Choose any miscellaneous name starting with the same letter
                 names_that_start_with_that_letter = [
                     name for name in cls.miscellaneous_feminine_forenames if
                     name[0].lower() == letter.lower()
                 ]
-                name = random.choice(names_that_start_with_that_letter)
+                name = rng.choice(names_that_start_with_that_letter)
             else:
                 # Choose any name befitting the era of the person's birth
-                x = random.random()
+                x = rng.random()
                 name = next(
                     name for name in probability_distribution_for_this_decade if
                     probability_distribution_for_this_decade[name][0] <= x <=
@@ -205,25 +208,25 @@ class Names(object):
         return name
 
     @classmethod
-    def a_surname_sounding_like(cls, source_name):
+    def a_surname_sounding_like(cls, source_name, rng):
         """Return a random surname that sounds like the source name."""
         ethnicities = (
             cls.english_surnames, cls.french_surnames, cls.german_surnames,
-            cls.irish_surnames, cls.scandinavian_surnames
+            cls.irish_surnames, cls.italian_surnames, cls.scandinavian_surnames
         )
         if '-' in source_name:
             # ButcherShop one component of the hyphenated name
             names_derived_from = source_name.split('-')
-            component_to_butcher = random.choice(names_derived_from)
+            component_to_butcher = rng.choice(names_derived_from)
             if component_to_butcher == names_derived_from[0]:
                 return '{}-{}'.format(
-                    cls.a_surname_sounding_like(source_name=component_to_butcher),
+                    cls.a_surname_sounding_like(source_name=component_to_butcher, rng=rng),
                     names_derived_from[1]
                 )
             else:
                 return '{}-{}'.format(
                     names_derived_from[0],
-                    cls.a_surname_sounding_like(source_name=component_to_butcher)
+                    cls.a_surname_sounding_like(source_name=component_to_butcher, rng=rng)
                 )
         names_of_the_same_ethnicity = next(
             ethnicity for ethnicity in ethnicities if str(source_name) in ethnicity
@@ -235,28 +238,28 @@ class Names(object):
             )
         except StopIteration:
             try:
-                name = random.choice(names_of_the_same_ethnicity)
+                name = rng.choice(names_of_the_same_ethnicity)
             except StopIteration:
                 all_surnames_that_start_with_that_letter = [
                     name for name in cls.all_surnames if name[0].lower() == source_name[0].lower()
                 ]
-                name = random.choice(all_surnames_that_start_with_that_letter)
+                name = rng.choice(all_surnames_that_start_with_that_letter)
         return name
 
     @classmethod
-    def a_place_name(cls):
+    def a_place_name(cls, rng):
         """Return a random place name."""
-        return random.choice(cls.place_names)
+        return rng.choice(cls.place_names)
 
     @classmethod
-    def a_restaurant_name(cls):
+    def a_restaurant_name(cls, rng):
         """Return a random restaurant name."""
-        return random.choice(cls.restaurant_names)
+        return rng.choice(cls.restaurant_names)
 
     @classmethod
-    def a_bar_name(cls):
+    def a_bar_name(cls, rng):
         """Return a random bar name."""
-        return random.choice(cls.bar_names)
+        return rng.choice(cls.bar_names)
 
 
 class GravestoneDetails(object):
@@ -271,11 +274,11 @@ class GravestoneDetails(object):
     )
 
     @classmethod
-    def a_header(cls):
+    def a_header(cls, rng):
         """Return a random gravestone header."""
-        return random.choice(cls.headers)
+        return rng.choice(cls.headers)
 
     @classmethod
-    def an_epitaph(cls):
+    def an_epitaph(cls, rng):
         """Return a random gravestone epitaph."""
-        return random.choice(cls.epitaphs)
\ No newline at end of file
+        return rng.choice(cls.epitaphs)
\ No newline at end of file
@@ -1,9 +1,9 @@
-import random
 from name import Name
 from person import Person
 from corpora import Names
 from residence import House
 from artifact import WeddingRing
+from rng import StablyHashed
 
 
 # TODO HOW TO GIVE RETCONNED EVENTS PROPERLY ORDERED EVENT NUMBERS?
@@ -11,7 +11,7 @@ from artifact import WeddingRing
 # TODO ACTUALLY HAVE ADOPTIONS AND MAKE SURE THEY PROPERLY UPDATE SALIENCE
 
 
-class Event(object):
+class Event(StablyHashed):
     """A superclass that all event subclasses inherit from."""
 
     def __init__(self, game):
@@ -28,6 +28,7 @@ class Event(object):
         # Also request and attribute an event number, so that we can later
         # determine the precise ordering of events that happen on the same timestep
         self.event_number = game.assign_event_number(new_event=self)
+        game.profiler.note_creation(object_category='Event')
 
 
 class Adoption(Event):
@@ -46,6 +47,8 @@ class Adoption(Event):
         self.adoptive_parents = adoptive_parents
         for adoptive_parent in adoptive_parents:
             adoptive_parent.adoptions.append(self)
+        # This changes the family tree, so everyone's kinship relations must now be computed anew
+        subject.game.genealogy_version += 1
 
     def __str__(self):
         """Return string representation."""
@@ -72,10 +75,7 @@ class Birth(Event):
             self.mother.marriage.children_produced.add(self.subject)
         self.doctor = doctor
         # Update the game's listing of all people's birthdays
-        try:
-            mother.game.birthdays[(self.month, self.day)].add(self.subject)
-        except KeyError:
-            mother.game.birthdays[(self.month, self.day)] = {self.subject}
+        mother.game.register_birthday(person=self.subject)
         self._name_baby()
         self._update_mother_attributes()
         if self.mother.city:
@@ -117,7 +117,7 @@ class Birth(Event):
         config = self.subject.game.config
         baby = self.subject
         if (
-            random.random() < config.chance_son_inherits_fathers_exact_name and
+            self.mother.game.rng.demographics.random() < config.chance_son_inherits_fathers_exact_name and
             baby.male and
             not(any(bro for bro in baby.brothers if bro.first_name == self.father.first_name))
         ):
@@ -190,15 +190,16 @@ class Birth(Event):
     def _decide_first_name(self, potential_namegivers):
         """Return what will be the baby's first name."""
         config = self.subject.game.config
-        if potential_namegivers and random.random() < config.chance_child_inherits_first_name:
-            first_name_namegiver = random.choice(potential_namegivers)
+        rng = self.mother.game.rng.demographics
+        if potential_namegivers and rng.random() < config.chance_child_inherits_first_name:
+            first_name_namegiver = rng.choice(potential_namegivers)
             first_name = first_name_namegiver.first_name
         else:
             first_name_namegiver = None
             if self.subject.male:
-                first_name_rep = Names.a_masculine_name(year=self.year)
+                first_name_rep = Names.a_masculine_name(year=self.year, rng=rng)
             else:
-                first_name_rep = Names.a_feminine_name(year=self.year)
+                first_name_rep = Names.a_feminine_name(year=self.year, rng=rng)
             first_name = Name(
                 value=first_name_rep, progenitor=self.subject, conceived_by=self.subject.parents, derived_from=()
             )
@@ -207,15 +208,16 @@ class Birth(Event):
     def _decide_middle_name(self, potential_namegivers):
         """Return what will be the baby's first name."""
         config = self.subject.game.config
-        if potential_namegivers and random.random() < config.chance_child_inherits_middle_name:
-            middle_name_namegiver = random.choice(potential_namegivers)
+        rng = self.mother.game.rng.demographics
+        if potential_namegivers and rng.random() < config.chance_child_inherits_middle_name:
+            middle_name_namegiver = rng.choice(potential_namegivers)
             middle_name = middle_name_namegiver.first_name
         else:
             middle_name_namegiver = None
             if self.subject.male:
-                middle_name_rep = Names.a_masculine_name(year=self.year)
+                middle_name_rep = Names.a_masculine_name(year=self.year, rng=rng)
             else:
-                middle_name_rep = Names.a_feminine_name(year=self.year)
+                middle_name_rep = Names.a_feminine_name(year=self.year, rng=rng)
             middle_name = Name(
                 value=middle_name_rep, progenitor=self.subject, conceived_by=self.subject.parents, derived_from=()
             )
@@ -224,6 +226,7 @@ class Birth(Event):
     def _get_potential_male_namegivers(self):
         """Return a set of men on the father's side of the family whom the child may be named for."""
         config = self.subject.game.config
+        rng = self.mother.game.rng.demographics
         namegivers = []
         for parent in self.subject.parents:
             # Add the child's legal father
@@ -237,13 +240,14 @@ class Birth(Event):
                 if parent.mother.father:
                     namegivers += [parent.mother.father] * config.frequency_of_naming_after_greatgrandfather
             # Add a random sampling child's uncles and great uncles
-            namegivers += random.sample(parent.brothers, random.randint(0, len(parent.brothers)))
-            namegivers += random.sample(parent.uncles, random.randint(0, len(parent.uncles)))
+            namegivers += rng.sample(parent.brothers, rng.randint(0, len(parent.brothers)))
+            namegivers += rng.sample(parent.uncles, rng.randint(0, len(parent.uncles)))
         return namegivers
 
     def _get_potential_female_namegivers(self):
         """Return a set of women on the father's side of the family whom the child may be named for."""
         config = self.subject.game.config
+        rng = self.mother.game.rng.demographics
         namegivers = []
         for parent in self.subject.parents:
             # Add the child's mother
@@ -257,8 +261,8 @@ class Birth(Event):
                 if parent.mother.mother:
                     namegivers += [parent.mother.mother] * config.frequency_of_naming_after_greatgrandmother
             # Add a random sampling child's aunts and great aunts
-            namegivers += random.sample(parent.sisters, random.randint(0, len(parent.sisters)))
-            namegivers += random.sample(parent.aunts, random.randint(0, len(parent.aunts)))
+            namegivers += rng.sample(parent.sisters, rng.randint(0, len(parent.sisters)))
+            namegivers += rng.sample(parent.aunts, rng.randint(0, len(parent.aunts)))
         return namegivers
 
     def _get_suffix(self):
@@ -277,10 +281,11 @@ class Birth(Event):
 
     def _have_mother_potentially_quit_job(self):
         """Have the mother potentially quit her job."""
+        rng = self.mother.game.rng.demographics
         if not self.city.businesses_of_type('DayCare'):
             self.mother.occupation.terminate(reason=self)
         else:
-            if random.random() < self.mother.game.config.chance_new_mother_quits_job_even_if_day_care_in_town:
+            if rng.random() < self.mother.game.config.chance_new_mother_quits_job_even_if_day_care_in_town:
                 self.mother.occupation.terminate(reason=self)
 
     def _remunerate(self):
@@ -364,6 +369,7 @@ class BusinessClosure(Event):
 
     def __init__(self, business, reason=None):
         """Initialize a Demolition object."""
+        rng = business.city.game.rng.demographics
         super(BusinessClosure, self).__init__(game=business.city.game)
         self.city = business.city
         self.business = business
@@ -379,7 +385,7 @@ class BusinessClosure(Event):
         self.city.former_companies.add(business)
         # Demolish the building -- TODO reify buildings separately from companies
         if self.city.businesses_of_type('ConstructionFirm'):
-            demolition_company = random.choice(self.city.businesses_of_type('ConstructionFirm'))
+            demolition_company = rng.choice(self.city.businesses_of_type('ConstructionFirm'))
         else:
             demolition_company = None
         Demolition(building=business, demolition_company=demolition_company, reason=self)
@@ -444,6 +450,7 @@ class Death(Event):
 
     def _update_attributes_of_deceased_and_spouse(self):
         config = self.subject.game.config
+        self.subject.game.unregister_birthday(person=self.subject)
         self.subject.alive = False
         if self.subject.marriage:
             self.widow = widow = self.subject.spouse
@@ -456,6 +463,9 @@ class Death(Event):
             widow.chance_of_remarrying = config.function_to_derive_chance_spouse_changes_name_back(
                 years_married=self.subject.marriage.duration
             )
+        # This changes the family tree (marriages end and widows are made), so everyone's kinship
+        # relations must now be computed anew
+        self.subject.game.genealogy_version += 1
 
     def _have_widow_take_off_wedding_ring(self):
         """Have the widow take off their wedding ring.
@@ -551,6 +561,7 @@ class Departure(Event):
         self.subject = subject
         subject.city.residents.remove(subject)
         subject.city.departed.add(subject)
+        subject.game.unregister_birthday(person=subject)
         subject.departure = self
         self._vacate_job_position_of_the_departed()
         self.subject.go_to(destination=None)
@@ -641,17 +652,9 @@ class Divorce(Event):
         spouse2.significant_other = None
         spouse1.divorces.append(self)
         spouse2.divorces.append(self)
-        spouse1.immediate_family.remove(spouse2)
-        spouse2.immediate_family.remove(spouse1)
-        # Revert each back to their own extended families
-        spouse1.extended_family = (
-            spouse1.greatgrandparents | spouse1.immediate_family | spouse1.uncles | spouse1.aunts |
-            spouse1.cousins | spouse1.nieces | spouse1.nephews
-        )
-        spouse2.extended_family = (
-            spouse2.greatgrandparents | spouse2.immediate_family | spouse2.uncles | spouse2.aunts |
-            spouse2.cousins | spouse2.nieces | spouse2.nephews
-        )
+        # This changes the family tree (each reverts back to their own families), so everyone's
+        # kinship views and relations must now be computed anew
+        spouse1.game.genealogy_version += 1
         self._have_divorcees_fall_out_of_love(divorcees=self.subjects, config=config)
         # Update salience values
         salience_change = (
@@ -675,11 +678,11 @@ class Divorce(Event):
     def _have_divorcees_fall_out_of_love(divorcees, config):
         """Make the divorcees (probably) lose each other as their strongest love interests."""
         spouse1, spouse2 = divorcees
-        if random.random() < config.chance_a_divorcee_falls_out_of_love:
+        if spouse1.game.rng.demographics.random() < config.chance_a_divorcee_falls_out_of_love:
             spouse1.relationships[spouse2].spark = (
                 config.new_spark_value_for_divorcee_who_has_fallen_out_of_love
             )
-        if random.random() < config.chance_a_divorcee_falls_out_of_love:
+        if spouse1.game.rng.demographics.random() < config.chance_a_divorcee_falls_out_of_love:
             spouse2.relationships[spouse1].spark = (
                 config.new_spark_value_for_divorcee_who_has_fallen_out_of_love
             )
@@ -697,7 +700,7 @@ class Divorce(Event):
         chance_of_a_name_reversion = config.function_to_derive_chance_spouse_changes_name_back(
             years_married=self.marriage.duration
         )
-        if random.random() < chance_of_a_name_reversion:
+        if self.subjects[0].game.rng.demographics.random() < chance_of_a_name_reversion:
             for name_change in self.marriage.name_changes:
                 name_change.subject.change_name(
                     new_last_name=name_change.old_last_name, reason=self
@@ -719,15 +722,16 @@ class Divorce(Event):
 
     def _decide_who_will_move_out(self):
         """Decide which of the divorcees will move out."""
+        rng = self.subjects[0].game.rng.demographics
         spouse1, spouse2 = self.subjects
         config = spouse1.game.config
         if spouse1.male:
-            if random.random() < config.chance_a_male_divorcee_is_one_who_moves_out:
+            if rng.random() < config.chance_a_male_divorcee_is_one_who_moves_out:
                 spouse_who_will_move_out = spouse1
             else:
                 spouse_who_will_move_out = spouse2
         elif spouse2.male:
-            if random.random() < config.chance_a_male_divorcee_is_one_who_moves_out:
+            if rng.random() < config.chance_a_male_divorcee_is_one_who_moves_out:
                 spouse_who_will_move_out = spouse2
             else:
                 spouse_who_will_move_out = spouse2
@@ -993,10 +997,9 @@ class Marriage(Event):
         spouse2.spouse = spouse1
         spouse1.significant_other = spouse2
         spouse2.significant_other = spouse1
-        spouse1.immediate_family.add(spouse2)
-        spouse2.immediate_family.add(spouse1)
-        spouse1.extended_family |= spouse2.extended_family  # TODO THIS IS NOT TOTALLY ACCURATE
-        spouse2.extended_family |= spouse1.extended_family
+        # This changes the family tree (each marries into the other's family), so everyone's kinship
+        # views must now be computed anew
+        spouse1.game.genealogy_version += 1
         self._cease_grieving_of_former_spouses(newlyweds=self.subjects)
         # Update salience values
         salience_change = (
@@ -1032,6 +1035,7 @@ class Marriage(Event):
         """Have one spouse (potentially) take the other's name.
 
         TODO: Have this be affected by the newlyweds' personalities."""
+        rng = self.subjects[0].game.rng.demographics
         config = self.subjects[0].game.config
         if any(newlywed for newlywed in self.subjects if newlywed.female):
             spouse_who_may_take_name = next(newlywed for newlywed in self.subjects if newlywed.female)
@@ -1039,9 +1043,9 @@ class Marriage(Event):
             spouse_who_may_take_name = self.subjects[0]
         other_spouse = next(newlywed for newlywed in self.subjects if newlywed is not spouse_who_may_take_name)
         if spouse_who_may_take_name.last_name is not other_spouse.last_name:
-            if random.random() < config.chance_one_newlywed_takes_others_name:
+            if rng.random() < config.chance_one_newlywed_takes_others_name:
                 spouse_who_may_take_name.change_name(new_last_name=other_spouse.last_name, reason=self)
-        if random.random() < config.chance_stepchildren_take_stepparent_name:
+        if rng.random() < config.chance_stepchildren_take_stepparent_name:
             for stepchild in spouse_who_may_take_name.kids:
                 if stepchild.age <= config.age_after_which_stepchildren_will_not_take_stepparent_name:
                     stepchild.change_name(new_last_name=other_spouse.last_name, reason=self)
@@ -1051,11 +1055,12 @@ class Marriage(Event):
 
         TODO: Have this be affected by newlywed personalities.
         """
+        rng = self.subjects[0].game.rng.demographics
         if self.subjects[0].last_name != self.subjects[1].last_name:  # First, make sure they have different surnames
             config = self.subjects[0].game.config
             if any(s for s in self.subjects if s.last_name.hyphenated):
                 choice = False
-            elif random.random() < config.chance_newlyweds_decide_children_will_get_hyphenated_surname:
+            elif rng.random() < config.chance_newlyweds_decide_children_will_get_hyphenated_surname:
                 choice = True
             else:
                 choice = False
@@ -0,0 +1,533 @@
+import array
+import atexit
+import bisect
+import collections
+import cPickle
+import os
+import shutil
+import struct
+import tempfile
+
+
+# The attributes of events (and pieces of evidence) that may hold the people who took part in them
+PARTICIPANT_ATTRIBUTES = (
+    'subject', 'subjects', 'mother', 'father', 'biological_father', 'adoptive_parents', 'source',
+    'recipient', 'eavesdropper', 'initiator',
+)
+# Each entry in a segment's index file is the offset (in its data file) of one archived event
+INDEX_ENTRY_FORMAT = '>Q'
+INDEX_ENTRY_SIZE = struct.calcsize(INDEX_ENTRY_FORMAT)
+RECORD_LENGTH_FORMAT = '>I'
+RECORD_LENGTH_SIZE = struct.calcsize(RECORD_LENGTH_FORMAT)
+# When a store is archived into a snapshot, each of its files is preceded by its size in bytes
+ARCHIVE_FILE_SIZE_FORMAT = '>Q'
+ARCHIVE_FILE_SIZE_SIZE = struct.calcsize(ARCHIVE_FILE_SIZE_FORMAT)
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+
+
+class EventStore(object):
+    """A bounded store of all the events (and pieces of evidence) that occur in a gameplay instance.
+
+    Only the most recent events are held in memory, in a ring of fixed capacity. As an event
+    falls out of the ring, a compact record of it is spilled to an append-only log on disk. When
+    an event that is no longer in the ring gets looked up, an ArchivedEvent is re-hydrated from
+    its record on disk; this is a stub holding only the event's number, type, date, and the IDs
+    of its participants, not the original event object (which may well still be alive, since an
+    event is kept alive by anything else that references it, e.g., a person's list of marriages).
+
+    The log is split into segments, each of which is a data file (holding the records) and an
+    index file (holding the offset of each record in the data file, at a fixed width, so that
+    any record can be found without holding an index in memory). A store only ever appends to
+    its last segment; the earlier ones are read-only, which allows a forked process to keep
+    reading the segments it inherited while writing to a new one of its own (see branch()).
+
+    The store also maintains secondary indexes on its events -- by event type (the name of
+    the event's class), by participant (the IDs of the people who took part), and by ordinal
+    date -- through which query() answers questions about the town's history without having
+    to scan every event. Since an event is added to the store before it has finished being
+    initialized (i.e., before its participants are known), the participant index catches up
+    on events lazily, either as they're spilled to disk or when a query is made. Like the
+    events themselves, the secondary indexes are moved to disk as they age: once enough events
+    have been archived, the indexes on them are sealed into an IndexSegment file, so that the
+    indexes held in memory only ever cover the most recent events.
+
+    Together, this keeps the memory held by the store flat no matter how long the simulation
+    runs, save for a small descriptor of each log segment and index segment on disk.
+    """
+
+    def __init__(self, capacity, index_segment_size):
+        """Initialize an EventStore object.
+
+        @param capacity: The number of recent events to hold in memory.
+        @param index_segment_size: The number of archived events whose secondary indexes are
+                                   sealed to disk together.
+        """
+        self.capacity = capacity
+        self.index_segment_size = index_segment_size
+        self.ring = collections.deque(maxlen=capacity)
+        self.n_events = 0
+        self.index = EventIndex(first_event_number=0)  # Secondary indexes on the events not yet sealed to disk
+        self.n_events_indexed_by_participant = 0
+        self.directory = tempfile.mkdtemp(prefix='tott_events_')
+        self.owner_pid = os.getpid()  # Only the process that created the log directory will remove it
+        self.segments = []  # Each is a LogSegment, ordered by the number of the first event it holds
+        self.index_segments = []  # Each is an IndexSegment, likewise ordered
+        self.data_file = None
+        self.index_file = None
+        self._open_new_segment()
+        atexit.register(self.close)
+
+    def __len__(self):
+        """Return the number of events that have ever been added to this store."""
+        return self.n_events
+
+    def __iter__(self):
+        """Iterate over all events in this store, from oldest to newest.
+
+        Events that have been spilled to disk are yielded as ArchivedEvent stubs, not as the
+        original event objects; only the events still in memory are yielded as themselves.
+        """
+        for event_number in xrange(self.n_events - len(self.ring)):
+            yield self[event_number]
+        for event in list(self.ring):
+            yield event
+
+    def __getitem__(self, event_number):
+        """Return the event with the given event number, re-hydrating it from disk if need be.
+
+        If the event has been spilled to disk, an ArchivedEvent stub is returned in place of the
+        original event object.
+        """
+        if event_number < 0:
+            event_number += self.n_events
+        if not 0 <= event_number < self.n_events:
+            raise IndexError('There is no event number {}'.format(event_number))
+        n_archived_events = self.n_events - len(self.ring)
+        if event_number >= n_archived_events:
+            return self.ring[event_number - n_archived_events]
+        return self._rehydrate(event_number=event_number)
+
+    def __getstate__(self):
+        """Return the state of this object for pickling.
+
+        The files on disk are not included in the pickled state; a snapshot streams them in
+        after the pickle, by way of write_archive().
+        """
+        self.flush()
+        state = dict(self.__dict__)
+        state['ring'] = list(self.ring)
+        state['segments'] = self._archived_segments()
+        for attribute in ('directory', 'owner_pid', 'data_file', 'index_file'):
+            del state[attribute]
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of this object upon unpickling.
+
+        The files on disk are given a new directory, but they are not written out until
+        read_archive() is called, which must be done before any more events are added.
+        """
+        self.__dict__.update(state)
+        self.ring = collections.deque(state['ring'], maxlen=self.capacity)
+        self.directory = tempfile.mkdtemp(prefix='tott_events_')
+        self.owner_pid = os.getpid()
+        for segment in self.segments + self.index_segments:
+            segment.directory = self.directory
+        self.data_file = None
+        self.index_file = None
+        atexit.register(self.close)
+
+    def append(self, event):
+        """Add a new event to this store, spilling the oldest event in memory to disk if the ring is full."""
+        if len(self.ring) == self.capacity:
+            self._spill(event=self.ring[0])
+        self.ring.append(event)
+        self.index.add(event_number=self.n_events, event_type=event.__class__.__name__, ordinal_date=event.ordinal_date)
+        self.n_events += 1
+
+    def query(self, event_type=None, participant=None, start_date=None, end_date=None):
+        """Return a list of all the events that match the given criteria, ordered by event number.
+
+        At least one criterion must be given; to visit every event, iterate over the store itself.
+        As with indexing into the store, matching events that have been spilled to disk are
+        returned as ArchivedEvent stubs, not as the original event objects. The indexes of each
+        sealed IndexSegment whose dates overlap the given date range are read back from disk.
+
+        @param event_type: An event class (e.g., Death), or the name of one; note that subclasses
+                           of the given class are not matched.
+        @param participant: A Person object, or the ID of one.
+        @param start_date: An ordinal date on or after which the events must have occurred.
+        @param end_date: An ordinal date on or before which the events must have occurred.
+        """
+        if event_type is None and participant is None and start_date is None and end_date is None:
+            raise Exception('An event query must be given at least one criterion')
+        if event_type is not None and not isinstance(event_type, basestring):
+            event_type = event_type.__name__
+        if participant is not None:
+            if not isinstance(participant, (int, long)):
+                participant = participant.id
+            self._index_participants(through_event_number=self.n_events-1)
+        event_numbers = []
+        for index_segment in self.index_segments:
+            if index_segment.overlaps(start_date=start_date, end_date=end_date):
+                event_numbers += index_segment.load().event_numbers(
+                    event_type=event_type, participant_id=participant, start_date=start_date, end_date=end_date
+                )
+        event_numbers += self.index.event_numbers(
+            event_type=event_type, participant_id=participant, start_date=start_date, end_date=end_date
+        )
+        return [self[event_number] for event_number in event_numbers]
+
+    def recent(self, n):
+        """Return a list of the n most recent events.
+
+        Only events that are still held in memory are returned, so these are always the original
+        event objects (never ArchivedEvent stubs); if n exceeds the capacity of the store, only as
+        many events as it holds in memory are returned.
+        """
+        n = min(n, len(self.ring))
+        return [self.ring[i] for i in xrange(len(self.ring)-n, len(self.ring))]
+
+    def flush(self):
+        """Flush any buffered writes to the log on disk."""
+        if self.data_file:
+            self.data_file.flush()
+            self.index_file.flush()
+
+    def write_archive(self, stream):
+        """Write the files that this store keeps on disk to the given stream, a chunk at a time.
+
+        This is called by snapshot.save() just after the store has been pickled, so that the
+        log never has to be read into memory as a whole.
+
+        @param stream: A writable file-like object.
+        """
+        self.flush()
+        for filename in self._archive_filenames(log_segments=self._archived_segments()):
+            stream.write(struct.pack(ARCHIVE_FILE_SIZE_FORMAT, os.path.getsize(filename)))
+            with open(filename, 'rb') as archived_file:
+                shutil.copyfileobj(archived_file, stream, ARCHIVE_CHUNK_SIZE)
+
+    def read_archive(self, stream):
+        """Restore the files of this store from the given stream, which was written by write_archive().
+
+        @param stream: A readable file-like object, positioned where the archive begins.
+        """
+        for filename in self._archive_filenames(log_segments=self.segments):
+            n_bytes_left = struct.unpack(ARCHIVE_FILE_SIZE_FORMAT, stream.read(ARCHIVE_FILE_SIZE_SIZE))[0]
+            with open(filename, 'wb') as archived_file:
+                while n_bytes_left:
+                    chunk = stream.read(min(n_bytes_left, ARCHIVE_CHUNK_SIZE))
+                    if not chunk:
+                        raise Exception('The archive of an event store ended prematurely')
+                    archived_file.write(chunk)
+                    n_bytes_left -= len(chunk)
+        self._open_new_segment()
+
+    def branch(self):
+        """Begin writing to a new segment of the log, leaving the current one read-only.
+
+        This must be called in a forked child process before it adds any events, since the
+        parent process will keep writing to the segment that the child inherited; likewise,
+        the parent must call flush() before it forks, else the child would inherit (and later
+        write out) a copy of its buffered writes.
+        """
+        # Drop the inherited file objects without closing them, since closing them would
+        # flush the parent's buffered writes (if there were any) from this process too
+        self.data_file = None
+        self.index_file = None
+        self._open_new_segment()
+
+    def close(self):
+        """Close the log and, if this is the process that created it, delete it from disk."""
+        if self.data_file:
+            self.data_file.close()
+            self.index_file.close()
+            self.data_file = None
+            self.index_file = None
+        if os.getpid() == self.owner_pid and os.path.isdir(self.directory):
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _open_new_segment(self):
+        """Open a new segment of the log, to which archived events will be appended from now on."""
+        n_archived_events = self.n_events - len(self.ring)
+        segment = LogSegment(directory=self.directory, first_event_number=n_archived_events)
+        self.segments.append(segment)
+        self.data_file = open(segment.data_filename, 'ab')
+        self.index_file = open(segment.index_filename, 'ab')
+
+    def _archived_segments(self):
+        """Return the segments of the log that hold any records (empty ones needn't be archived)."""
+        return [segment for segment in self.segments if os.path.getsize(segment.data_filename)]
+
+    def _archive_filenames(self, log_segments):
+        """Return the names of the files to be archived, given the log segments to be included."""
+        filenames = []
+        for segment in log_segments:
+            filenames += [segment.data_filename, segment.index_filename]
+        filenames += [index_segment.filename for index_segment in self.index_segments]
+        return filenames
+
+    def _index_participants(self, through_event_number):
+        """Add to the participant index every event up to (and including) the given one that isn't yet indexed."""
+        n_archived_events = self.n_events - len(self.ring)
+        for event_number in xrange(self.n_events_indexed_by_participant, through_event_number+1):
+            event = self.ring[event_number - n_archived_events]
+            self.index.add_participants(event_number=event_number, person_ids=participant_ids(event))
+        self.n_events_indexed_by_participant = max(self.n_events_indexed_by_participant, through_event_number+1)
+
+    def _spill(self, event):
+        """Append a compact record of the given event to the log, sealing the indexes on older events if it's time."""
+        event_number = self.n_events - len(self.ring)
+        self._index_participants(through_event_number=event_number)
+        record = cPickle.dumps(
+            (event.event_number, event.__class__.__name__, event.ordinal_date, event.date, participant_ids(event)),
+            cPickle.HIGHEST_PROTOCOL
+        )
+        self.index_file.write(struct.pack(INDEX_ENTRY_FORMAT, self.data_file.tell()))
+        self.data_file.write(struct.pack(RECORD_LENGTH_FORMAT, len(record)))
+        self.data_file.write(record)
+        if event_number+1 - self.index.first_event_number >= self.index_segment_size:
+            sealed_index = self.index.split(event_number=event_number+1)
+            self.index_segments.append(IndexSegment(directory=self.directory, index=sealed_index))
+
+    def _rehydrate(self, event_number):
+        """Read the record of an archived event back from disk, and return it as an ArchivedEvent."""
+        self.flush()
+        segment_first_event_numbers = [segment.first_event_number for segment in self.segments]
+        segment = self.segments[bisect.bisect_right(segment_first_event_numbers, event_number) - 1]
+        with open(segment.index_filename, 'rb') as index_file:
+            index_file.seek((event_number - segment.first_event_number) * INDEX_ENTRY_SIZE)
+            offset = struct.unpack(INDEX_ENTRY_FORMAT, index_file.read(INDEX_ENTRY_SIZE))[0]
+        with open(segment.data_filename, 'rb') as data_file:
+            data_file.seek(offset)
+            record_length = struct.unpack(RECORD_LENGTH_FORMAT, data_file.read(RECORD_LENGTH_SIZE))[0]
+            record = cPickle.loads(data_file.read(record_length))
+        return ArchivedEvent(*record)
+
+
+class EventIndex(object):
+    """Secondary indexes on a run of consecutive events in an EventStore.
+
+    Each index maps a key (an event type, a participant ID, or an ordinal date) to an array
+    of the numbers of the events filed under it, in ascending order.
+    """
+
+    def __init__(self, first_event_number):
+        """Initialize an EventIndex object.
+
+        @param first_event_number: The event number of the first event covered by these indexes.
+        """
+        self.first_event_number = first_event_number
+        self.events_by_type = {}
+        self.events_by_participant = {}
+        self.events_by_date = {}
+        self.dates = []  # A sorted list of all the ordinal dates in events_by_date
+        self.event_dates = array.array('l')  # The ordinal date of each event, from the first one on
+
+    def __getstate__(self):
+        """Return the state of this object for pickling, with its arrays packed into strings.
+
+        (In Python 2, an array is otherwise pickled as a list of integers, which is far larger.)
+        """
+        state = dict(self.__dict__)
+        for attribute in ('events_by_type', 'events_by_participant', 'events_by_date'):
+            state[attribute] = {key: event_numbers.tostring() for key, event_numbers in state[attribute].iteritems()}
+        state['event_dates'] = self.event_dates.tostring()
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of this object upon unpickling, unpacking its arrays."""
+        self.__dict__.update(state)
+        for attribute in ('events_by_type', 'events_by_participant', 'events_by_date'):
+            setattr(self, attribute, {key: _unpack_array(packed) for key, packed in state[attribute].iteritems()})
+        self.event_dates = _unpack_array(state['event_dates'])
+
+    def add(self, event_number, event_type, ordinal_date):
+        """Index a new event by its type and its date."""
+        self._index(event_number=event_number, index=self.events_by_type, key=event_type)
+        if ordinal_date not in self.events_by_date:
+            bisect.insort(self.dates, ordinal_date)
+        self._index(event_number=event_number, index=self.events_by_date, key=ordinal_date)
+        self.event_dates.append(ordinal_date)
+
+    def add_participants(self, event_number, person_ids):
+        """Index an event by the IDs of the people who took part in it."""
+        for person_id in person_ids:
+            self._index(event_number=event_number, index=self.events_by_participant, key=person_id)
+
+    def event_numbers(self, event_type, participant_id, start_date, end_date):
+        """Return a list of the numbers of the events covered here that match the given criteria, in order.
+
+        Any criterion may be None, but not all of them.
+        """
+        candidates = []
+        if event_type is not None:
+            candidates.append(self.events_by_type.get(event_type, ()))
+        if participant_id is not None:
+            candidates.append(self.events_by_participant.get(participant_id, ()))
+        if not candidates:
+            return sorted(self._events_in_date_range(start_date=start_date, end_date=end_date))
+        # Work from the fewest candidates, filtering them by date and then by membership among
+        # the other candidates (each of which is sorted by event number, so that membership
+        # can be checked by bisection), so that the cost of a query depends on the size of the
+        # narrowest criterion, not on the number of events in the date range
+        candidates.sort(key=len)
+        event_numbers = candidates[0]
+        if start_date is not None or end_date is not None:
+            event_numbers = self._filter_by_date_range(
+                event_numbers=event_numbers, start_date=start_date, end_date=end_date
+            )
+        for other_candidates in candidates[1:]:
+            event_numbers = [n for n in event_numbers if self._sorted_array_contains(other_candidates, n)]
+        return list(event_numbers)
+
+    def split(self, event_number):
+        """Move the indexing of all events before the given one into a new EventIndex, and return it."""
+        older = EventIndex(first_event_number=self.first_event_number)
+        for attribute in ('events_by_type', 'events_by_participant', 'events_by_date'):
+            index, older_index = getattr(self, attribute), getattr(older, attribute)
+            for key, event_numbers in index.items():
+                i = bisect.bisect_left(event_numbers, event_number)
+                if i:
+                    older_index[key] = event_numbers[:i]
+                    if i == len(event_numbers):
+                        del index[key]
+                    else:
+                        index[key] = event_numbers[i:]
+        n_older_events = event_number - self.first_event_number
+        older.event_dates = self.event_dates[:n_older_events]
+        self.event_dates = self.event_dates[n_older_events:]
+        older.dates = sorted(older.events_by_date)
+        self.dates = sorted(self.events_by_date)
+        self.first_event_number = event_number
+        return older
+
+    @staticmethod
+    def _index(event_number, index, key):
+        """Add an event number to the given index under the given key."""
+        try:
+            index[key].append(event_number)
+        except KeyError:
+            index[key] = array.array('l', (event_number,))
+
+    def _events_in_date_range(self, start_date, end_date):
+        """Return a list of the numbers of all events that occurred in the given range of ordinal dates."""
+        first = 0 if start_date is None else bisect.bisect_left(self.dates, start_date)
+        last = len(self.dates) if end_date is None else bisect.bisect_right(self.dates, end_date)
+        event_numbers = []
+        for ordinal_date in self.dates[first:last]:
+            event_numbers.extend(self.events_by_date[ordinal_date])
+        return event_numbers
+
+    def _filter_by_date_range(self, event_numbers, start_date, end_date):
+        """Return those of the given event numbers whose events occurred in the given range of ordinal dates."""
+        event_dates, offset = self.event_dates, self.first_event_number
+        if start_date is None:
+            return [n for n in event_numbers if event_dates[n-offset] <= end_date]
+        if end_date is None:
+            return [n for n in event_numbers if start_date <= event_dates[n-offset]]
+        return [n for n in event_numbers if start_date <= event_dates[n-offset] <= end_date]
+
+    @staticmethod
+    def _sorted_array_contains(sorted_array, item):
+        """Return whether the given item is in the given sorted array."""
+        i = bisect.bisect_left(sorted_array, item)
+        return i < len(sorted_array) and sorted_array[i] == item
+
+
+class LogSegment(object):
+    """A segment of the on-disk log of an EventStore."""
+
+    def __init__(self, directory, first_event_number):
+        """Initialize a LogSegment object.
+
+        @param directory: The directory in which the files of this segment are kept.
+        @param first_event_number: The event number of the first event recorded in this segment.
+        """
+        self.directory = directory
+        self.first_event_number = first_event_number
+        # Include the process ID, since forked processes add segments to the same directory
+        self.name = '{pid}_{n}'.format(pid=os.getpid(), n=first_event_number)
+
+    @property
+    def data_filename(self):
+        """Return the path to the data file of this segment."""
+        return os.path.join(self.directory, self.name + '.log')
+
+    @property
+    def index_filename(self):
+        """Return the path to the index file of this segment."""
+        return os.path.join(self.directory, self.name + '.idx')
+
+
+class IndexSegment(object):
+    """The secondary indexes on a run of archived events, sealed into a file in the directory of an EventStore."""
+
+    def __init__(self, directory, index):
+        """Initialize an IndexSegment object, writing the given indexes to disk.
+
+        @param directory: The directory in which the file of this segment is kept.
+        @param index: The EventIndex to be sealed.
+        """
+        self.directory = directory
+        self.first_event_number = index.first_event_number
+        # These allow a query to skip this segment without reading it, if its date range falls outside this one
+        self.earliest_date = index.dates[0]
+        self.latest_date = index.dates[-1]
+        self.name = '{pid}_{n}'.format(pid=os.getpid(), n=index.first_event_number)
+        with open(self.filename, 'wb') as index_file:
+            cPickle.dump(index, index_file, cPickle.HIGHEST_PROTOCOL)
+
+    @property
+    def filename(self):
+        """Return the path to the file of this segment."""
+        return os.path.join(self.directory, self.name + '.sdx')
+
+    def overlaps(self, start_date, end_date):
+        """Return whether any event covered by this segment may have occurred in the given range of ordinal dates."""
+        return (
+            (start_date is None or start_date <= self.latest_date) and
+            (end_date is None or self.earliest_date <= end_date)
+        )
+
+    def load(self):
+        """Read the sealed indexes back from disk, and return them as an EventIndex."""
+        with open(self.filename, 'rb') as index_file:
+            return cPickle.load(index_file)
+
+
+class ArchivedEvent(object):
+    """A record of an event that was re-hydrated from the on-disk log of an EventStore."""
+
+    def __init__(self, event_number, event_type, ordinal_date, date, participant_ids):
+        """Initialize an ArchivedEvent object."""
+        self.event_number = event_number
+        self.type = event_type  # The name of the class of the original event, e.g., 'Marriage'
+        self.ordinal_date = ordinal_date
+        self.date = date
+        self.participant_ids = participant_ids
+
+    def __str__(self):
+        """Return string representation."""
+        return "{type} (event #{number}) on the {date}".format(
+            type=self.type, number=self.event_number, date=self.date[0].lower()+self.date[1:]
+        )
+
+
+def participant_ids(event):
+    """Return a tuple of the IDs of the people who took part in an event, in order of first appearance."""
+    ids = []
+    for attribute in PARTICIPANT_ATTRIBUTES:
+        value = getattr(event, attribute, None)
+        for thing in value if isinstance(value, (list, tuple)) else (value,):
+            if getattr(thing, 'type', None) == 'person' and thing.id not in ids:
+                ids.append(thing.id)
+    return tuple(ids)
+
+
+def _unpack_array(packed):
+    """Return an array of event numbers (or ordinal dates) that was packed into a string."""
+    unpacked = array.array('l')
+    unpacked.fromstring(packed)
+    return unpacked
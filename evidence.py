@@ -1,24 +1,37 @@
-import random
+from rng import StablyHashed
 
 
-class PieceOfEvidence(object):
-    """A superclass that all evidence subclasses inherit from."""
+class PieceOfEvidence(StablyHashed):
+    """A superclass that all evidence subclasses inherit from.
+
+    Evidence is instantiated in very high volume during the high-fidelity simulation (every
+    observation, statement, mutation, etc. gets a piece of it), so pieces of evidence keep their
+    attributes in slots rather than in a per-object dictionary. Attributes that only some types of
+    evidence have are declared as slots by just those subclasses, and otherwise fall back to the
+    class-level defaults below; the evidence type itself is a class attribute.
+    """
+
+    __slots__ = (
+        'serial_number', 'location', 'date', 'ordinal_date', 'event_number', 'subject', 'source',
+        'beliefs_evidenced', 'base_strength'
+    )
+    type = None  # Overwritten by each subclass
+    recipient = None  # Overwritten in case of Lie, Statement, Declaration, Eavesdropping
+    eavesdropper = None  # Overwritten in case of Eavesdropping
+    artifact = None  # Overwritten in case of Examination
+    attribute_transferred = None  # Overwritten in case of Transference
 
     def __init__(self, subject, source):
         """Initialize a PieceOfEvidence object."""
-        self.type = self.__class__.__name__.lower()
         self.location = source.location
         self.date = source.game.date
         self.ordinal_date = source.game.ordinal_date
         # Also request and attribute an event number, so that we can later
         # determine the precise ordering of events that happen on the same timestep
         self.event_number = source.game.assign_event_number(new_event=self)
+        source.game.profiler.note_creation(object_category='PieceOfEvidence')
         self.subject = subject
         self.source = source
-        self.recipient = None  # Will get overwritten in case of Lie, Statement, Declaration, Eavesdropping
-        self.eavesdropper = None  # Will get overwritten in case of Eavesdropping
-        self.artifact = None  # Will get overwritten in case of Examination
-        self.attribute_transferred = None  # Will get overwritten in case of Transference
         self.beliefs_evidenced = set()  # Gets added to by Belief.Facet.__init__()
         self.base_strength = None  # Used to hold partial results of determine_strength()
 
@@ -88,6 +101,7 @@ class PieceOfEvidence(object):
         evidence and how strong the source's belief is (at this timestep, i.e., the time
         of it being conveyed to the recipient).
         """
+        rng = self.source.game.rng.knowledge
         config = self.source.game.config
         source, recipient, subject = self.source, self.recipient, self.subject
         this_is_propagation = self.type in ('statement', 'lie', 'eavesdropping')
@@ -106,7 +120,7 @@ class PieceOfEvidence(object):
         # the strength of the source's belief at the time of telling
         if this_is_propagation:
             if self.type == 'lie':
-                teller_belief_strength = random.randint(1, 300)  # TODO maybe model lying ability here?
+                teller_belief_strength = rng.randint(1, 300)  # TODO maybe model lying ability here?
             else:
                 teller_belief_facet = source.mind.mental_models[subject].get_facet_to_this_belief_of_type(
                     feature_type=feature_type
@@ -150,6 +164,9 @@ class Implant(PieceOfEvidence):
     life who *did* know subject telling owner about them.
     """
 
+    __slots__ = ('total_interactions', 'salience_of_subject')
+    type = 'implant'
+
     def __init__(self, subject, source, total_interactions, salience_of_subject):
         """Initialize a Reflection object."""
         super(Implant, self).__init__(subject=subject, source=source)
@@ -196,6 +213,9 @@ class Implant(PieceOfEvidence):
 class Reflection(PieceOfEvidence):
     """A reflection by which one person perceives something about themself."""
 
+    __slots__ = ()
+    type = 'reflection'
+
     def __init__(self, subject, source):
         """Initialize a Reflection object."""
         super(Reflection, self).__init__(subject=subject, source=source)
@@ -207,6 +227,9 @@ class Reflection(PieceOfEvidence):
 class Observation(PieceOfEvidence):
     """An observation by which one person perceives something about another person."""
 
+    __slots__ = ()
+    type = 'observation'
+
     def __init__(self, subject, source):
         """Initialize an Observation object."""
         super(Observation, self).__init__(subject=subject, source=source)
@@ -227,6 +250,9 @@ class Observation(PieceOfEvidence):
 class Examination(PieceOfEvidence):
     """An examination of an artifact that transmits knowledge about some entity."""
 
+    __slots__ = ('artifact',)
+    type = 'examination'
+
     def __init__(self, subject, source, artifact):
         """Initialize an Observation object."""
         super(Examination, self).__init__(subject=subject, source=source)
@@ -243,6 +269,9 @@ class Confabulation(PieceOfEvidence):
     a new value for an attribute whose true value they had forgotten.
     """
 
+    __slots__ = ()
+    type = 'confabulation'
+
     def __init__(self, subject, source):
         """Initialize a Confabulation object."""
         super(Confabulation, self).__init__(subject=subject, source=source)
@@ -251,6 +280,9 @@ class Confabulation(PieceOfEvidence):
 class Lie(PieceOfEvidence):
     """A lie by which one person invents and conveys knowledge about someone that they know is false."""
 
+    __slots__ = ('recipient',)
+    type = 'lie'
+
     def __init__(self, subject, source, recipient):
         """Initialize a Lie object."""
         super(Lie, self).__init__(subject=subject, source=source)
@@ -260,6 +292,9 @@ class Lie(PieceOfEvidence):
 class Statement(PieceOfEvidence):
     """A statement by which one person conveys knowledge about someone that they believe is true."""
 
+    __slots__ = ('recipient',)
+    type = 'statement'
+
     def __init__(self, subject, source, recipient):
         """Initialize a Statement object."""
         super(Statement, self).__init__(subject=subject, source=source)
@@ -272,6 +307,9 @@ class Declaration(PieceOfEvidence):
     See source [6] for evidence that this is realistic.
     """
 
+    __slots__ = ('recipient',)
+    type = 'declaration'
+
     def __init__(self, subject, source, recipient):
         """Initialize a Declaration object."""
         super(Declaration, self).__init__(subject=subject, source=source)
@@ -281,6 +319,9 @@ class Declaration(PieceOfEvidence):
 class Eavesdropping(PieceOfEvidence):
     """An eavesdropping by which one person overhears the information being conveyed by a statement or lie."""
 
+    __slots__ = ('recipient', 'eavesdropper')
+    type = 'eavesdropping'
+
     def __init__(self, subject, source, recipient, eavesdropper):
         """Initialize an Eavesdropping object."""
         super(Eavesdropping, self).__init__(subject=subject, source=source)
@@ -291,6 +332,9 @@ class Eavesdropping(PieceOfEvidence):
 class Mutation(PieceOfEvidence):
     """A mutation by which a person misremembers knowledge from time passing (i.e., changes an attribute's value)."""
 
+    __slots__ = ('mutated_belief_str',)
+    type = 'mutation'
+
     def __init__(self, subject, source, mutated_belief_str):
         """Initialize a Mutation object."""
         super(Mutation, self).__init__(subject=subject, source=source)
@@ -301,6 +345,9 @@ class Transference(PieceOfEvidence):
     """A transference by which a person unintentionally transposes another person's attribute onto their model
     of someone else."""
 
+    __slots__ = ('attribute_transferred',)
+    type = 'transference'
+
     def __init__(self, subject, source, belief_facet_transferred_from):
         """Initialize a Transference object.
 
@@ -321,6 +368,9 @@ class Forgetting(PieceOfEvidence):
     string.
     """
 
+    __slots__ = ()
+    type = 'forgetting'
+
     def __init__(self, subject, source):
         """Initialize a Forgetting object.
 
@@ -1,6 +1,3 @@
-import random
-
-
 class Face(object):
     """A person's face."""
 
@@ -33,7 +30,7 @@ class Face(object):
         config = self.person.game.config
         feature_will_get_inherited = (
             self.person.biological_mother and
-            random.random() < config.facial_feature_type_heritability[feature_type]
+            self.person.game.rng.demographics.random() < config.facial_feature_type_heritability[feature_type]
         )
         if feature_will_get_inherited:
             takes_after = self._determine_whom_feature_gets_inherited_from(feature_type=feature_type)
@@ -71,22 +68,24 @@ class Face(object):
     def _generate_feature_from_its_population_distribution(self, feature_type):
         """Generate a facial feature for a person given that feature's population distribution."""
         config = self.person.game.config
+        rng = self.person.game.rng.demographics
         if self.person.male:
             distribution = config.facial_feature_distributions_male[feature_type]
         else:
             distribution = config.facial_feature_distributions_female[feature_type]
-        x = random.random()
+        x = rng.random()
         type_str = next(  # See config.py to understand what this is doing
             feature_type[1] for feature_type in distribution if feature_type[0][0] < x < feature_type[0][1]
         )
-        variant_id = int(random.random() * 1000)
+        variant_id = int(rng.random() * 1000)
         return type_str, variant_id
 
     def _determine_whom_feature_gets_inherited_from(self, feature_type):
         """Determine whom this person will inherit this facial feature from."""
         config = self.person.game.config
+        rng = self.person.game.rng.demographics
         # Some features are more likely to be inherited from a parent/grandparent of the same sex
-        if random.random() < config.facial_feature_chance_inheritance_according_to_sex[feature_type]:
+        if rng.random() < config.facial_feature_chance_inheritance_according_to_sex[feature_type]:
             if self.person.male:
                 possible_sources = (  # Two chances to inherit from father, one from maternal grandfather
                     self.person.biological_father, self.person.biological_father,
@@ -100,19 +99,20 @@ class Face(object):
         else:
             possible_sources = (self.person.biological_father, self.person.biological_mother)
         possible_sources = [source for source in possible_sources if source]  # Remove non-existent grandparents
-        takes_after = random.choice(possible_sources)
+        takes_after = rng.choice(possible_sources)
         return takes_after
 
     def _determine_graphical_variant_of_this_feature(self, takes_after, feature_type):
         config = self.person.game.config
-        if random.random() < config.facial_feature_variant_heritability[feature_type]:
+        rng = self.person.game.rng.demographics
+        if rng.random() < config.facial_feature_variant_heritability[feature_type]:
             # Inherit the exact graphical variant that that parent/grandparent has
             variant_id = self._get_persons_feature_variant_of_type(
                 person=takes_after, feature_type=feature_type
             )
             exact_variant_inherited = True
         else:
-            variant_id = int(random.random() * 1000)  # Generate a seed for which variant gets selected
+            variant_id = int(rng.random() * 1000)  # Generate a seed for which variant gets selected
             exact_variant_inherited = False
         return variant_id, exact_variant_inherited
 
@@ -197,7 +197,7 @@ class Skin(object):
                     self.face.person.game.config.child_skin_color_given_parents[parent_skin_color_tuple]
                 )
             self.color = Feature(
-                value=skin_color, variant_id=int(random.random() * 1000),
+                value=skin_color, variant_id=int(self.face.person.game.rng.demographics.random() * 1000),
                 inherited_from=None, exact_variant_inherited=False
             )
         else:  # Generate from population distribution
@@ -229,9 +229,10 @@ class Eyebrows(object):
 
     def __init__(self, face):
         """Initialize a Eyebrows object."""
+        rng = face.person.game.rng.demographics
         self.face = face
         self.size = self.face.determine_facial_feature(feature_type="eyebrow size")
-        if random.random() < self.face.person.game.config.chance_eyebrows_are_same_color_as_hair:
+        if rng.random() < self.face.person.game.config.chance_eyebrows_are_same_color_as_hair:
             self.color = self.face.hair.color
         else:
             self.color = self.face.determine_facial_feature(feature_type="eyebrow color")
@@ -332,4 +333,8 @@ class Feature(str):
 
     def __new__(cls, value, variant_id, inherited_from, exact_variant_inherited):
         """Do str stuff."""
-        return str.__new__(cls, value)
\ No newline at end of file
+        return str.__new__(cls, value)
+
+    def __getnewargs__(self):
+        """Return the arguments to pass to __new__() when unpickling (other attributes get restored after)."""
+        return str(self), None, None, None
\ No newline at end of file
@@ -1,21 +1,39 @@
 import sys
+import random
 from config import Config
 from productionist import DialogueGenerator, ThoughtGenerator
 from impressionist import Impressionist
 from person import *
 from business import *
 from city import *
+import bisect
 import datetime
+import heapq
 import time
+import snapshot
+from rng import RNG, StablyHashed
+from profiling import Profiler
+from eventstore import EventStore
+from scheduler import LoFiScheduler, DeteriorationScheduler
 
 
 class Game(object):
     """A gameplay instance."""
 
-    def __init__(self, event_emitter=None):
-        """Initialize a Game object."""
+    def __init__(self, event_emitter=None, seed=None):
+        """Initialize a Game object.
+
+        @param seed: An integer from which every random stream of this gameplay instance will
+                     be seeded; if none is passed, one will be chosen at random.
+        """
         # Load config parameters
         self.config = Config()
+        # Prepare the random-number service, from whose streams all randomness in this
+        # gameplay instance is drawn; a given seed will always produce the same town
+        if seed is None:
+            seed = random.randint(0, sys.maxint)
+        self.rng = RNG(seed=seed)
+        StablyHashed.restart_serial_numbers()
         # Load NLG and NLU modules for this game instance
         self.dialogue_productionist = DialogueGenerator(game=self)  # NLG module
         self.thought_productionist = ThoughtGenerator(game=self)  # NLG module
@@ -24,6 +42,8 @@ class Game(object):
         # which affords a persistent ID for each person
         self.current_person_id = 0
         self.current_place_id = 0
+        # Incremented whenever a birth, adoption, marriage, divorce, or death changes the family tree
+        self.genealogy_version = 0
         self.year = self.config.date_worldgen_begins[0]
         self.true_year = self.config.date_worldgen_begins[0]  # True year never gets changed during retconning
         self.ordinal_date = datetime.date(*self.config.date_worldgen_begins).toordinal()  # Days since 01-01-0001
@@ -35,21 +55,49 @@ class Game(object):
         self.time_of_day = "day"
         self.date = self.get_date()
         self.city = None
-        # Prepare a listing of all in-game events, which will facilitate debugging later
-        self.events = []
+        # Prepare a store of all in-game events, which will facilitate debugging later -- only
+        # the most recent ones are held in memory, with the rest being spilled to disk
+        self.events = EventStore(
+            capacity=self.config.n_recent_events_held_in_memory,
+            index_segment_size=self.config.n_archived_events_per_index_segment
+        )
         # A game's event number allows the precise ordering of events that
         # happened on the same timestep -- every time an event happens, it requests an
         # event number from Game.assign_event_number(), which also increments the running counter
         self.event_number = -1
+        # A game's timestep number is incremented at the start of every simulated timestep (lo-fi
+        # or hi-fi); relationships record the timestep number of their last interaction, which
+        # lets them tell whether they've interacted on the current timestep without having to be
+        # reset every timestep
+        self.simulated_timestep_number = 0
         # Prepare a listing of all people born on each day -- this is used to
         # age people on their birthdays; we start with (2, 29) initialized because
         # we need to perform a check every March 1 to ensure that all leap-year babies
         # celebrate their birthday that day on non-leap years
         self.birthdays = {(2, 29): set()}
+        # Prepare a calendar of the days on which any present person celebrates a birthday, which
+        # gets maintained by Game.register_birthday() and Game.unregister_birthday(); it maps each
+        # (month, day) to the number of present people celebrating then, and is kept alongside a
+        # sorted list of those days, so that the lo-fi simulation can find the next one by bisection
+        self.n_present_people_celebrating_birthday_on = {}
+        self.days_with_birthday_celebrations = []
+        # Prepare a min-heap of (due date, person ID, person) tuples for all pregnancies, which
+        # get registered by Game.register_pregnancy() upon conception; this lets the lo-fi
+        # simulation find the people who are due without scanning every resident
+        self.pregnancies = []
+        # The last day on which a lo-fi timestep was actually simulated; this is tracked across
+        # calls to enact_lo_fi_simulation(), so that the lo-fi simulation can be carried out in chunks
+        self.last_simulated_day = None
+        # Prepare the engine that schedules the deterioration of people's mental models
+        # during hi-fi simulation, if config.mental_model_deterioration_engine is 'scheduled'
+        self.deterioration_scheduler = DeteriorationScheduler(game=self)
+        # Prepare the instrumentation layer for the simulation loops, which is disabled
+        # until someone calls self.profiler.enable()
+        self.profiler = Profiler()
         # Prepare a number that will hold a single random number that is generated daily -- this
         # facilitates certain things that should be determined randomly but remain constant across
         # a timestep, e.g., whether a person locked their door before leaving home
-        self.random_number_this_timestep = random.random()
+        self.random_number_this_timestep = self.rng.routines.random()
         # self.establish_setting()
         # self._sim_and_save_a_week_of_timesteps()
         self.weather = None
@@ -59,33 +107,97 @@ class Game(object):
         """
         self.event_emitter = event_emitter
 
+    def __getstate__(self):
+        """Return the state of this object for pickling.
+
+        The NLG and NLU modules are excluded, since they are large, hold lambda functions
+        (which can't be pickled), and are fully determined by the grammar files anyway;
+        they get rebuilt by __setstate__(). The event emitter and the profiler are excluded
+        as well, since their lifetimes (and, for the profiler, its open trace file) are tied
+        to the running process. Because serial numbers are assigned by a counter that lives
+        in the process, not in this object, we also save where that counter is, so that objects
+        created after loading don't reuse the serial numbers (and so the hashes) of existing ones.
+        """
+        state = dict(self.__dict__)
+        state['next_serial_number'] = StablyHashed.next_serial_number()
+        state['dialogue_productionist'] = None
+        state['thought_productionist'] = None
+        state['impressionist'] = None
+        state['event_emitter'] = None
+        state['profiler'] = None
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of this object upon unpickling."""
+        StablyHashed.restart_serial_numbers(next_serial_number=state.pop('next_serial_number'))
+        self.__dict__.update(state)
+        self.dialogue_productionist = DialogueGenerator(game=self)
+        self.thought_productionist = ThoughtGenerator(game=self)
+        self.impressionist = Impressionist(game=self)
+        self.profiler = Profiler()
+
+    def save(self, filename):
+        """Save a snapshot of this gameplay instance to a file, from which it can later be loaded."""
+        snapshot.save(game=self, filename=filename)
+
+    @staticmethod
+    def load(filename, event_emitter=None):
+        """Load a gameplay instance from a snapshot file that was written by Game.save().
+
+        Note that a loaded gameplay instance is not guaranteed to unfold exactly as the saved one
+        would have, had it continued in its own process (see snapshot.py).
+        """
+        game = snapshot.load(filename=filename)
+        game.event_emitter = event_emitter
+        return game
+
     @property
     def random_person(self):
         """Return a random person living in the city of this gameplay instance."""
-        return random.choice(list(self.city.residents))
+        return self.rng.demographics.choice(list(self.city.residents))
 
     @property
     def random_company(self):
         """Return a random company in the city of this gameplay instance."""
-        return random.choice(list(self.city.companies))
+        return self.rng.demographics.choice(list(self.city.companies))
 
     def recent_events(self):
         """Pretty-print the last five in-game events (for debugging purposes)."""
-        for recent_event in self.events[-5:]:
+        for recent_event in self.events.recent(5):
             print recent_event
 
     def establish_setting(self):
         """Establish the city in which this gameplay instance will take place."""
-        # Generate a city plan with at least two tracts
-
-        import time
-
         print "Generating a town..."
         time.sleep(0.7)
+        self.generate_city()
+        self.establish_settlers()
+        # Now simulate to a week before gameplay
+        print "Simulating {n} years of history...".format(
+            n=self.config.date_gameplay_begins[0]-self.config.date_worldgen_begins[0]
+        )
+        time.sleep(1.2)
+
+        self.date_gameplay_begins = (1979, 8, 19)
+        self.date_worldgen_begins = (1839, 8, 19)  # Date world gen begins
+        self.enact_lo_fi_simulation(n_timesteps=self.n_timesteps_until_hi_fi_simulation_begins)
+        # Implant knowledge into everyone who is living to simulate knowledge
+        # phenomena that would have occurred during the lo-fi simulation but
+        # wasn't enacted due to reasons of computing efficiency
+        print "\nImplanting knowledge..."
+        self.implant_knowledge()
+        # Now simulate at full fidelity for the remaining week
+        self.enact_final_week_of_worldgen()
 
+    def generate_city(self):
+        """Generate a city plan with at least two tracts."""
         self.city = City(self)
         while len(self.city.tracts) < 2:
             self.city = City(self)
+
+    def establish_settlers(self):
+        """Have the city's first settlers establish farms (and potentially a coal mine or quarry) and a cemetery."""
+        rng = self.rng.demographics
         # Have families establish farms on all of the city tracts except one,
         # which will be a cemetery
         for i in xrange(len(self.city.tracts)-2):
@@ -93,11 +205,11 @@ class Game(object):
             Farm(owner=farmer)
             # farmer.move_into_the_city(hiring_that_instigated_move=farmer.occupation)  # SHOULD BE ABLE TO DELETE THIS
         # For the last tract, potentially have a quarry or coal mine instead of a farm
-        if random.random() < self.config.chance_of_a_coal_mine_at_time_of_town_founding:
+        if rng.random() < self.config.chance_of_a_coal_mine_at_time_of_town_founding:
             owner = PersonExNihilo(game=self, job_opportunity_impetus=Owner, spouse_already_generated=None)
             CoalMine(owner=owner)
             self.city.mayor = owner  # TODO actual mayor stuff
-        elif random.random() < self.config.chance_of_a_quarry_at_time_of_town_founding:
+        elif rng.random() < self.config.chance_of_a_quarry_at_time_of_town_founding:
             owner = PersonExNihilo(game=self, job_opportunity_impetus=Owner, spouse_already_generated=None)
             Quarry(owner=owner)
             self.city.mayor = owner  # TODO actual mayor stuff
@@ -114,26 +226,22 @@ class Game(object):
         Cemetery(owner=self.random_person)
         # Set the city's 'settlers' attribute
         self.city.settlers = set(self.city.residents)
-        # Now simulate to a week before gameplay
-        print "Simulating {n} years of history...".format(
-            n=self.config.date_gameplay_begins[0]-self.config.date_worldgen_begins[0]
-        )
-        time.sleep(1.2)
 
-        self.date_gameplay_begins = (1979, 8, 19)
-        self.date_worldgen_begins = (1839, 8, 19)  # Date world gen begins
+    @property
+    def n_timesteps_until_hi_fi_simulation_begins(self):
+        """Return the number of timesteps between now and the beginning of the week of hi-fi simulation before gameplay."""
         n_days_until_gameplay_begins = self.ordinal_date_that_gameplay_begins-self.ordinal_date
         n_days_until_hi_fi_sim_begins = n_days_until_gameplay_begins - 7
-        n_timesteps_until_hi_fi_sim_begins = n_days_until_hi_fi_sim_begins * 2
-        self.enact_lo_fi_simulation(n_timesteps=n_timesteps_until_hi_fi_sim_begins)
-        # Implant knowledge into everyone who is living to simulate knowledge
-        # phenomena that would have occurred during the lo-fi simulation but
-        # wasn't enacted due to reasons of computing efficiency
-        print "\nImplanting knowledge..."
+        return n_days_until_hi_fi_sim_begins * 2
+
+    def implant_knowledge(self):
+        """Implant knowledge into every living resident who is old enough to have accumulated it."""
         for p in self.city.residents:
             if p.age > 3:
                 p.implant_knowledge()
-        # Now simulate at full fidelity for the remaining week
+
+    def enact_final_week_of_worldgen(self):
+        """Simulate at full fidelity from the end of the lo-fi simulation up to the night that gameplay begins."""
         while self.ordinal_date < self.ordinal_date_that_gameplay_begins:
             self.enact_hi_fi_simulation()
             print "Simulating one {day_or_night} at full fidelity...".format(day_or_night=self.time_of_day)
@@ -142,27 +250,70 @@ class Game(object):
 
     def _generate_name_for_city(self):
         """Generate a name for the city."""
-        if random.random() < self.config.chance_city_gets_named_for_founder:
+        if self.rng.citygen.random() < self.config.chance_city_gets_named_for_founder:
             name = self.city.mayor.last_name
         else:
-            name = Names.a_place_name()
+            name = Names.a_place_name(rng=self.rng.citygen)
         return name
 
     def assign_event_number(self, new_event):
         """Assign an event number to some event, to allow for precise ordering of events that happened same timestep.
 
-        Also add the event to a listing of all in-game events; this facilitates debugging.
+        Also add the event to the store of all in-game events; this facilitates debugging.
         """
         self.events.append(new_event)
         self.event_number += 1
         return self.event_number
 
-    @staticmethod
-    def get_random_day_of_year(year):
+    def register_pregnancy(self, person):
+        """Register a person who has just conceived, so that they will give birth on their due date."""
+        heapq.heappush(self.pregnancies, (person.due_date, person.id, person))
+
+    def register_birthday(self, person):
+        """Add a person who has just been born or has just come to town to the listings of birthdays."""
+        try:
+            self.birthdays[person.birthday].add(person)
+        except KeyError:
+            self.birthdays[person.birthday] = {person}
+        # Leap-year babies also celebrate on every March 1 (see Game.celebrate_birthdays())
+        for day in (person.birthday, (3, 1)) if person.birthday == (2, 29) else (person.birthday,):
+            if day not in self.n_present_people_celebrating_birthday_on:
+                self.n_present_people_celebrating_birthday_on[day] = 0
+                bisect.insort(self.days_with_birthday_celebrations, day)
+            self.n_present_people_celebrating_birthday_on[day] += 1
+
+    def unregister_birthday(self, person):
+        """Remove a person who is about to die or leave town from the calendar of birthday celebrations."""
+        if not person.present:
+            return
+        for day in (person.birthday, (3, 1)) if person.birthday == (2, 29) else (person.birthday,):
+            self.n_present_people_celebrating_birthday_on[day] -= 1
+            if not self.n_present_people_celebrating_birthday_on[day]:
+                del self.n_present_people_celebrating_birthday_on[day]
+                self.days_with_birthday_celebrations.remove(day)
+
+    def deliver_babies_that_are_due(self):
+        """Have every resident whose due date has come give birth (or possibly wait until night, if it's day)."""
+        rng = self.rng.demographics
+        still_due = []
+        while self.pregnancies and self.pregnancies[0][0] <= self.ordinal_date:
+            due_date, person_id, person = heapq.heappop(self.pregnancies)
+            # Skip pregnancies that have already ended, e.g., in a birth during retconning,
+            # and people who are no longer living in town
+            if not person.pregnant or person.due_date != due_date or person not in self.city.residents:
+                continue
+            if self.time_of_day == 'day' and rng.random() >= 0.5:
+                still_due.append((due_date, person_id, person))
+            else:
+                person.give_birth()
+        for pregnancy in still_due:
+            heapq.heappush(self.pregnancies, pregnancy)
+
+    def get_random_day_of_year(self, year):
         """Return a randomly chosen day in the given year."""
         ordinal_date_on_jan_1_of_this_year = datetime.date(year, 1, 1).toordinal()
         ordinal_date = (
-            ordinal_date_on_jan_1_of_this_year + random.randint(0, 365)
+            ordinal_date_on_jan_1_of_this_year + self.rng.demographics.randint(0, 365)
         )
         datetime_object = datetime.date.fromordinal(ordinal_date)
         month, day = datetime_object.month, datetime_object.day
@@ -225,131 +376,161 @@ class Game(object):
 
         Event: 'tott_lo_fi_event'
         """
-        last_simulated_day = self.ordinal_date
+        if self.last_simulated_day is None:
+            self.last_simulated_day = self.ordinal_date
+        # Mental models don't deteriorate during lo-fi simulation, so there's no point in tracking them
+        self.deterioration_scheduler.suspend()
+        if self.config.lo_fi_simulation_engine == 'scheduled':
+            LoFiScheduler(game=self).run(n_timesteps=n_timesteps)
+            return
+        rng = self.rng.demographics
+        profiler = self.profiler
         chance_of_a_timestep_being_simulated = self.config.chance_of_a_timestep_being_simulated
-        chance_an_unemployed_person_departs_on_a_simulated_timestep = (
-            self.config.chance_an_unemployed_person_departs_on_a_simulated_timestep
-        )
         for i in xrange(n_timesteps):
+            profiler.begin_timestep(simulation='lo_fi')
             self.advance_time()
+            profiler.lap('advance_time')
             # Potentially have a new business open or an existing business close
             self.potentially_establish_a_new_business()
             self.potentially_shut_down_businesses()
+            profiler.lap('businesses')
             # Simulate births, even if this day will not actually be simulated
-            for person in list(self.city.residents):
-                if person.pregnant:
-                    if self.ordinal_date >= person.due_date:
-                        if self.time_of_day == 'day':
-                            if random.random() < 0.5:
-                                person.give_birth()
-                        else:
-                            person.give_birth()
+            self.deliver_babies_that_are_due()
+            profiler.lap('births')
             # Potentially simulate the timestep
-            if random.random() < chance_of_a_timestep_being_simulated:
-                # Potentially build new businesses
-                for person in list(self.city.residents):
-                    if person.present:
-                        # Need to check this because an earlier iteration may have caused this
-                        # person to live the city (e.g., if their parent died)
-                        if person.marriage:
-                            chance_they_are_trying_to_conceive_this_year = (
-                                self.config.function_to_determine_chance_married_couple_are_trying_to_conceive(
-                                    n_kids=len(person.marriage.children_produced)
-                                )
-                            )
-                            chance_they_are_trying_to_conceive_this_year /= chance_of_a_timestep_being_simulated*365
-                            if random.random() < chance_they_are_trying_to_conceive_this_year:
-                                person.have_sex(partner=person.spouse, protection=False)
-                            elif random.random() < self.config.chance_a_divorce_happens_some_timestep:
-                                lawyer = person.contract_person_of_certain_occupation(occupation_in_question=Lawyer)
-                                lawyer = None if not lawyer else lawyer.occupation
-                                Divorce(subjects=(person, person.spouse), lawyer=lawyer)
-                        if person.age > 68 and random.random() < self.config.chance_someone_dies_some_timestep:
-                            # TODO make this era-accurate (i.e., different death rates in 1910 than in 1970)
-                            person.die(cause_of_death="Natural causes")
-                        elif person.occupation and person.age > max(65, random.random() * 100):
-                            person.retire()
-                        # Simulate unemployed people searching for work (and potentially getting a college education)
-                        elif (person.ready_to_work and not person.occupation and not person.retired and
-                                not (person.female and person.kids_at_home)):
-                            person.look_for_work()
-                            if not person.occupation:  # Means look_for_work() didn't succeed
-                                if (not person.college_graduate and person.age > 22 and
-                                        person.male if self.year > 1920 else True):
-                                    person.college_graduate = True
-                                elif random.random() < chance_an_unemployed_person_departs_on_a_simulated_timestep:
-                                    person.depart_city()
-                        elif (person.male and person.occupation and person not in person.home.owners and
-                              random.random() > 0.005):
-                            person.move_out_of_parents()
-                days_since_last_simulated_day = self.ordinal_date-last_simulated_day
-                # Reset all Relationship interacted_this_timestep attributes
-                for person in list(self.city.residents):
-                    for other_person in person.relationships:
-                        person.relationships[other_person].interacted_this_timestep = False
-                # Have people go to the location they will be at this timestep
-                for person in list(self.city.residents):
-                    person.routine.enact()
-                # Have people initiate social interactions with one another
-                for person in list(self.city.residents):
-                    # Person may have married (during an earlier iteration of this loop) and
-                    # then immediately departed because the new couple could not find home,
-                    # so we still have to make sure they actually live in the city currently before
-                    # having them socialize
-                    if person in self.city.residents:
-                        if person.age > 3:  # Must be at least four years old to socialize
-                            person.socialize(missing_timesteps_to_account_for=days_since_last_simulated_day*2)
-                last_simulated_day = self.ordinal_date
-            # Prepare the events that will be output.
-            recent_event = random.choice(self.events[-10:])
-            recent_event_str = str(recent_event)[:94]
-            if self.event_emitter: # Write out samples from the event stream to an emitter.
-                self.event_emitter.emit('tott_lo_fi_event', recent_event_str)
-                time.sleep(0.0001)
-            else: # Write out samples from the event stream to stdout
-                try:
-                    sys.stdout.write('\r' + recent_event_str.ljust(94))
-                    sys.stdout.flush()
-                except (NameError, IndexError):  # This won't work for the first iteration of the loop
-                    pass
-
+            if rng.random() < chance_of_a_timestep_being_simulated:
+                self.enact_lo_fi_timestep()
+            self.report_lo_fi_progress()
+            profiler.lap('progress_ticker')
+            profiler.end_timestep(game=self)
+
+    def enact_lo_fi_timestep(self):
+        """Simulate the current timestep, as one of the timesteps that get sampled during lo-fi simulation."""
+        rng = self.rng.demographics
+        profiler = self.profiler
+        chance_of_a_timestep_being_simulated = self.config.chance_of_a_timestep_being_simulated
+        chance_an_unemployed_person_departs_on_a_simulated_timestep = (
+            self.config.chance_an_unemployed_person_departs_on_a_simulated_timestep
+        )
+        # Simulate demographic changes
+        for person in list(self.city.residents):
+            if person.present:
+                # Need to check this because an earlier iteration may have caused this
+                # person to live the city (e.g., if their parent died)
+                if person.marriage:
+                    chance_they_are_trying_to_conceive_this_year = (
+                        self.config.function_to_determine_chance_married_couple_are_trying_to_conceive(
+                            n_kids=len(person.marriage.children_produced)
+                        )
+                    )
+                    chance_they_are_trying_to_conceive_this_year /= chance_of_a_timestep_being_simulated*365
+                    if rng.random() < chance_they_are_trying_to_conceive_this_year:
+                        person.have_sex(partner=person.spouse, protection=False)
+                    elif rng.random() < self.config.chance_a_divorce_happens_some_timestep:
+                        lawyer = person.contract_person_of_certain_occupation(occupation_in_question=Lawyer)
+                        lawyer = None if not lawyer else lawyer.occupation
+                        Divorce(subjects=(person, person.spouse), lawyer=lawyer)
+                if person.age > 68 and rng.random() < self.config.chance_someone_dies_some_timestep:
+                    # TODO make this era-accurate (i.e., different death rates in 1910 than in 1970)
+                    person.die(cause_of_death="Natural causes")
+                elif person.occupation and person.age > max(65, rng.random() * 100):
+                    person.retire()
+                # Simulate unemployed people searching for work (and potentially getting a college education)
+                elif (person.ready_to_work and not person.occupation and not person.retired and
+                        not (person.female and person.kids_at_home)):
+                    person.look_for_work()
+                    if not person.occupation:  # Means look_for_work() didn't succeed
+                        if (not person.college_graduate and person.age > 22 and
+                                person.male if self.year > 1920 else True):
+                            person.college_graduate = True
+                        elif rng.random() < chance_an_unemployed_person_departs_on_a_simulated_timestep:
+                            person.depart_city()
+                elif (person.male and person.occupation and person not in person.home.owners and
+                      rng.random() > 0.005):
+                    person.move_out_of_parents()
+        profiler.lap('demographics')
+        days_since_last_simulated_day = self.ordinal_date-self.last_simulated_day
+        # Start a new timestep of interactions (see Relationship.interacted_this_timestep)
+        self.simulated_timestep_number += 1
+        # Have people go to the location they will be at this timestep
+        for person in list(self.city.residents):
+            person.routine.enact()
+            profiler.lap('routine')
+        # Have people initiate social interactions with one another
+        for person in list(self.city.residents):
+            # Person may have married (during an earlier iteration of this loop) and
+            # then immediately departed because the new couple could not find home,
+            # so we still have to make sure they actually live in the city currently before
+            # having them socialize
+            if person in self.city.residents:
+                if person.age > 3:  # Must be at least four years old to socialize
+                    person.socialize(missing_timesteps_to_account_for=days_since_last_simulated_day*2)
+                    profiler.lap('socialize')
+        self.last_simulated_day = self.ordinal_date
+
+    def report_lo_fi_progress(self):
+        """Write out a sample from the event stream, as a ticker of the progress of lo-fi simulation."""
+        rng = self.rng.cosmetic
+        recent_event = rng.choice(self.events.recent(10))
+        recent_event_str = str(recent_event)[:94]
+        if self.event_emitter: # Write out samples from the event stream to an emitter.
+            self.event_emitter.emit('tott_lo_fi_event', recent_event_str)
+            time.sleep(0.0001)
+        else: # Write out samples from the event stream to stdout
+            try:
+                sys.stdout.write('\r' + recent_event_str.ljust(94))
+                sys.stdout.flush()
+            except (NameError, IndexError):  # This won't work for the first iteration of the loop
+                pass
 
     def potentially_establish_a_new_business(self):
         """Potentially have a new business get constructed in town."""
-        config = self.config
+        rng = self.rng.demographics
+        if not self.potentially_establish_an_apartment_complex():
+            if rng.random() < self.config.chance_a_business_opens_some_timestep:
+                self.establish_a_new_business()
+
+    def potentially_establish_an_apartment_complex(self):
+        """Have an apartment complex open up if the town needs one, and return whether one did."""
         # If there's less than 30 vacant homes in this city and no apartment complex
         # yet, have one open up
         if len(self.city.vacant_lots) < 30 and not self.city.businesses_of_type('ApartmentComplex'):
             owner = self._determine_who_will_establish_new_business(business_type=ApartmentComplex)
             ApartmentComplex(owner=owner)
-        elif random.random() < config.chance_a_business_opens_some_timestep:
-            all_business_types = Business.__subclasses__()
-            type_of_business_that_will_open = None
-            tries = 0
-            while not type_of_business_that_will_open:
-                tries += 1
-                randomly_selected_type = random.choice(all_business_types)
-                advent, demise, min_pop = config.business_types_advent_demise_and_minimum_population[
-                    randomly_selected_type
-                ]
-                # Check if the business type is era-appropriate
-                if advent < self.year < demise and self.city.population > min_pop:
-                    # Check if there aren't already too many businesses of this type in town
-                    max_number_for_this_type = config.max_number_of_business_types_at_one_time[randomly_selected_type]
-                    if (len(self.city.businesses_of_type(randomly_selected_type.__name__)) <
-                            max_number_for_this_type):
-                        # Lastly, if this is a business that only forms on a tract, make sure
-                        # there is a vacant tract for it to be established upon
-                        need_tract = randomly_selected_type in config.companies_that_get_established_on_tracts
-                        if (need_tract and self.city.vacant_tracts) or not need_tract:
-                            type_of_business_that_will_open = randomly_selected_type
-                if self.city.population < 50 or tries > 10:  # Just not ready for more businesses yet -- grow naturally
-                    break
-            if type_of_business_that_will_open in config.public_company_types:
-                type_of_business_that_will_open(owner=self.city.mayor)
-            elif type_of_business_that_will_open:
-                owner = self._determine_who_will_establish_new_business(business_type=type_of_business_that_will_open)
-                type_of_business_that_will_open(owner=owner)
+            return True
+        return False
+
+    def establish_a_new_business(self):
+        """Have a new business of a randomly selected (but era-appropriate) type get constructed in town."""
+        config = self.config
+        rng = self.rng.demographics
+        all_business_types = Business.__subclasses__()
+        type_of_business_that_will_open = None
+        tries = 0
+        while not type_of_business_that_will_open:
+            tries += 1
+            randomly_selected_type = rng.choice(all_business_types)
+            advent, demise, min_pop = config.business_types_advent_demise_and_minimum_population[
+                randomly_selected_type
+            ]
+            # Check if the business type is era-appropriate
+            if advent < self.year < demise and self.city.population > min_pop:
+                # Check if there aren't already too many businesses of this type in town
+                max_number_for_this_type = config.max_number_of_business_types_at_one_time[randomly_selected_type]
+                if (len(self.city.businesses_of_type(randomly_selected_type.__name__)) <
+                        max_number_for_this_type):
+                    # Lastly, if this is a business that only forms on a tract, make sure
+                    # there is a vacant tract for it to be established upon
+                    need_tract = randomly_selected_type in config.companies_that_get_established_on_tracts
+                    if (need_tract and self.city.vacant_tracts) or not need_tract:
+                        type_of_business_that_will_open = randomly_selected_type
+            if self.city.population < 50 or tries > 10:  # Just not ready for more businesses yet -- grow naturally
+                break
+        if type_of_business_that_will_open in config.public_company_types:
+            type_of_business_that_will_open(owner=self.city.mayor)
+        elif type_of_business_that_will_open:
+            owner = self._determine_who_will_establish_new_business(business_type=type_of_business_that_will_open)
+            type_of_business_that_will_open(owner=owner)
 
     def _determine_who_will_establish_new_business(self, business_type):
         """Select a person who will establish a new business of the given type."""
@@ -402,6 +583,7 @@ class Game(object):
     def potentially_shut_down_businesses(self):
         """Potentially have a new business get constructed in town."""
         config = self.config
+        rng = self.rng.demographics
         chance_a_business_shuts_down_this_timestep = config.chance_a_business_closes_some_timestep
         chance_a_business_shuts_down_on_timestep_after_its_demise = (
             # Once its anachronistic, like a Dairy in 1960
@@ -409,10 +591,10 @@ class Game(object):
         )
         for business in list(self.city.companies):
             if business.demise <= self.year:
-                if random.random() < chance_a_business_shuts_down_on_timestep_after_its_demise:
+                if rng.random() < chance_a_business_shuts_down_on_timestep_after_its_demise:
                     if business.__class__ not in config.public_company_types:
                         business.go_out_of_business(reason=None)
-            elif random.random() < chance_a_business_shuts_down_this_timestep:
+            elif rng.random() < chance_a_business_shuts_down_this_timestep:
                 if business.__class__ not in config.public_company_types:
                     if not (
                         # Don't shut down an apartment complex with people living in it,
@@ -424,25 +606,20 @@ class Game(object):
 
     def enact_hi_fi_simulation(self, timestep_during_gameplay=False):
         """Advance to the next day/night cycle."""
+        profiler = self.profiler
+        profiler.begin_timestep(simulation='hi_fi')
         self.advance_time()
+        profiler.lap('advance_time')
         # this_is_the_night_in_question = (
         #     self.ordinal_date == self.ordinal_date_that_the_founder_dies and self.time_of_day == "night"
         # )
-        # Decay all beliefs from the time passing since yesterday
-        if self.time_of_day == "day":
-            # NOTE: COULD PROBABLY SPEED UP THINGS IN POLISHED GAME BY
-            # PUTTING CODE FOR THIS ROUTINE DIRECTLY HERE
-            for person in self.city.residents:
-                for belief in person.all_belief_facets:
-                    belief.decay_strength()
-        # Reset all Relationship interacted_this_timestep attributes
-        for person in self.city.residents:
-            for other_person in person.relationships:
-                person.relationships[other_person].interacted_this_timestep = False
+        # Start a new timestep of interactions (see Relationship.interacted_this_timestep)
+        self.simulated_timestep_number += 1
         # Have people go to the location they will be at this timestep
         for person in self.city.residents:
             if not (timestep_during_gameplay and person is self.pc):  # Don't sim where the PC is
                 person.routine.enact()
+                profiler.lap('routine')
         # Have people observe their surroundings, which will cause knowledge to
         # build up, and have them socialize with other people also at that location --
         # this will cause relationships to form/progress and knowledge to propagate
@@ -450,20 +627,32 @@ class Game(object):
             if not (timestep_during_gameplay and person is self.pc):
                 if person.age > 3:
                     person.observe()
+                    profiler.lap('observe')
                     person.socialize()
+                    profiler.lap('socialize')
         # Deteriorate people's mental models from time passing
+        deterioration_is_scheduled = self.config.mental_model_deterioration_engine == 'scheduled'
+        if deterioration_is_scheduled:
+            self.deterioration_scheduler.enact_deteriorations_due(timestep_during_gameplay=timestep_during_gameplay)
+            profiler.lap('deteriorate')
         for person in self.city.residents:
             if not (timestep_during_gameplay and person is self.pc):
-                for thing in list(person.mind.mental_models):
-                    # People's mental models of themselves, their homes, and their workplaces don't deteriorate
-                    if thing not in {person, person.home, None if not person.occupation else person.occupation.company}:
-                        person.mind.mental_models[thing].deteriorate()
+                if not deterioration_is_scheduled:
+                    for thing in list(person.mind.mental_models):
+                        # People's mental models of themselves, their homes, and their workplaces don't deteriorate
+                        if thing not in {
+                            person, person.home, None if not person.occupation else person.occupation.company
+                        }:
+                            person.mind.mental_models[thing].deteriorate()
+                    profiler.lap('deteriorate')
                 if self.ordinal_date == self.ordinal_date_that_gameplay_begins:
                     person.reflect()
+                    profiler.lap('reflect')
             # But also have them reflect accurately on their own features --
             # COMMENTED OUT FOR NOW BECAUSE IT GETS MUCH FASTER WITHOUT THIS
             # if person.age > 3:
             #     person.reflect()
+        profiler.end_timestep(game=self)
 
     def enact_no_fi_simulation(self):
         """Enact people's routines only, to make sure they're where they're supposed to be on a timestep."""
@@ -474,35 +663,52 @@ class Game(object):
 
     def advance_time(self):
         """Advance time of day and date, if it's a new day."""
+        rng = self.rng.routines
         self.time_of_day = "night" if self.time_of_day == "day" else "day"
-        self.weather = random.choice(['good', 'bad'])
+        self.weather = rng.choice(['good', 'bad'])
         if self.time_of_day == "day":
             self.ordinal_date += 1
-            new_date_tuple = datetime.date.fromordinal(self.ordinal_date)
-            if new_date_tuple.year != self.year:
-                # Happy New Year
-                self.true_year = new_date_tuple.year
-                self.year = new_date_tuple.year
-                # print self.year, len(self.city.vacant_lots), len(self.city.vacant_homes), self.city.pop
-            self.month = new_date_tuple.month
-            self.day = new_date_tuple.day
-            self.date = self.get_date()
-            # Age any present (not dead, not departed) character whose birthday is today
-            if (self.month, self.day) not in self.birthdays:
-                self.birthdays[(self.month, self.day)] = set()
-            else:
-                for person in self.birthdays[(self.month, self.day)]:
-                    if person.present:
-                        person.grow_older()
-                # Don't forget leap-year babies
-                if (self.month, self.day) == (3, 1):
-                    for person in self.birthdays[(2, 29)]:
-                        if person.present:
-                            person.grow_older()
+            self._update_date()
+            self.celebrate_birthdays()
         else:
             self.date = self.get_date()
         # Lastly, set a new random number for this timestep
-        self.random_number_this_timestep = random.random()
+        self.random_number_this_timestep = rng.random()
+
+    def skip_to_timestep(self, ordinal_date, time_of_day):
+        """Advance time directly to the given timestep, without aging anyone whose birthday gets skipped over."""
+        rng = self.rng.routines
+        self.time_of_day = time_of_day
+        self.weather = rng.choice(['good', 'bad'])
+        self.ordinal_date = ordinal_date
+        self._update_date()
+        self.random_number_this_timestep = rng.random()
+
+    def _update_date(self):
+        """Update the attributes that express the current date to match the current ordinal date."""
+        new_date_tuple = datetime.date.fromordinal(self.ordinal_date)
+        if new_date_tuple.year != self.year:
+            # Happy New Year
+            self.true_year = new_date_tuple.year
+            self.year = new_date_tuple.year
+            # print self.year, len(self.city.vacant_lots), len(self.city.vacant_homes), self.city.pop
+        self.month = new_date_tuple.month
+        self.day = new_date_tuple.day
+        self.date = self.get_date()
+
+    def celebrate_birthdays(self):
+        """Age any present (not dead, not departed) character whose birthday is today."""
+        if (self.month, self.day) not in self.birthdays:
+            self.birthdays[(self.month, self.day)] = set()
+        else:
+            for person in self.birthdays[(self.month, self.day)]:
+                if person.present:
+                    person.grow_older()
+            # Don't forget leap-year babies
+            if (self.month, self.day) == (3, 1):
+                for person in self.birthdays[(2, 29)]:
+                    if person.present:
+                        person.grow_older()
 
     def find(self, name):
         """Return person living in this city with that name."""
@@ -0,0 +1,76 @@
+import functools
+
+
+def kinship_cache_of(person):
+    """Return the dictionary in which the given person's kinship views and relations are cached.
+
+    The cached kinship of everyone is thrown out together whenever the family tree changes, which
+    happens when someone is born, is adopted, marries, divorces, or dies (see Game.genealogy_version).
+
+    @param person: The person whose kinship cache is to be returned.
+    """
+    genealogy_version = person.game.genealogy_version
+    kinship_cache = person.kinship_cache
+    if kinship_cache is None or kinship_cache[0] != genealogy_version:
+        kinship_cache = person.kinship_cache = (genealogy_version, {})
+    return kinship_cache[1]
+
+
+class KinshipView(object):
+    """A decorator that turns a method computing some kind of kin of a person into a lazily evaluated attribute.
+
+    People only store the edges of the town's family tree -- their (legal and biological) parents,
+    their kids, and their marriages -- and everything else (siblings, cousins, extended family,
+    and so forth) is computed from those edges when it is first asked for, and then cached (see
+    kinship_cache_of); because many different people read the same cached kin, these are returned
+    as frozensets.
+    """
+
+    def __init__(self, compute_kin):
+        """Initialize a KinshipView object.
+
+        @param compute_kin: A method that takes a person and returns an iterable of their kin of
+                            some kind.
+        """
+        self.compute_kin = compute_kin
+        self.name = compute_kin.__name__
+        self.__doc__ = compute_kin.__doc__
+
+    def __get__(self, person, owner):
+        """Return the given person's kin of this kind, computing them if they aren't cached."""
+        if person is None:
+            return self
+        kinship_cache = kinship_cache_of(person)
+        try:
+            return kinship_cache[self.name]
+        except KeyError:
+            kin = kinship_cache[self.name] = frozenset(self.compute_kin(person))
+            return kin
+
+
+def kinship_relation(compute_relation):
+    """A decorator that memoizes a method computing how some other person is related to a person by kinship.
+
+    The relations that a person has computed are cached alongside their kinship views, keyed by the
+    other person, and so they are thrown out under the same circumstances. Because the cached
+    relations are shared by everyone who asks for them, the decorated method must return something
+    immutable.
+
+    @param compute_relation: A method that takes a person and some other person and returns the
+                             kinship relation of the latter to the former.
+    """
+    name = compute_relation.__name__
+
+    @functools.wraps(compute_relation)
+    def relation(self, person):
+        kinship_cache = kinship_cache_of(self)
+        try:
+            relations = kinship_cache[name]
+        except KeyError:
+            relations = kinship_cache[name] = {}
+        try:
+            return relations[person]
+        except KeyError:
+            relation_to_self = relations[person] = compute_relation(self, person)
+            return relation_to_self
+    return relation
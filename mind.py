@@ -1,6 +1,3 @@
-import random
-
-
 class Mind(object):
     """A person's mind."""
 
@@ -27,12 +24,13 @@ class Mind(object):
     def _init_memory(self):
         """Determine a person's base memory capability, given their parents'."""
         config = self.person.game.config
-        if random.random() < config.memory_heritability:
-            takes_after = random.choice([self.person.mother, self.person.father])
-            memory = random.normalvariate(takes_after.mind.memory, config.memory_heritability_sd)
+        rng = self.person.game.rng.demographics
+        if rng.random() < config.memory_heritability:
+            takes_after = rng.choice([self.person.mother, self.person.father])
+            memory = rng.normalvariate(takes_after.mind.memory, config.memory_heritability_sd)
         else:
             takes_after = None
-            memory = random.normalvariate(config.memory_mean, config.memory_sd)
+            memory = rng.normalvariate(config.memory_mean, config.memory_sd)
         if self.person.male:  # Men have slightly worse memory (studies show)
             memory -= config.memory_sex_diff
         if memory > config.memory_cap:
@@ -45,7 +43,7 @@ class Mind(object):
     def _init_ex_nihilo_memory(self):
         """Determine this person's base memory capability."""
         config = self.person.game.config
-        memory = random.normalvariate(config.memory_mean, config.memory_sd)
+        memory = self.person.game.rng.demographics.normalvariate(config.memory_mean, config.memory_sd)
         if self.person.male:  # Men have slightly worse memory (studies show)
             memory -= config.memory_sex_diff
         if memory > config.memory_cap:
@@ -86,7 +84,7 @@ class Mind(object):
         if not all_matches:
             return None
         # Return the most salient match (meaning most salient to this person)
-        most_salient_match = max(all_matches, key=lambda match: self.person.salience_of_other_people.get(match, 0.0))
+        most_salient_match = max(all_matches, key=self.person.salience_of)
         return most_salient_match
 
     def associate(self, artifact):
@@ -174,6 +172,10 @@ class Feature(float):
         """Do float stuff."""
         return float.__new__(cls, value)
 
+    def __getnewargs__(self):
+        """Return the arguments to pass to __new__() when unpickling (other attributes get restored after)."""
+        return float(self), None
+
 
 class Receptor(object):
     """A signal receptor in the mind of a person.
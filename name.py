@@ -30,6 +30,10 @@ class Name(str):
         """Do str stuff."""
         return str.__new__(cls, value)
 
+    def __getnewargs__(self):
+        """Return the arguments to pass to __new__() when unpickling (other attributes get restored after)."""
+        return str(self), None, None, None
+
     def _get_ethnicity_of_this_name(self):
         """Return the ethnicity of this name.
 
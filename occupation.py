@@ -1,8 +1,9 @@
 import string
 from event import *
+from rng import StablyHashed
 
 
-class Occupation(object):
+class Occupation(StablyHashed):
     """An occupation at a business in a city."""
 
     def __init__(self, person, company, shift):
@@ -38,16 +39,16 @@ class Occupation(object):
         salience_change_for_new_coworker = (
             self.person.game.config.salience_increment_from_relationship_change['coworker']
         )
-        for coworker in person.coworkers:
-            person.update_salience_of(entity=coworker, change=salience_change_for_new_coworker)
-            coworker.update_salience_of(entity=person, change=salience_change_for_new_coworker)
-        # Update the salience value for this person held by everyone else in the city to
-        # reflect their new job level
+        person.update_salience_of_everyone_in(entities=person.coworkers, change=salience_change_for_new_coworker)
+        person.update_salience_of_for_everyone_in(
+            people=person.coworkers, entity=person, change=salience_change_for_new_coworker
+        )
+        # Update this person's public prominence (i.e., their salience to everyone else in the
+        # city) to reflect their new job level
         boost_in_salience_for_this_job_level = self.person.game.config.salience_job_level_boost(
             job_level=self.level
         )
-        for resident in company.city.residents:
-            resident.update_salience_of(entity=self.person, change=boost_in_salience_for_this_job_level)
+        person.update_public_prominence(change=boost_in_salience_for_this_job_level)
         # Update all relationships this person has to reflect the new job-level difference
         # between this person and the respective other person
         for other_person in self.person.relationships:
@@ -113,13 +114,13 @@ class Occupation(object):
                 config.salience_increment_from_relationship_change["former coworker"] -
                 config.salience_increment_from_relationship_change["coworker"]
             )
-            for employee in self.company.employees:
-                employee.person.update_salience_of(
-                    entity=self.person, change=change_in_salience_for_former_coworker
-                )
-                self.person.update_salience_of(
-                    entity=employee.person, change=change_in_salience_for_former_coworker
-                )
+            former_coworkers = [employee.person for employee in self.company.employees]
+            self.person.update_salience_of_for_everyone_in(
+                people=former_coworkers, entity=self.person, change=change_in_salience_for_former_coworker
+            )
+            self.person.update_salience_of_everyone_in(
+                entities=former_coworkers, change=change_in_salience_for_former_coworker
+            )
         # This position is now vacant, so now have the company that this person worked
         # for fill that now vacant position (which may cause a hiring chain) unless
         # this position is supplemental (i.e., not vital to this businesses' basic
@@ -146,16 +147,12 @@ class Occupation(object):
         if reason.__class__.__name__ == "Retirement":
             self.person.coworkers = set()
         else:
-            # If they're not retiring, decrement their salience to everyone else
-            # commensurate to the job level of this position
+            # If they're not retiring, decrement their public prominence (i.e., their salience
+            # to everyone else) commensurate to the job level of this position
             change_in_salience_for_this_job_level = self.person.game.config.salience_job_level_boost(
                 job_level=self.level
             )
-            for resident in self.company.city.residents:
-                # Note the minus sign here
-                resident.update_salience_of(
-                    entity=self.person, change=-change_in_salience_for_this_job_level
-                )
+            self.person.update_public_prominence(change=-change_in_salience_for_this_job_level)  # Note minus sign
         # Finally, if this was a Lawyer position, have the law firm rename itself to
         # no longer include this person's name
         if self.__class__ is Lawyer:
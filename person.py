@@ -1,5 +1,5 @@
-import random
 import heapq
+import operator
 import datetime
 from corpora import Names
 import event
@@ -14,9 +14,58 @@ from relationship import Acquaintance
 from evidence import Reflection, Observation, Lie, Statement
 from belief import *
 import face
+from rng import StablyHashed
+from genealogy import KinshipView, kinship_relation
 
 
-class Person(object):
+# The feature types for which Person.get_knowledge_about_person() returns the belief facet itself
+FEATURE_TYPES_OF_KNOWLEDGE_HELD_AS_IS = frozenset(
+    ("first name", "middle name", "last name", "job title", "job shift") + FaceBelief.feature_types
+)
+
+
+def rank_most_salient(entities_and_saliences, size):
+    """Return a ranking of the (at most) size most salient of the given entities.
+
+    @param entities_and_saliences: An iterable of (entity, salience) tuples.
+    @param size: The number of entities to rank.
+    @return: A list of [salience, entity] entries, ordered by descending salience.
+    """
+    return heapq.nlargest(
+        size, ([salience, entity] for entity, salience in entities_and_saliences), key=operator.itemgetter(0)
+    )
+
+
+def update_ranking_of_most_salient(ranking, entity, salience, number_of_entities, size):
+    """Update a ranking produced by rank_most_salient() to reflect a new salience value for an entity.
+
+    @param ranking: The ranking to update (in place).
+    @param entity: The entity whose salience has changed.
+    @param salience: The new salience value of that entity.
+    @param number_of_entities: The number of entities that the ranking was drawn from (including
+                               this one, if it is new).
+    @param size: The number of entities to rank.
+    @return: The updated ranking, or None if it can no longer be updated in place (because someone
+             missing from it may now outrank entity) and must be rebuilt.
+    """
+    for entry in ranking:
+        if entry[1] is entity:
+            if salience < entry[0] and len(ranking) < number_of_entities:
+                return None
+            entry[0] = salience
+            break
+    else:
+        if len(ranking) < size:
+            ranking.append([salience, entity])
+        elif salience > ranking[-1][0]:
+            ranking[-1] = [salience, entity]
+        else:
+            return ranking
+    ranking.sort(key=operator.itemgetter(0), reverse=True)
+    return ranking
+
+
+class Person(StablyHashed):
     """A person living in a city of a gameplay instance."""
 
     def __init__(self, game, birth):
@@ -58,14 +107,14 @@ class Person(object):
             self.adult = False
             self.ready_to_work = False
         # Set sex
-        self.male, self.female = (True, False) if random.random() < 0.5 else (False, True)
+        self.male, self.female = (True, False) if self.game.rng.demographics.random() < 0.5 else (False, True)
         self.tag = ''  # Allows players to tag characters with arbitrary strings
         # Set misc attributes
         self.alive = True
         self.death_year = None
         self.home = None  # Must come before setting routine
         # Set biological characteristics
-        self.infertile = self._init_fertility(male=self.male, config=self.game.config)
+        self.infertile = self._init_fertility(male=self.male, config=self.game.config, rng=self.game.rng.demographics)
         self.attracted_to_men, self.attracted_to_women = (
             self._init_sexuality()
         )
@@ -87,58 +136,17 @@ class Person(object):
         self.suffix = None
         self.maiden_name = None
         self.named_for = (None, None)  # From whom first and middle name originate, respectively
-        # Prepare familial attributes that get populated by self.init_familial_attributes()
-        self.ancestors = set()  # Biological only
-        self.descendants = set()  # Biological only
-        self.immediate_family = set()
-        self.extended_family = set()
-        self.greatgrandparents = set()
-        self.grandparents = set()
-        self.aunts = set()
-        self.uncles = set()
-        self.siblings = set()
-        self.full_siblings = set()
-        self.half_siblings = set()
-        self.brothers = set()
-        self.full_brothers = set()
-        self.half_brothers = set()
-        self.sisters = set()
-        self.full_sisters = set()
-        self.half_sisters = set()
-        self.cousins = set()
+        # Prepare the edges of the family tree that this person is part of; all other familial
+        # attributes (siblings, cousins, extended family, etc.) are kinship views that get computed
+        # from these edges as needed (see genealogy.KinshipView)
         self.kids = set()
         self.sons = set()
         self.daughters = set()
-        self.nephews = set()
-        self.nieces = set()
-        self.grandchildren = set()
-        self.grandsons = set()
-        self.granddaughters = set()
-        self.greatgrandchildren = set()
-        self.greatgrandsons = set()
-        self.greatgranddaughters = set()
-        self.bio_parents = set()
-        self.bio_grandparents = set()
-        self.bio_siblings = set()
-        self.bio_full_siblings = set()
-        self.bio_half_siblings = set()
-        self.bio_brothers = set()
-        self.bio_full_brothers = set()
-        self.bio_half_brothers = set()
-        self.bio_sisters = set()
-        self.bio_full_sisters = set()
-        self.bio_half_sisters = set()
-        self.bio_immediate_family = set()
-        self.bio_greatgrandparents = set()
-        self.bio_uncles = set()
-        self.bio_aunts = set()
-        self.bio_cousins = set()
-        self.bio_nephews = set()
-        self.bio_nieces = set()
-        self.bio_ancestors = set()
-        self.bio_extended_family = set()
-        # Set familial attributes; update those of family members
-        self._init_familial_attributes()
+        self.marriage = None
+        self.marriages = []
+        self.divorces = []
+        self.kinship_cache = None  # Holds computed kinship views and relations; see genealogy.kinship_cache_of
+        # Add this person to the family tree; update the salience values of their family members
         self._init_update_familial_attributes_of_family_members()
         # Prepare attributes representing this person's romantic relationships
         self.spouse = None
@@ -163,6 +171,8 @@ class Person(object):
         self.talked_to_this_year = set()
         self.befriended_this_year = set()
         self.salience_of_other_people = {}  # Maps potentially every other person to their salience to this person
+        self.most_salient_people = None  # Top of a ranking of salience_of_other_people; built when first needed
+        self.public_prominence = 0.0  # Salience to everyone in town that comes from job level
         self._init_salience_values()
         # Prepare attributes pertaining to pregnancy
         self.pregnant = False
@@ -172,9 +182,6 @@ class Person(object):
         # Prepare attributes representing events in this person's life
         self.birth = birth
         self.adoption = None
-        self.marriage = None
-        self.marriages = []
-        self.divorces = []
         self.adoptions = []
         self.moves = []  # From one home to another
         self.lay_offs = []  # Being laid off by a company that goes out of business
@@ -198,7 +205,7 @@ class Person(object):
         # will always be modified by self.go_to()
         self.location = None
         # Prepare attributes pertaining to this person's knowledge
-        self.all_belief_facets = set()  # Used to make batch calls to Facet.decay_strength()
+        self.all_belief_facets = set()  # Used by sources()
         # Miscellaneous attributes pertaining to artifacts this person is wearing
         self.wedding_ring_on_finger = None
         # Currently, whether a character is the player is only considered by Conversation
@@ -215,9 +222,9 @@ class Person(object):
             return "{}, {}-{}".format(self.name, self.birth_year, self.death_year)
 
     @staticmethod
-    def _init_fertility(male, config):
+    def _init_fertility(male, config, rng):
         """Determine whether this person will be able to reproduce."""
-        x = random.random()
+        x = rng.random()
         if male and x < config.male_infertility_rate:
             infertile = True
         elif not male and x < config.female_infertility_rate:
@@ -229,7 +236,7 @@ class Person(object):
     def _init_sexuality(self):
         """Determine this person's sexuality."""
         config = self.game.config
-        x = random.random()
+        x = self.game.rng.demographics.random()
         if x < config.homosexuality_incidence:
             # Homosexual
             if self.male:
@@ -256,148 +263,327 @@ class Person(object):
                 attracted_to_women = False
         return attracted_to_men, attracted_to_women
 
-    def _init_familial_attributes(self):
-        """Populate lists representing this person's family members."""
-        self._init_immediate_family()
-        self._init_biological_immediate_family()
-        self._init_extended_family()
-        self._init_biological_extended_family()
-
-    def _init_immediate_family(self):
-        """Populate lists representing this person's (legal) immediate family."""
-        self.grandparents = self.father.parents | self.mother.parents
-        self.siblings = self.father.kids | self.mother.kids
-        self.full_siblings = self.father.kids & self.mother.kids
-        self.half_siblings = self.father.kids ^ self.mother.kids
-        self.brothers = self.father.sons | self.mother.sons
-        self.full_brothers = self.father.sons & self.mother.sons
-        self.half_brothers = self.father.sons ^ self.mother.sons
-        self.sisters = self.father.daughters | self.mother.daughters
-        self.full_sisters = self.father.daughters & self.mother.daughters
-        self.half_sisters = self.father.daughters ^ self.mother.daughters
-        self.immediate_family = self.grandparents | self.parents | self.siblings
-
-    def _init_biological_immediate_family(self):
-        """Populate lists representing this person's immediate."""
-        self.bio_parents = {self.biological_mother, self.biological_father}
-        self.bio_grandparents = self.biological_father.parents | self.biological_mother.parents
-        self.bio_siblings = self.biological_father.kids | self.biological_mother.kids
-        self.bio_full_siblings = self.biological_father.kids & self.biological_mother.kids
-        self.bio_half_siblings = self.biological_father.kids ^ self.biological_mother.kids
-        self.bio_brothers = self.biological_father.sons | self.biological_mother.sons
-        self.bio_full_brothers = self.biological_father.sons & self.biological_mother.sons
-        self.bio_half_brothers = self.biological_father.sons ^ self.biological_mother.sons
-        self.bio_sisters = self.biological_father.daughters | self.biological_mother.daughters
-        self.bio_full_sisters = self.biological_father.daughters & self.biological_mother.daughters
-        self.bio_half_sisters = self.biological_father.daughters ^ self.biological_mother.daughters
-        self.bio_immediate_family = self.bio_grandparents | self.bio_parents | self.bio_siblings
-
-    def _init_extended_family(self):
-        """Populate lists representing this person's (legal) extended family."""
-        self.greatgrandparents = self.father.grandparents | self.mother.grandparents
-        self.uncles = self.father.brothers | self.mother.brothers
-        self.aunts = self.father.sisters | self.mother.sisters
-        self.cousins = self.father.nieces | self.father.nephews | self.mother.nieces | self.mother.nephews
-        self.nephews = self.father.grandsons | self.mother.grandsons
-        self.nieces = self.father.granddaughters | self.mother.granddaughters
-        self.ancestors = self.father.ancestors | self.mother.ancestors | self.parents
-        self.extended_family = (
-            self.greatgrandparents | self.immediate_family | self.uncles | self.aunts |
-            self.cousins | self.nieces | self.nephews
+    def _init_update_familial_attributes_of_family_members(self):
+        """Add this newborn to the family tree and update the salience values of their family members."""
+        config = self.game.config
+        for parent in self.parents:
+            parent.kids.add(self)
+            if self.male:
+                parent.sons.add(self)
+            else:
+                parent.daughters.add(self)
+        # The family tree has changed, so everyone's kinship views and relations must now be computed anew
+        self.game.genealogy_version += 1
+        Person.update_salience_of_for_everyone_in(
+            people=self.immediate_family, entity=self,
+            change=config.salience_increment_from_relationship_change["immediate family"]
+        )
+        Person.update_salience_of_for_everyone_in(
+            people=self.extended_family, entity=self,
+            change=config.salience_increment_from_relationship_change["extended family"]
         )
 
-    def _init_biological_extended_family(self):
-        """Populate lists representing this person's (legal) extended family."""
-        self.bio_greatgrandparents = self.father.grandparents | self.mother.grandparents
-        self.bio_uncles = self.father.brothers | self.mother.brothers
-        self.bio_aunts = self.father.sisters | self.mother.sisters
-        self.bio_cousins = self.father.nieces | self.father.nephews | self.mother.nieces | self.mother.nephews
-        self.bio_nephews = self.father.grandsons | self.mother.grandsons
-        self.bio_nieces = self.father.granddaughters | self.mother.granddaughters
-        self.bio_ancestors = self.father.ancestors | self.mother.ancestors | self.parents
-        self.bio_extended_family = (
+    # The methods below that are decorated with KinshipView compute this person's kin of some kind from
+    # the edges of the family tree; they get accessed like attributes (e.g., person.cousins) whose values
+    # are frozensets. Unless prefixed with 'bio_', these pertain to legal (not biological) family.
+
+    @KinshipView
+    def grandparents(self):
+        """Return this person's grandparents."""
+        return (grandparent for parent in self.parents for grandparent in parent.parents)
+
+    @KinshipView
+    def greatgrandparents(self):
+        """Return this person's great-grandparents."""
+        return (greatgrandparent for grandparent in self.grandparents for greatgrandparent in grandparent.parents)
+
+    @KinshipView
+    def ancestors(self):
+        """Return this person's ancestors."""
+        ancestors = set(self.parents)
+        for parent in self.parents:
+            ancestors |= parent.ancestors
+        return ancestors
+
+    @KinshipView
+    def descendants(self):
+        """Return this person's descendants."""
+        descendants = set(self.kids)
+        for kid in self.kids:
+            descendants |= kid.descendants
+        return descendants
+
+    @KinshipView
+    def siblings(self):
+        """Return this person's siblings (including half-siblings)."""
+        return {sibling for parent in self.parents for sibling in parent.kids if sibling is not self}
+
+    @KinshipView
+    def full_siblings(self):
+        """Return this person's full siblings."""
+        return self._kids_of_both_parents('kids')
+
+    @KinshipView
+    def half_siblings(self):
+        """Return this person's half-siblings."""
+        return self._kids_of_one_parent('kids')
+
+    @KinshipView
+    def brothers(self):
+        """Return this person's brothers (including half-brothers)."""
+        return {brother for parent in self.parents for brother in parent.sons if brother is not self}
+
+    @KinshipView
+    def full_brothers(self):
+        """Return this person's full brothers."""
+        return self._kids_of_both_parents('sons')
+
+    @KinshipView
+    def half_brothers(self):
+        """Return this person's half-brothers."""
+        return self._kids_of_one_parent('sons')
+
+    @KinshipView
+    def sisters(self):
+        """Return this person's sisters (including half-sisters)."""
+        return {sister for parent in self.parents for sister in parent.daughters if sister is not self}
+
+    @KinshipView
+    def full_sisters(self):
+        """Return this person's full sisters."""
+        return self._kids_of_both_parents('daughters')
+
+    @KinshipView
+    def half_sisters(self):
+        """Return this person's half-sisters."""
+        return self._kids_of_one_parent('daughters')
+
+    def _kids_of_both_parents(self, kind_of_kids):
+        """Return the kids of the given kind ('kids', 'sons', or 'daughters') of both of this person's parents."""
+        if not (self.father and self.mother):
+            return ()
+        return (getattr(self.father, kind_of_kids) & getattr(self.mother, kind_of_kids)) - {self}
+
+    def _kids_of_one_parent(self, kind_of_kids):
+        """Return the kids of the given kind ('kids', 'sons', or 'daughters') of just one of this person's parents."""
+        if not (self.father and self.mother):
+            return ()
+        return getattr(self.father, kind_of_kids) ^ getattr(self.mother, kind_of_kids)
+
+    @KinshipView
+    def uncles(self):
+        """Return this person's uncles."""
+        return (uncle for parent in self.parents for uncle in parent.brothers)
+
+    @KinshipView
+    def aunts(self):
+        """Return this person's aunts."""
+        return (aunt for parent in self.parents for aunt in parent.sisters)
+
+    @KinshipView
+    def cousins(self):
+        """Return this person's (first) cousins."""
+        return {
+            cousin for parent in self.parents for parents_sibling in parent.siblings
+            for cousin in parents_sibling.kids if cousin is not self
+        }
+
+    @KinshipView
+    def nephews(self):
+        """Return this person's nephews."""
+        return (nephew for sibling in self.siblings for nephew in sibling.sons)
+
+    @KinshipView
+    def nieces(self):
+        """Return this person's nieces."""
+        return (niece for sibling in self.siblings for niece in sibling.daughters)
+
+    @KinshipView
+    def grandchildren(self):
+        """Return this person's grandchildren."""
+        return (grandchild for kid in self.kids for grandchild in kid.kids)
+
+    @KinshipView
+    def grandsons(self):
+        """Return this person's grandsons."""
+        return (grandson for kid in self.kids for grandson in kid.sons)
+
+    @KinshipView
+    def granddaughters(self):
+        """Return this person's granddaughters."""
+        return (granddaughter for kid in self.kids for granddaughter in kid.daughters)
+
+    @KinshipView
+    def greatgrandchildren(self):
+        """Return this person's great-grandchildren."""
+        return (greatgrandchild for grandchild in self.grandchildren for greatgrandchild in grandchild.kids)
+
+    @KinshipView
+    def greatgrandsons(self):
+        """Return this person's great-grandsons."""
+        return (greatgrandson for grandchild in self.grandchildren for greatgrandson in grandchild.sons)
+
+    @KinshipView
+    def greatgranddaughters(self):
+        """Return this person's great-granddaughters."""
+        return (greatgranddaughter for grandchild in self.grandchildren for greatgranddaughter in grandchild.daughters)
+
+    @KinshipView
+    def spouses(self):
+        """Return everyone this person has married, excluding anyone they have divorced."""
+        return (
+            next(spouse for spouse in marriage.subjects if spouse is not self) for marriage in self.marriages
+            if not isinstance(marriage.terminus, event.Divorce)
+        )
+
+    @KinshipView
+    def immediate_family(self):
+        """Return this person's immediate family (which includes their spouses)."""
+        return self.grandparents | self.parents | self.siblings | self.kids | self.grandchildren | self.spouses
+
+    @KinshipView
+    def blood_relatives(self):
+        """Return this person's extended family, not counting the family they have married into."""
+        return (
+            self.greatgrandparents | self.immediate_family | self.uncles | self.aunts | self.cousins |
+            self.nieces | self.nephews | self.greatgrandchildren
+        )
+
+    @KinshipView
+    def extended_family(self):
+        """Return this person's extended family (which includes the family of their spouses)."""
+        extended_family = set(self.blood_relatives)
+        for spouse in self.spouses:
+            extended_family |= spouse.blood_relatives
+        extended_family.discard(self)
+        return extended_family
+
+    # These views pertain to biological family, but they are only approximations of it, since they are
+    # computed from the kids that people have had legally (like these attributes have always been)
+
+    @KinshipView
+    def bio_parents(self):
+        """Return this person's biological parents."""
+        return (parent for parent in (self.biological_mother, self.biological_father) if parent)
+
+    @KinshipView
+    def bio_grandparents(self):
+        """Return this person's biological grandparents."""
+        return (grandparent for parent in self.bio_parents for grandparent in parent.parents)
+
+    @KinshipView
+    def bio_siblings(self):
+        """Return this person's biological siblings (including half-siblings)."""
+        return {sibling for parent in self.bio_parents for sibling in parent.kids if sibling is not self}
+
+    @KinshipView
+    def bio_full_siblings(self):
+        """Return this person's biological full siblings."""
+        return self._kids_of_both_biological_parents('kids')
+
+    @KinshipView
+    def bio_half_siblings(self):
+        """Return this person's biological half-siblings."""
+        return self._kids_of_one_biological_parent('kids')
+
+    @KinshipView
+    def bio_brothers(self):
+        """Return this person's biological brothers (including half-brothers)."""
+        return {brother for parent in self.bio_parents for brother in parent.sons if brother is not self}
+
+    @KinshipView
+    def bio_full_brothers(self):
+        """Return this person's biological full brothers."""
+        return self._kids_of_both_biological_parents('sons')
+
+    @KinshipView
+    def bio_half_brothers(self):
+        """Return this person's biological half-brothers."""
+        return self._kids_of_one_biological_parent('sons')
+
+    @KinshipView
+    def bio_sisters(self):
+        """Return this person's biological sisters (including half-sisters)."""
+        return {sister for parent in self.bio_parents for sister in parent.daughters if sister is not self}
+
+    @KinshipView
+    def bio_full_sisters(self):
+        """Return this person's biological full sisters."""
+        return self._kids_of_both_biological_parents('daughters')
+
+    @KinshipView
+    def bio_half_sisters(self):
+        """Return this person's biological half-sisters."""
+        return self._kids_of_one_biological_parent('daughters')
+
+    def _kids_of_both_biological_parents(self, kind_of_kids):
+        """Return the kids of the given kind of both of this person's biological parents."""
+        if not (self.biological_father and self.biological_mother):
+            return ()
+        return (
+            getattr(self.biological_father, kind_of_kids) & getattr(self.biological_mother, kind_of_kids)
+        ) - {self}
+
+    def _kids_of_one_biological_parent(self, kind_of_kids):
+        """Return the kids of the given kind of just one of this person's biological parents."""
+        if not (self.biological_father and self.biological_mother):
+            return ()
+        return getattr(self.biological_father, kind_of_kids) ^ getattr(self.biological_mother, kind_of_kids)
+
+    @KinshipView
+    def bio_immediate_family(self):
+        """Return this person's biological immediate family."""
+        return self.bio_grandparents | self.bio_parents | self.bio_siblings
+
+    @KinshipView
+    def bio_greatgrandparents(self):
+        """Return this person's biological great-grandparents."""
+        return (greatgrandparent for grandparent in self.bio_grandparents for greatgrandparent in grandparent.parents)
+
+    @KinshipView
+    def bio_uncles(self):
+        """Return this person's biological uncles."""
+        return (uncle for parent in self.bio_parents for uncle in parent.brothers)
+
+    @KinshipView
+    def bio_aunts(self):
+        """Return this person's biological aunts."""
+        return (aunt for parent in self.bio_parents for aunt in parent.sisters)
+
+    @KinshipView
+    def bio_cousins(self):
+        """Return this person's biological (first) cousins."""
+        return {
+            cousin for parent in self.bio_parents for parents_sibling in parent.siblings
+            for cousin in parents_sibling.kids if cousin is not self
+        }
+
+    @KinshipView
+    def bio_nephews(self):
+        """Return this person's biological nephews."""
+        return (nephew for sibling in self.bio_siblings for nephew in sibling.sons)
+
+    @KinshipView
+    def bio_nieces(self):
+        """Return this person's biological nieces."""
+        return (niece for sibling in self.bio_siblings for niece in sibling.daughters)
+
+    @KinshipView
+    def bio_ancestors(self):
+        """Return this person's biological ancestors."""
+        ancestors = set(self.bio_parents)
+        for parent in self.bio_parents:
+            ancestors |= parent.bio_ancestors
+        return ancestors
+
+    @KinshipView
+    def bio_extended_family(self):
+        """Return this person's biological extended family."""
+        return (
             self.bio_greatgrandparents | self.bio_immediate_family | self.bio_uncles | self.bio_aunts |
             self.bio_cousins | self.bio_nieces | self.bio_nephews
         )
 
-    def _init_update_familial_attributes_of_family_members(self):
-        """Update familial attributes of myself and family members."""
-        config = self.game.config
-        for member in self.immediate_family:
-            member.immediate_family.add(self)
-            member.update_salience_of(
-                entity=self, change=config.salience_increment_from_relationship_change["immediate family"]
-            )
-        for member in self.extended_family:
-            member.extended_family.add(self)
-            member.update_salience_of(
-                entity=self, change=config.salience_increment_from_relationship_change["extended family"]
-            )
-        # Update for gender-specific familial attributes
-        if self.male:
-            for g in self.greatgrandparents:
-                g.greatgrandsons.add(self)
-            for g in self.grandparents:
-                g.grandsons.add(self)
-            for p in self.parents:
-                p.sons.add(self)
-            for u in self.uncles:
-                u.nephews.add(self)
-            for a in self.aunts:
-                a.nephews.add(self)
-            for b in self.full_brothers:
-                b.full_brothers.add(self)
-                b.brothers.add(self)
-            for s in self.full_sisters:
-                s.full_brothers.add(self)
-                s.brothers.add(self)
-            for b in self.half_brothers:
-                b.half_brothers.add(self)
-                b.brothers.add(self)
-            for s in self.half_sisters:
-                s.half_brothers.add(self)
-                s.brothers.add(self)
-        elif self.female:
-            for g in self.greatgrandparents:
-                g.greatgranddaughters.add(self)
-            for g in self.grandparents:
-                g.granddaughters.add(self)
-            for p in self.parents:
-                p.daughters.add(self)
-            for u in self.uncles:
-                u.nieces.add(self)
-            for a in self.aunts:
-                a.nieces.add(self)
-            for b in self.full_brothers:
-                b.full_sisters.add(self)
-                b.sisters.add(self)
-            for s in self.full_sisters:
-                s.full_sisters.add(self)
-                s.sisters.add(self)
-            for b in self.half_brothers:
-                b.half_sisters.add(self)
-                b.sisters.add(self)
-            for s in self.half_sisters:
-                s.half_sisters.add(self)
-                s.sisters.add(self)
-        # Update for non-gender-specific familial attributes
-        for a in self.ancestors:
-            a.descendants.add(self)
-        for g in self.greatgrandparents:
-            g.greatgrandchildren.add(self)
-        for g in self.grandparents:
-            g.grandchildren.add(self)
-        for p in self.parents:
-            p.kids.add(self)
-        for fs in self.full_siblings:
-            fs.siblings.add(self)
-            fs.full_siblings.add(self)
-        for hs in self.half_siblings:
-            hs.siblings.add(self)
-            hs.half_siblings.add(self)
-        for c in self.cousins:
-            c.cousins.add(self)
-
     def _init_salience_values(self):
         """Determine an initial salience value for every other person associated with this newborn."""
         config = self.game.config
@@ -546,7 +732,7 @@ class Person(object):
         elif any(f for f in self.friends if f.adult and f.present):
             next_of_kin = next(f for f in self.friends if f.adult and f.present)
         else:
-            next_of_kin = random.choice(
+            next_of_kin = self.game.rng.demographics.choice(
                 [r for r in self.city.residents if r.adult and r.present]
             )
         return next_of_kin
@@ -830,98 +1016,31 @@ class Person(object):
         """Return this person's knowledge about another person's feature of the given type."""
         if other_person not in self.mind.mental_models:
             return None
-        # Name
-        elif feature_type == "first name":
-            return self.mind.mental_models[other_person].name.first_name
-        elif feature_type == "middle name":
-            return self.mind.mental_models[other_person].name.middle_name
-        elif feature_type == "last name":
-            return self.mind.mental_models[other_person].name.last_name
-        # Occupation
-        elif feature_type == "workplace":
-            return (self.mind.mental_models[other_person].occupation.company if  # Name of company
-                    self.mind.mental_models[other_person].occupation.company else None)
-        elif feature_type == "job title":
-            return self.mind.mental_models[other_person].occupation.job_title
-        elif feature_type == "job shift":
-            return self.mind.mental_models[other_person].occupation.shift
-        elif feature_type == "workplace address":
-            if (self.mind.mental_models[other_person].occupation.company and
-                    self.mind.mental_models[other_person].occupation.company.mental_model):
-                return self.mind.mental_models[other_person].occupation.company.mental_model.address
-            else:
-                return None
-        elif feature_type == "workplace block":
-            if (self.mind.mental_models[other_person].occupation.company and
-                    self.mind.mental_models[other_person].occupation.company.mental_model):
-                return self.mind.mental_models[other_person].occupation.company.mental_model.block
+        mental_model = self.mind.mental_models[other_person]
+        # Facets are read through the mental model's accessors, which (unlike attribute access) don't
+        # build a belief that hasn't been built yet; such a belief holds no facets, so it reads as None
+        if feature_type == "workplace":
+            workplace = mental_model.get_current_belief_facet(feature_type="workplace")
+            return workplace if workplace else None  # Name of company
+        elif feature_type in ("workplace address", "workplace block"):
+            workplace = mental_model.get_current_belief_facet(feature_type="workplace")
+            if workplace and workplace.mental_model:
+                return workplace.mental_model.address if feature_type == "workplace address" else (
+                    workplace.mental_model.block
+                )
             else:
                 return None
-        # Home
         elif feature_type == "home":
-            return (str(self.mind.mental_models[other_person].home) if  # Name of residence
-                    self.mind.mental_models[other_person].home else None)
-        elif feature_type == "home address":
-            if (self.mind.mental_models[other_person].home and
-                    self.mind.mental_models[other_person].home.mental_model):
-                return self.mind.mental_models[other_person].home.mental_model.address
-            else:
-                return None
-        elif feature_type == "home block":
-            if (self.mind.mental_models[other_person].home and
-                    self.mind.mental_models[other_person].home.mental_model):
-                return self.mind.mental_models[other_person].home.mental_model.block
+            home = mental_model.get_current_belief_facet(feature_type="home")
+            return str(home) if home else None  # Name of residence
+        elif feature_type in ("home address", "home block"):
+            home = mental_model.get_current_belief_facet(feature_type="home")
+            if home and home.mental_model:
+                return home.mental_model.address if feature_type == "home address" else home.mental_model.block
             else:
                 return None
-        # Appearance
-        elif feature_type == "skin color":
-            return self.mind.mental_models[other_person].face.skin.color
-        elif feature_type == "head size":
-            return self.mind.mental_models[other_person].face.head.size
-        elif feature_type == "head shape":
-            return self.mind.mental_models[other_person].face.head.shape
-        elif feature_type == "hair length":
-            return self.mind.mental_models[other_person].face.hair.length
-        elif feature_type == "hair color":
-            return self.mind.mental_models[other_person].face.hair.color
-        elif feature_type == "eyebrow size":
-            return self.mind.mental_models[other_person].face.eyebrows.size
-        elif feature_type == "eyebrow color":
-            return self.mind.mental_models[other_person].face.eyebrows.color
-        elif feature_type == "mouth size":
-            return self.mind.mental_models[other_person].face.mouth.size
-        elif feature_type == "ear size":
-            return self.mind.mental_models[other_person].face.ears.size
-        elif feature_type == "ear angle":
-            return self.mind.mental_models[other_person].face.ears.angle
-        elif feature_type == "nose size":
-            return self.mind.mental_models[other_person].face.nose.size
-        elif feature_type == "nose shape":
-            return self.mind.mental_models[other_person].face.nose.shape
-        elif feature_type == "eye size":
-            return self.mind.mental_models[other_person].face.eyes.size
-        elif feature_type == "eye shape":
-            return self.mind.mental_models[other_person].face.eyes.shape
-        elif feature_type == "eye color":
-            return self.mind.mental_models[other_person].face.eyes.color
-        elif feature_type == "eye horizontal settedness":
-            return self.mind.mental_models[other_person].face.eyes.horizontal_settedness
-        elif feature_type == "eye vertical settedness":
-            return self.mind.mental_models[other_person].face.eyes.vertical_settedness
-        elif feature_type == "facial hair style":
-            return self.mind.mental_models[other_person].face.facial_hair.style
-        elif feature_type == "freckles":
-            return self.mind.mental_models[other_person].face.distinctive_features.freckles
-        elif feature_type == "birthmark":
-            return self.mind.mental_models[other_person].face.distinctive_features.birthmark
-        elif feature_type == "scar":
-            return self.mind.mental_models[other_person].face.distinctive_features.scar
-        elif feature_type == "tattoo":
-            return self.mind.mental_models[other_person].face.distinctive_features.tattoo
-        elif feature_type == "glasses":
-            return self.mind.mental_models[other_person].face.distinctive_features.glasses
-        elif feature_type == "sunglasses":
-            return self.mind.mental_models[other_person].face.distinctive_features.sunglasses
+        elif feature_type in FEATURE_TYPES_OF_KNOWLEDGE_HELD_AS_IS:
+            return mental_model.get_current_belief_facet(feature_type=feature_type)
 
     def get_knowledge_about_place(self, place, feature_type):
         """Return this person's knowledge about this place's feature of the given type."""
@@ -1052,6 +1171,15 @@ class Person(object):
         dialogue, it won't return specific relationships like 'first cousin, once removed',
         because everyday people don't know or reference these relationships.
         """
+        return self._kinship_relation_to_me(person=person) or self._social_relation_to_me(person=person)
+
+    @kinship_relation
+    def _kinship_relation_to_me(self, person):
+        """Return the primary relation of another person to me by blood or marriage, if any.
+
+        These relations can only change when the family tree does, and so they are memoized (see
+        genealogy.kinship_relation).
+        """
         if person is self:
             return 'self'
         elif person in self.greatgrandparents:
@@ -1124,7 +1252,12 @@ class Person(object):
             return 'second cousin'
         elif self.greatgrandparents & person.siblings:
             return 'great uncle' if person.male else 'great aunt'
-        elif person is self.best_friend:
+        else:
+            return None
+
+    def _social_relation_to_me(self, person):
+        """Return the primary relation of another person to me by friendship, work, and so forth, if any."""
+        if person is self.best_friend:
             return 'best friend'
         elif person is self.worst_enemy:
             return 'worst enemy'
@@ -1197,6 +1330,22 @@ class Person(object):
         An example of a hinge: if someone is my wife's friend, then my wife is the hinge.
         """
         # TODO ADD FURTHER PRECONDITIONS ON SOME, E.G., YOU MUST KNOW WHERE YOUR MOM WORKS
+        relations = list(self._known_kinship_relations_to_me(person=person))
+        relations += self._known_social_relations_to_me(person=person)
+        # Throw out any for which hinge in not in my mental model
+        keepers = []
+        for relation, hinge in relations:
+            if not hinge or hinge in self.mind.mental_models:
+                keepers.append((relation, hinge))
+        return keepers
+
+    @kinship_relation
+    def _known_kinship_relations_to_me(self, person):
+        """Return the relations of another person to me by blood or marriage, as well as their hinges.
+
+        These relations can only change when the family tree does, and so they are memoized (see
+        genealogy.kinship_relation); as such, they are returned as a tuple.
+        """
         relations = []
         if person is self:
             relation = 'self'
@@ -1370,6 +1519,11 @@ class Person(object):
             relation = 'great uncle' if person.male else 'great aunt'
             hinge = None
             relations.append((relation, hinge))
+        return tuple(relations)
+
+    def _known_social_relations_to_me(self, person):
+        """Return the relations of another person to me by friendship, work, and so forth, as well as their hinges."""
+        relations = []
         if person is self.best_friend:
             relation = 'best friend'
             hinge = None
@@ -1495,12 +1649,7 @@ class Person(object):
             relation = 'acquaintance'
             hinge = None
             relations.append((relation, hinge))
-        # Throw out any for which hinge in not in my mental model
-        keepers = []
-        for relation, hinge in relations:
-            if not hinge or hinge in self.mind.mental_models:
-                keepers.append((relation, hinge))
-        return keepers
+        return relations
 
     def change_name(self, new_last_name, reason):
         """Change this person's (official) name."""
@@ -1517,7 +1666,7 @@ class Person(object):
         partner.sexual_partners.add(self)
         # TODO modify spark between these people
         if self.male != partner.male and not self.pregnant and not partner.pregnant:
-            if (not protection) or random.random() < config.chance_protection_does_not_work:
+            if (not protection) or self.game.rng.demographics.random() < config.chance_protection_does_not_work:
                 self._determine_whether_pregnant(partner=partner)
 
     def _determine_whether_pregnant(self, partner):
@@ -1528,11 +1677,12 @@ class Person(object):
         chance_of_conception = config.function_to_determine_chance_of_conception(
             female_age=female_partner.age
         )
-        if random.random() < chance_of_conception:
+        if self.game.rng.demographics.random() < chance_of_conception:
             female_partner.impregnated_by = self if female_partner is partner else partner
             female_partner.conception_year = self.game.year
             female_partner.due_date = self.game.ordinal_date + 270
             female_partner.pregnant = True
+            self.game.register_pregnancy(person=female_partner)
 
     def marry(self, partner):
         """Marry partner."""
@@ -1741,6 +1891,7 @@ class Person(object):
         one of the top three. TODO: Probabilistically select from all potential hires
         using the scores to derive likelihoods of selecting each.
         """
+        rng = self.game.rng.demographics
         if self.city:
             pool = list(self.city.workers_of_trade(occupation_in_question))
         else:  # PersonExNihilo who backstory is currently being retconned
@@ -1757,14 +1908,14 @@ class Person(object):
                 if len(potential_hire_scores) >= 3:
                     # Pick from top three
                     top_three_choices = heapq.nlargest(3, potential_hire_scores, key=potential_hire_scores.get)
-                    if random.random() < 0.6:
+                    if rng.random() < 0.6:
                         choice = top_three_choices[0]
-                    elif random.random() < 0.9:
+                    elif rng.random() < 0.9:
                         choice = top_three_choices[1]
                     else:
                         choice = top_three_choices[2]
                 else:
-                    choice = max(potential_hire_scores)
+                    choice = max(potential_hire_scores, key=potential_hire_scores.get)
         else:
             # This should only ever happen at the very beginning of a city's history where all
             # business types haven't been built in town yet
@@ -1863,13 +2014,14 @@ class Person(object):
         one of the top three. TODO: Probabilistically select from all homes/lots using the
         scores to derive likelihoods of selecting each.
         """
+        rng = self.game.rng.demographics
         home_and_lot_scores = self._rate_all_vacant_homes_and_vacant_lots()
         if len(home_and_lot_scores) >= 3:
             # Pick from top three
             top_three_choices = heapq.nlargest(3, home_and_lot_scores, key=home_and_lot_scores.get)
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 choice = top_three_choices[0]
-            elif random.random() < 0.9:
+            elif rng.random() < 0.9:
                 choice = top_three_choices[1]
             else:
                 choice = top_three_choices[2]
@@ -1916,20 +2068,21 @@ class Person(object):
         # Score home for its proximity to family (either positively or negatively, depending); only
         # consider family members that are alive, in town, and not living with you already (i.e., kids)
         relatives_in_town = {f for f in self.extended_family if f.present and f.home is not self.home}
+        distances_to_lot = lot.city.distances_from(lot)
         score = 0
         for relative in relatives_in_town:
             relation_to_me = self._common_familial_relation_to_me(person=relative)
             pull_toward_someone_of_that_relation = pull_to_live_near_that_relation.get(relation_to_me, 0.0)
-            dist = self.city.distance_between(relative.home.lot, lot) + 1.0  # To avoid ZeroDivisionError
+            dist = distances_to_lot[relative.home.lot.index] + 1.0  # To avoid ZeroDivisionError
             score += (desire_to_live_near_family * pull_toward_someone_of_that_relation) / dist
         # Score for proximity to friends (only positively)
         for friend in self.friends:
-            dist = self.city.distance_between(friend.home.lot, lot) + 1.0
+            dist = distances_to_lot[friend.home.lot.index] + 1.0
             score += pull_to_live_near_a_friend / dist
         # Score for proximity to workplace (only positively) -- will be only criterion for person
         # who is new to the city (and thus accurate_belief no one there yet)
         if self.occupation:
-            dist = self.city.distance_between(self.occupation.company.lot, lot) + 1.0
+            dist = distances_to_lot[self.occupation.company.lot.index] + 1.0
             score += config.pull_to_live_near_workplace / dist
         return score
 
@@ -1958,16 +2111,16 @@ class Person(object):
         acquisition during the low-fidelity simulation.
         """
         # TODO INJECT KNOWLEDGE ABOUT PLACES
-        all_the_people_i_should_know_about = set(self.relationships) | set(self.salience_of_other_people)
+        all_the_people_i_should_know_about = (
+            set(self.relationships) | set(self.salience_of_other_people) |
+            (self.city.prominent_people & self.city.residents)
+        )
         for person in all_the_people_i_should_know_about:
             if person in self.relationships:
                 total_interactions = self.relationships[person].total_interactions
             else:
                 total_interactions = 0.0
-            if person in self.salience_of_other_people:
-                salience_of_subject = self.salience_of_other_people[person]
-            else:
-                salience_of_subject = 0.0
+            salience_of_subject = self.salience_of(person)
             if person in self.relationships or self.known_relation_to_me(person):
                 salience_of_subject += 1.0
             implant_will_happen = False
@@ -1981,7 +2134,7 @@ class Person(object):
                 if person.death_year and person.death_year < self.birth_year and person not in self.immediate_family:
                     interest_in_history_multiplier = 1.0 + self.personality.interest_in_history
                     chance_implant_even_happens *= interest_in_history_multiplier
-                if random.random() < chance_implant_even_happens:
+                if self.game.rng.knowledge.random() < chance_implant_even_happens:
                     implant_will_happen = True
             if self.age < 4:
                 implant_will_happen = False
@@ -2005,7 +2158,7 @@ class Person(object):
     def observe(self):
         """Observe the place one is at and the people there."""
         for thing in {self.location} | self.location.people_here_now - {self}:
-            if random.random() < self.game.config.chance_someone_observes_nearby_entity:
+            if self.game.rng.knowledge.random() < self.game.config.chance_someone_observes_nearby_entity:
                 self._form_or_build_up_mental_model(subject=thing)
 
     def _form_or_build_up_mental_model(self, subject):
@@ -2070,17 +2223,8 @@ class Person(object):
             how_many_people_we_talk_about = config.amount_of_people_people_talk_about_floor
         # Figure out the N most salient people, where N = how_many_people_we_talk_about (or
         # the how many total people these guys know about, if that's less)
-        all_the_people_we_know_about = set(self.mind.mental_models) | set(interlocutor.mind.mental_models)
-        my_salience_of_other_people = self.salience_of_other_people  # Attribute accessing is slow -- make local vars
-        interlocutor_salience_of_other_people = interlocutor.salience_of_other_people
-        salience_scores = {
-            # Using .get(entity, 0.0) means 0.0 will be returned if entity is not in that dictionary -- i.e.,
-            # it creates a default salience value of 0.0 for cases where a person has no salience value for someone
-            entity: my_salience_of_other_people.get(entity, 0.0)+interlocutor_salience_of_other_people.get(entity, 0.0)
-            for entity in all_the_people_we_know_about if entity.type == "person"
-        }
-        people_we_will_talk_about = (
-            heapq.nlargest(how_many_people_we_talk_about, salience_scores, key=salience_scores.get)
+        people_we_will_talk_about, salience_scores = self._decide_who_we_will_talk_about(
+            interlocutor=interlocutor, how_many=how_many_people_we_talk_about
         )
         for subject_of_conversation in people_we_will_talk_about:
             self._exchange_information_about_a_person(
@@ -2089,8 +2233,72 @@ class Person(object):
                 total_salience_of_that_person=salience_scores[subject_of_conversation]
             )
 
+    def _decide_who_we_will_talk_about(self, interlocutor, how_many):
+        """Return the people (that either of us knows about) who are most salient to the two of us combined.
+
+        Rather than scoring everyone that either of us knows about, we first try merging our two
+        rankings of most salient people with the town's ranking of most prominent people: anyone
+        missing from all three rankings cannot have a combined salience above the bound given by
+        the rankings' floors, so if enough of the ranked people score above that bound, they are
+        certainly the most salient ones. Only when they don't (or when we know about so few people
+        that scoring all of them is no more work) do we score everyone.
+
+        @param interlocutor: The person this person is talking to.
+        @param how_many: The number of people to talk about.
+        @return: A tuple (people_we_will_talk_about, salience_scores), where the former is a list of people
+                 ordered by descending combined salience, and the latter is a dictionary mapping those
+                 people (and possibly others) to their combined salience.
+        """
+        my_salience_of_other_people = self.salience_of_other_people  # Attribute accessing is slow -- make local vars
+        interlocutor_salience_of_other_people = interlocutor.salience_of_other_people
+        my_mental_models = self.mind.mental_models
+        interlocutor_mental_models = interlocutor.mind.mental_models
+        city = self.game.city
+        number_of_people_ranked = self.game.config.number_of_most_salient_people_to_rank
+        if len(my_mental_models) + len(interlocutor_mental_models) > 3*number_of_people_ranked:
+            salience_scores = {}
+            rankings = (
+                self.get_most_salient_people(), interlocutor.get_most_salient_people(),
+                city.get_most_prominent_people()
+            )
+            for ranking in rankings:
+                for _, person in ranking:
+                    if person in my_mental_models or person in interlocutor_mental_models:
+                        # Public prominence is part of both our salience values for this person
+                        salience_scores[person] = (
+                            my_salience_of_other_people.get(person, 0.0) +
+                            interlocutor_salience_of_other_people.get(person, 0.0) +
+                            2*person.public_prominence
+                        )
+            bound = (
+                self.salience_ranking_floor() + interlocutor.salience_ranking_floor() +
+                2*city.prominence_ranking_floor()
+            )
+            people_above_bound = [person for person in salience_scores if salience_scores[person] > bound]
+        else:
+            people_above_bound = ()
+        if len(people_above_bound) < how_many:
+            all_the_people_we_know_about = set(my_mental_models) | set(interlocutor_mental_models)
+            salience_scores = {
+                # Using .get(entity, 0.0) means 0.0 will be returned if entity is not in that dictionary -- i.e.,
+                # it creates a default salience value of 0.0 for cases where a person has no salience value
+                entity: (
+                    my_salience_of_other_people.get(entity, 0.0) +
+                    interlocutor_salience_of_other_people.get(entity, 0.0) +
+                    2*entity.public_prominence
+                )
+                for entity in all_the_people_we_know_about if entity.type == "person"
+            }
+            people_above_bound = salience_scores
+        # Ties are broken by person ID, so that both ways of getting here pick the same people
+        people_we_will_talk_about = heapq.nlargest(
+            how_many, people_above_bound, key=lambda person: (salience_scores[person], -person.id)
+        )
+        return people_we_will_talk_about, salience_scores
+
     def _exchange_information_about_a_person(self, interlocutor, person_in_question, total_salience_of_that_person):
         """Exchange information about a person."""
+        rng = self.game.rng.knowledge
         # TODO HAVE SALIENCE OF THIS PERSON TO THE TALKERS AFFECT HOW MUCH THEY SAY ABOUT THEM
         config = self.game.config
         if person_in_question not in self.mind.mental_models:
@@ -2104,8 +2312,8 @@ class Person(object):
             declaration = Declaration(subject=person_in_question, source=talker, recipient=listener)
             # Potentially have someone eavesdrop -- TODO maybe affect this by whether eavesdropper accurate_belief subject
             people_in_earshot = self.location.people_here_now - {talker, listener}
-            eavesdropper = None if not people_in_earshot else random.choice(list(people_in_earshot))
-            if eavesdropper and random.random() < config.chance_someone_eavesdrops_statement_or_lie:
+            eavesdropper = None if not people_in_earshot else rng.choice(list(people_in_earshot))
+            if eavesdropper and rng.random() < config.chance_someone_eavesdrops_statement_or_lie:
                 eavesdropping = Eavesdropping(
                     subject=person_in_question, source=talker, recipient=listener, eavesdropper=eavesdropper
                 )
@@ -2114,7 +2322,7 @@ class Person(object):
             else:
                 eavesdropping = None
             for feature_type, prob in config.chance_someones_feature_comes_up_in_conversation_about_them:
-                if random.random() < prob:
+                if rng.random() < prob:
                     # Have talker convey information about feature_type of person_in_question
                     if talker.get_knowledge_about_person(other_person=person_in_question, feature_type=feature_type):
                         talker_belief_facet = (
@@ -2160,7 +2368,7 @@ class Person(object):
                 chance = config.chance_someone_instigates_interaction_with_other_person_floor
             elif chance > config.chance_someone_instigates_interaction_with_other_person_cap:
                 chance = config.chance_someone_instigates_interaction_with_other_person_cap
-        if random.random() < chance:
+        if self.game.rng.routines.random() < chance:
             return True
         else:
             return False
@@ -2198,6 +2406,7 @@ class Person(object):
     def grow_older(self):
         """Check if it's this persons birth day; if it is, age them."""
         config = self.game.config
+        rng = self.game.rng.demographics
         consider_leaving_town = False
         self.age = age = self.game.true_year - self.birth_year
         if age == config.age_people_start_working(year=self.game.year):
@@ -2217,7 +2426,7 @@ class Person(object):
                 self.relationships[other_person].update_spark_and_charge_increments_for_new_age_difference()
         # Potentially have your hair turn gray (or white, if it's already gray) -- TODO MAKE THIS HERITABLE
         if age > config.age_when_people_start_graying:
-            if random.random() < config.chance_someones_hair_goes_gray_or_white:
+            if rng.random() < config.chance_someones_hair_goes_gray_or_white:
                 new_color_str = 'gray' if self.face.hair.color != 'gray' else 'white'
                 # Maintain the same face.Feature attributes as the original Feature had, but
                 # create a new Feature object with the updated string -- TODO is this still inheritance?
@@ -2230,7 +2439,7 @@ class Person(object):
                 )
         # Potentially go bald, if male -- TODO MAKE THIS HERITABLE
         if self.male and age > config.age_when_men_start_balding:
-            if random.random() < config.chance_someones_loses_their_hair_some_year:
+            if rng.random() < config.chance_someones_loses_their_hair_some_year:
                 # Maintain the same face.Feature attributes as the original Feature had, but
                 # create a new Feature object with the updated string -- TODO is this still inheritance?
                 variant_id = self.face.hair.length.variant_id
@@ -2240,17 +2449,113 @@ class Person(object):
                     value='bald', variant_id=variant_id, inherited_from=inherited_from,
                     exact_variant_inherited=exact_variant_inherited
                 )
-        if consider_leaving_town and random.random() < config.chance_a_new_adult_decides_to_leave_town:
+        if consider_leaving_town and rng.random() < config.chance_a_new_adult_decides_to_leave_town:
             self.depart_city()
 
     def update_salience_of(self, entity, change):
         """Increment your salience value for entity by change."""
         # TODO EXPLORE WHY SOME PEOPLE ARE INDEXING OTHERS WITH
         # NEGATIVE SALIENCE VALUES -- the max() is duct tape right now
-        self.salience_of_other_people[entity] = (
-            max(0.0, self.salience_of_other_people.get(entity, 0.0) + change)
+        salience = max(0.0, self.salience_of_other_people.get(entity, 0.0) + change)
+        self.salience_of_other_people[entity] = salience
+        if self.most_salient_people is not None:
+            self._update_most_salient_people(entity=entity, salience=salience)
+
+    def update_salience_of_everyone_in(self, entities, change):
+        """Increment your salience value for each of the given entities by change.
+
+        This does in a single call what calling update_salience_of() for each of these entities
+        would do (whose body it inlines, saving a method call per entity), for the cases where many
+        people's salience to you changes at once (e.g., all of your coworkers, when you get a job).
+
+        @param entities: An iterable of the people whose salience to you should change.
+        @param change: The amount by which your salience values for them should change.
+        """
+        salience_of_other_people = self.salience_of_other_people
+        if self.most_salient_people is None:
+            for entity in entities:
+                # (This clamps at zero just as the max() in update_salience_of() does, only faster)
+                salience = salience_of_other_people.get(entity, 0.0) + change
+                salience_of_other_people[entity] = salience if salience > 0.0 else 0.0
+        else:
+            update_most_salient_people = self._update_most_salient_people
+            for entity in entities:
+                salience = salience_of_other_people.get(entity, 0.0) + change
+                salience = salience_of_other_people[entity] = salience if salience > 0.0 else 0.0
+                update_most_salient_people(entity=entity, salience=salience)
+
+    @staticmethod
+    def update_salience_of_for_everyone_in(people, entity, change):
+        """Increment each of the given people's salience value for entity by change.
+
+        This is the counterpart of update_salience_of_everyone_in(), for the cases where entity's
+        salience changes for many people at once (e.g., for all of entity's coworkers when entity
+        gets a job, or for all of entity's family members when entity is born).
+
+        @param people: An iterable of the people whose salience value for entity should change.
+        @param entity: The person whose salience to these people is changing.
+        @param change: The amount by which their salience values for entity should change.
+        """
+        for person in people:
+            salience_of_other_people = person.salience_of_other_people
+            salience = salience_of_other_people.get(entity, 0.0) + change
+            salience = salience_of_other_people[entity] = salience if salience > 0.0 else 0.0
+            if person.most_salient_people is not None:
+                person._update_most_salient_people(entity=entity, salience=salience)
+
+    def get_most_salient_people(self):
+        """Return this person's ranking of the people who are most salient to them, building it if need be.
+
+        The ranking is a list of [salience, person] entries, ordered by descending salience, holding
+        the top config.number_of_most_salient_people_to_rank entries of salience_of_other_people
+        (i.e., it ranks personal salience only -- see salience_of()). It is only built once someone
+        needs it (which doesn't happen during the low-fidelity simulation), and from then on it is
+        kept current by update_salience_of().
+        """
+        if self.most_salient_people is None:
+            self.most_salient_people = rank_most_salient(
+                entities_and_saliences=self.salience_of_other_people.iteritems(),
+                size=self.game.config.number_of_most_salient_people_to_rank
+            )
+        return self.most_salient_people
+
+    def salience_ranking_floor(self):
+        """Return the highest salience that anyone missing from this person's ranking of salient people may have."""
+        ranking = self.get_most_salient_people()
+        if len(ranking) < len(self.salience_of_other_people):
+            return ranking[-1][0]
+        return 0.0
+
+    def _update_most_salient_people(self, entity, salience):
+        """Update this person's ranking of most salient people to reflect a new salience value for entity."""
+        self.most_salient_people = update_ranking_of_most_salient(
+            ranking=self.most_salient_people, entity=entity, salience=salience,
+            number_of_entities=len(self.salience_of_other_people),
+            size=self.game.config.number_of_most_salient_people_to_rank
         )
 
+    def salience_of(self, entity):
+        """Return the salience of entity to this person.
+
+        This combines this person's personal salience value for entity with the public prominence
+        of entity, if entity is a person.
+        """
+        salience = self.salience_of_other_people.get(entity, 0.0)
+        if entity.type == "person":
+            salience += entity.public_prominence
+        return salience
+
+    def update_public_prominence(self, change):
+        """Increment this person's public prominence by change.
+
+        Public prominence is the part of a person's salience that is the same for everyone in town
+        (it comes from the level of the jobs they hold), and so it is stored once, here, rather than
+        in every resident's salience_of_other_people; this makes a job change cost the same no matter
+        how many people live in town.
+        """
+        self.public_prominence = max(0.0, self.public_prominence + change)
+        self.game.city.note_change_in_public_prominence(person=self)
+
     def people_i_believe_work_at(self, company):
         """Return a list of people, ordered by their salience, that this person believes works at the given company."""
         if company not in self.mind.mental_models:
@@ -2260,7 +2565,7 @@ class Person(object):
                 mental_model.subject for mental_model in self.mind.mental_models[company].employees
             ]
             people_i_believe_work_at_this_company.sort(
-                key=lambda p: self.salience_of_other_people.get(p, 0.0), reverse=True
+                key=self.salience_of, reverse=True
             )
             return people_i_believe_work_at_this_company
 
@@ -2351,10 +2656,7 @@ class PersonExNihilo(Person):
         )
         # Determine a random birthday and add it to the game's listing of all characters' birthdays
         self.birthday = self._get_random_birthday()
-        try:
-            game.birthdays[self.birthday].add(self)
-        except KeyError:
-            game.birthdays[self.birthday] = {self}
+        game.register_birthday(person=self)
         # Since they don't have a parent to name them, generate a name for this person (if
         # they get married outside the city, this will still potentially change, as normal)
         self.first_name, self.middle_name, self.last_name, self.suffix = (
@@ -2410,14 +2712,16 @@ class PersonExNihilo(Person):
     def _init_name(self):
         """Generate a name for a primordial person who has no parents."""
         if self.male:
-            first_name_rep = Names.a_masculine_name(year=self.birth_year)
-            middle_name_rep = Names.a_masculine_name(year=self.birth_year)
+            first_name_rep = Names.a_masculine_name(year=self.birth_year, rng=self.game.rng.demographics)
+            middle_name_rep = Names.a_masculine_name(year=self.birth_year, rng=self.game.rng.demographics)
         else:
-            first_name_rep = Names.a_feminine_name(year=self.birth_year)
-            middle_name_rep = Names.a_feminine_name(year=self.birth_year)
+            first_name_rep = Names.a_feminine_name(year=self.birth_year, rng=self.game.rng.demographics)
+            middle_name_rep = Names.a_feminine_name(year=self.birth_year, rng=self.game.rng.demographics)
         first_name = Name(value=first_name_rep, progenitor=self, conceived_by=(), derived_from=())
         middle_name = Name(value=middle_name_rep, progenitor=self, conceived_by=(), derived_from=())
-        last_name = Name(value=Names.any_surname(), progenitor=self, conceived_by=(), derived_from=())
+        last_name = Name(
+            value=Names.any_surname(rng=self.game.rng.demographics), progenitor=self, conceived_by=(), derived_from=()
+        )
         suffix = ''
         return first_name, middle_name, last_name, suffix
 
@@ -2432,15 +2736,11 @@ class PersonExNihilo(Person):
         """Generate a birth year for this person that is consistent with the job level they/spouse will get."""
         config = self.game.config
         age_at_current_year_of_sim = config.function_to_determine_person_ex_nihilo_age_given_job_level(
-            job_level=job_level
+            job_level=job_level, rng=self.game.rng.demographics
         )
         birth_year = self.game.true_year - age_at_current_year_of_sim
         return birth_year
 
-    def _init_familial_attributes(self):
-        """Do nothing because a PersonExNihilo has no family at the time of being generated.."""
-        pass
-
     def _init_update_familial_attributes_of_family_members(self):
         """Do nothing because a PersonExNihilo has no family at the time of being generated.."""
         pass
@@ -2453,13 +2753,14 @@ class PersonExNihilo(Person):
         """Potentially generate and retcon a family that this person will have had prior
         to entering into the simulation.
         """
+        rng = self.game.rng.demographics
         if not spouse_already_generated:
             chance_of_having_family = (
                 self.game.config.function_to_determine_chance_person_ex_nihilo_starts_with_family(
                     city_pop=self.game.city.population
                 )
             )
-            if random.random() < chance_of_having_family or job_opportunity_impetus.__name__ == 'Farmer':
+            if rng.random() < chance_of_having_family or job_opportunity_impetus.__name__ == 'Farmer':
                 self._init_generate_family(job_opportunity_impetus=job_opportunity_impetus)
 
     def _init_generate_family(self, job_opportunity_impetus):
@@ -2476,7 +2777,7 @@ class PersonExNihilo(Person):
         config = self.game.config
         # Change actual game year to marriage year, instantiate a Marriage object
         marriage_date = self.birth_year + (
-            random.normalvariate(
+            self.game.rng.demographics.normalvariate(
                 config.person_ex_nihilo_age_at_marriage_mean, config.person_ex_nihilo_age_at_marriage_sd
             )
         )
@@ -2508,18 +2809,19 @@ class PersonExNihilo(Person):
                     n_kids=len(self.marriage.children_produced)
                 )
             )
-            if random.random() < chance_they_are_trying_to_conceive_this_year:
+            if self.game.rng.demographics.random() < chance_they_are_trying_to_conceive_this_year:
                 self.have_sex(partner=self.spouse, protection=False)
             else:
                 self.have_sex(partner=self.spouse, protection=True)
 
     def move_into_the_city(self, hiring_that_instigated_move):
         """Move into the city in which gameplay takes place."""
+        rng = self.game.rng.demographics
         self.city = self.game.city
         self.city.residents.add(self)
         new_home = self.secure_home()
         if not new_home:
-            someone_elses_home = random.choice(list(self.city.dwelling_places))
+            someone_elses_home = rng.choice(list(self.city.dwelling_places))
             self.move(new_home=someone_elses_home, reason=hiring_that_instigated_move)
         if new_home:
             self.move(new_home=new_home, reason=hiring_that_instigated_move)
@@ -2533,16 +2835,17 @@ class PersonExNihilo(Person):
                 # has no units, and thus no unit number to give the expansion unit
                 ac for ac in self.city.businesses_of_type('ApartmentComplex') if ac.units
             ]
+            distances_to_downtown = self.city.distances_from(self.city.downtown)
             if len(apartment_complexes_in_town) > 3:
                 complexes_closest_to_downtown = heapq.nlargest(
                     3, apartment_complexes_in_town,
-                    key=lambda ac: self.city.distance_between(ac.lot, self.city.downtown)
+                    key=lambda ac: distances_to_downtown[ac.lot.index]
                 )
-                complex_that_will_expand = random.choice(complexes_closest_to_downtown)
+                complex_that_will_expand = rng.choice(complexes_closest_to_downtown)
             else:
                 complex_that_will_expand = min(
                     apartment_complexes_in_town,
-                    key=lambda ac: self.city.distance_between(ac.lot, self.city.downtown)
+                    key=lambda ac: distances_to_downtown[ac.lot.index]
                 )
             complex_that_will_expand.expand()  # This will add two new units to this complex
             self.move(
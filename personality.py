@@ -1,6 +1,3 @@
-import random
-
-
 class Personality(object):
     """A person's personality."""
 
@@ -88,21 +85,22 @@ class Personality(object):
     def _determine_personality_feature(self, feature_type):
         """Determine a value for a Big Five personality trait."""
         config = self.person.game.config
+        rng = self.person.game.rng.demographics
         feature_will_get_inherited = (
             self.person.biological_mother and
-            random.random() < config.big_five_heritability_chance[feature_type]
+            rng.random() < config.big_five_heritability_chance[feature_type]
         )
         if feature_will_get_inherited:
             # Inherit this trait (with slight variance)
-            takes_after = random.choice([self.person.biological_father, self.person.biological_mother])
-            feature_value = random.normalvariate(
+            takes_after = rng.choice([self.person.biological_father, self.person.biological_mother])
+            feature_value = rng.normalvariate(
                 self._get_a_persons_feature_of_type(person=takes_after, feature_type=feature_type),
                 config.big_five_inheritance_sd[feature_type]
             )
         else:
             takes_after = None
             # Generate from the population mean
-            feature_value = random.normalvariate(
+            feature_value = rng.normalvariate(
                 config.big_five_mean[feature_type], config.big_five_sd[feature_type]
             )
         if feature_value < config.big_five_floor:
@@ -118,8 +116,9 @@ class Personality(object):
         In lieu of any actual sources (since I couldn't find any), this is entirely home-cooked
         based on my intuitions.
         """
+        rng = self.person.game.rng.demographics
         personality_component = (float(self.o)*2 + float(self.c)*0.5 + float(self.a))
-        chance_component = random.random() * (1.0 if random.random() < 0.5 else -1.0)
+        chance_component = rng.random() * (1.0 if rng.random() < 0.5 else -1.0)
         # Now divide by 4.5 to get this on the -1 to 1 scale (since -4.5 is the lowest
         # possible sum of personality_component+chance_component and 4.5 is the highest)
         interest_in_history = (personality_component + chance_component) / 4.5
@@ -172,4 +171,8 @@ class Feature(float):
 
     def __new__(cls, value, inherited_from):
         """Do float stuff."""
-        return float.__new__(cls, value)
\ No newline at end of file
+        return float.__new__(cls, value)
+
+    def __getnewargs__(self):
+        """Return the arguments to pass to __new__() when unpickling (other attributes get restored after)."""
+        return float(self), None
@@ -1,5 +1,4 @@
 import json
-import random
 
 
 class Productionist(object):
@@ -126,7 +125,7 @@ class Productionist(object):
         satisficing_symbols = [s for s in self.nonterminal_symbols if markup_lambda_expression(s)]
         # Randomly shuffle these symbols, which will mean that ties in the sort we are about
         # to do will be ordered differently across different generation instances
-        random.shuffle(satisficing_symbols)
+        self.game.rng.nlg.shuffle(satisficing_symbols)
         # Sort this list according to the given symbol_sort_lambda_expression (for
         # dialogue, this will be simply produce a random sort)
         satisficing_symbols.sort(key=lambda ss: symbol_sort_evaluation_function(ss), reverse=True)
@@ -367,7 +366,7 @@ class Productionist(object):
         # rule-head groups, since the application rates of rules in different groups
         # only mean anything relative to the other rules in that same group, not to
         # rules in other groups)
-        random.shuffle(rule_heads)
+        self.game.rng.nlg.shuffle(rule_heads)
         # Probabilistically sort each head group
         for head in rule_heads:
             rules_sharing_this_head = [rule for rule in rules if rule.head is head]
@@ -391,7 +390,7 @@ class Productionist(object):
             probability_ranges = self._fit_probability_distribution_to_rules_according_to_an_evaluation_metric(
                 rules=remaining_rules, rule_evaluation_metric=rule_evaluation_metric
             )
-            x = random.random()
+            x = self.game.rng.nlg.random()
             probabilistically_selected_rule = next(
                 rule for rule in remaining_rules if probability_ranges[rule][0] <= x <= probability_ranges[rule][1]
             )
@@ -531,6 +530,17 @@ class Condition(object):
         self.test = eval(condition)  # The condition is literally a lambda function
         self.arguments = self._init_parse_condition_for_its_arguments(condition=condition)
 
+    def __getstate__(self):
+        """Return the state of this object for pickling, excluding the (unpicklable) lambda function."""
+        state = dict(self.__dict__)
+        del state['test']
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of this object upon unpickling, recompiling its lambda function."""
+        self.__dict__.update(state)
+        self.test = eval(self.condition)
+
     @staticmethod
     def _init_parse_condition_for_its_arguments(condition):
         """Parse this condition's specification (a lambda function) to gather the arguments that it requires."""
@@ -639,7 +649,7 @@ class DialogueGenerator(Productionist):
         # it performs the given dialogue move
         raw_derivation_built_by_targeting_this_symbol = self.target_markup(
             markup_lambda_expression=lambda symbol: move_name in symbol.moves,
-            symbol_sort_evaluation_function=lambda symbol: random.random(),
+            symbol_sort_evaluation_function=lambda symbol: self.game.rng.nlg.random(),
             state=conversation, rule_evaluation_metric=lambda rule: rule.application_rate
         )
         if not raw_derivation_built_by_targeting_this_symbol:
@@ -665,7 +675,7 @@ class DialogueGenerator(Productionist):
         # it performs the given dialogue move
         raw_derivation_built_by_targeting_this_symbol = self.target_markup(
             markup_lambda_expression=lambda symbol: topic_names & symbol.topics_addressed,
-            symbol_sort_evaluation_function=lambda symbol: random.random(),
+            symbol_sort_evaluation_function=lambda symbol: self.game.rng.nlg.random(),
             state=conversation, rule_evaluation_metric=lambda rule: rule.application_rate
         )
         if not raw_derivation_built_by_targeting_this_symbol:
@@ -0,0 +1,111 @@
+import collections
+import json
+import sys
+import timeit
+
+
+class Profiler(object):
+    """An instrumentation layer for the simulation loops of a gameplay instance.
+
+    The lo-fi and hi-fi simulation loops mark off their stages (routines, observation,
+    socializing, deterioration, etc.) by calling this object's methods; while profiling is
+    enabled, the time spent in each stage and the number of calls made to it are tallied up
+    for each timestep, as are the numbers of Facet, PieceOfEvidence, Relationship, and Event
+    objects created. At the end of each timestep, these tallies are written out as a record in
+    a trace file (in the JSON Lines format), which can be turned into collapsed stacks for
+    flame-graph tooling by running this module as a script. While profiling is disabled, every
+    method returns immediately, so the instrumentation costs next to nothing.
+    """
+
+    def __init__(self):
+        """Initialize a Profiler object."""
+        self.enabled = False
+        self.trace_file = None
+        self.simulation = None  # Which simulation loop ('lo_fi' or 'hi_fi') the current timestep is in
+        self.stage_times = collections.Counter()
+        self.stage_calls = collections.Counter()
+        self.objects_created = collections.Counter()
+        self.last_mark = None  # Time at which the last stage (or the timestep) began
+
+    def enable(self, trace_filename):
+        """Begin profiling, writing a record for each timestep to the given trace file."""
+        if self.enabled:
+            self.disable()
+        self.trace_file = open(trace_filename, 'a')
+        self.enabled = True
+
+    def disable(self):
+        """Stop profiling and close the trace file."""
+        self.enabled = False
+        if self.trace_file:
+            self.trace_file.close()
+            self.trace_file = None
+
+    def begin_timestep(self, simulation):
+        """Begin tallying up a new timestep of the given simulation loop ('lo_fi' or 'hi_fi')."""
+        if not self.enabled:
+            return
+        self.simulation = simulation
+        self.stage_times.clear()
+        self.stage_calls.clear()
+        self.objects_created.clear()
+        self.last_mark = timeit.default_timer()
+
+    def lap(self, stage, n_calls=1):
+        """Attribute the time since the last lap (or since the timestep began) to the given stage."""
+        if not self.enabled or self.last_mark is None:
+            return
+        now = timeit.default_timer()
+        self.stage_times[stage] += now - self.last_mark
+        self.stage_calls[stage] += n_calls
+        self.last_mark = now
+
+    def note_creation(self, object_category):
+        """Tally the creation of an object of the given category (e.g., 'Facet')."""
+        if not self.enabled:
+            return
+        self.objects_created[object_category] += 1
+
+    def end_timestep(self, game):
+        """Write out the record for the current timestep."""
+        if not self.enabled or self.last_mark is None:
+            return
+        record = {
+            'ordinal_date': game.ordinal_date,
+            'time_of_day': game.time_of_day,
+            'simulation': self.simulation,
+            'stage_times': self.stage_times,
+            'stage_calls': self.stage_calls,
+            'objects_created': self.objects_created,
+        }
+        self.trace_file.write(json.dumps(record) + '\n')
+        self.last_mark = None
+
+
+def write_collapsed_stacks(trace_filename, output_file, per_timestep=False):
+    """Convert a trace file into collapsed stacks (with microsecond weights) for flame-graph tooling.
+
+    @param trace_filename: The path to a trace file written by a Profiler.
+    @param output_file: A file object to write the collapsed stacks to.
+    @param per_timestep: Whether to give each timestep its own frame at the root of the stacks,
+                         rather than aggregating the stages of all timesteps together.
+    """
+    totals = collections.OrderedDict()
+    with open(trace_filename) as trace_file:
+        for line in trace_file:
+            record = json.loads(line)
+            frames = [record['simulation']]
+            if per_timestep:
+                frames.insert(0, '{ordinal_date}_{time_of_day}'.format(**record))
+            for stage, seconds in record['stage_times'].iteritems():
+                stack = ';'.join(frames + [stage])
+                totals[stack] = totals.get(stack, 0) + seconds
+    for stack, seconds in totals.iteritems():
+        output_file.write('{stack} {microseconds}\n'.format(stack=stack, microseconds=int(seconds * 1000000)))
+
+
+if __name__ == '__main__':
+    # Usage: python profiling.py trace.jsonl [--per-timestep] > stacks.txt
+    write_collapsed_stacks(
+        trace_filename=sys.argv[1], output_file=sys.stdout, per_timestep='--per-timestep' in sys.argv[2:]
+    )
@@ -1,4 +1,5 @@
 from belief import *
+from rng import StablyHashed
 
 # TODO dating and attendant nuances (after break-up, do they go back to previous relationship
 # or do they become enemies?)
@@ -8,7 +9,7 @@ from belief import *
 # TODO NORMALIZE CHARGE, SPARK, TRUST
 
 
-class Relationship(object):
+class Relationship(StablyHashed):
     """A social and/or romantic relationship between two people."""
 
     def __init__(self, owner, subject, preceded_by):
@@ -35,6 +36,7 @@ class Relationship(object):
             self.owner.game.ordinal_date
         )
         self.total_interactions = 0
+        owner.game.profiler.note_creation(object_category='Relationship')
         # Set this as the primary relationship owner has with subject
         owner.relationships[subject] = self
         if not preceded_by:
@@ -65,14 +67,18 @@ class Relationship(object):
         self.job_level_difference_effect_on_spark_increment = None
         self.update_spark_and_charge_increments_for_new_age_difference()
         self.update_spark_and_charge_increments_for_job_level_difference()
-        # This attribute records whether the other person has already called the
-        # progress_relationship() method of this object on this timestep -- it gets
-        # set to True by progress_relationship() and then turned back to False by
-        # Game.enact_hi_fi_simulation()
-        self.interacted_this_timestep = False
+        # This attribute records the game's timestep number (see Game.simulated_timestep_number)
+        # as of the last time that progress_relationship() was called on this object, which tells
+        # whether the other person has already called it on this timestep
+        self.timestep_of_last_interaction = None
         # Keep track of all the conversations they've had during hi-fi timesteps
         self.conversations = []
 
+    @property
+    def interacted_this_timestep(self):
+        """Return whether progress_relationship() has already been called on this object on this timestep."""
+        return self.timestep_of_last_interaction == self.owner.game.simulated_timestep_number
+
     def _init_get_compatibility(self):
         """Determine the objective compatibility of these two people.
 
@@ -320,7 +326,7 @@ class Relationship(object):
             self.owner.game.ordinal_date
         )
         # Increment salience
-        self.owner.salience_of_other_people[self.subject] += config.salience_increment_for_social_interaction
+        owner.update_salience_of(entity=subject, change=config.salience_increment_for_social_interaction)
         # Progress charge, possibly leading to a Friendship or Enmity
         change_to_charge = (
             self.charge_increment * self.age_difference_effect_on_charge_increment *
@@ -356,7 +362,7 @@ class Relationship(object):
             elif owner.spouse in owner.relationships:
                 if self.spark > owner.relationships[owner.spouse] * 2:
                     owner.divorce(partner=owner.spouse)
-        self.interacted_this_timestep = True
+        self.timestep_of_last_interaction = owner.game.simulated_timestep_number
         # Call this method for the subject's own conception of this relationship
         # to update its attributes according to this interaction
         if not subject.relationships[owner].interacted_this_timestep:
@@ -1,7 +1,7 @@
-import random
+from rng import StablyHashed
 
 
-class DwellingPlace(object):
+class DwellingPlace(StablyHashed):
     """A dwelling place in a city."""
 
     def __init__(self, lot, owners):
@@ -0,0 +1,137 @@
+import hashlib
+import itertools
+import random
+
+
+class RNG(object):
+    """The random-number service for a gameplay instance.
+
+    Rather than drawing from Python's global random number generator, every subsystem
+    of the simulation draws from its own stream, each of which is a random.Random object
+    that is seeded (deterministically) from the game's seed. This makes a run reproducible
+    given its seed, and it also keeps the subsystems independent of one another, so that
+    (for instance) a change to how many random numbers the NLG module draws won't alter
+    the course of the town's history.
+
+    The streams are:
+        citygen: The layout of the town and the names of its streets.
+        demographics: Births, deaths, marriages, careers, businesses, and everything
+                      else that makes up the town's history.
+        routines: Where people go each timestep, who they socialize with, and the weather.
+        knowledge: Observation, propagation, and deterioration of knowledge.
+        nlg: Natural language generation, and conversation more broadly.
+        cosmetic: Choices that only affect what gets displayed, such as which event the lo-fi
+                  progress ticker shows, so that changing how (or whether) progress is shown
+                  never alters the course of the simulation.
+    """
+
+    streams = ('citygen', 'demographics', 'routines', 'knowledge', 'nlg', 'cosmetic')
+
+    def __init__(self, seed):
+        """Initialize an RNG object.
+
+        @param seed: An integer from which the seed for each stream will be derived.
+        """
+        self.seed = seed
+        self.citygen = None
+        self.demographics = None
+        self.routines = None
+        self.knowledge = None
+        self.nlg = None
+        self.cosmetic = None
+        self.reseed(seed=seed)
+
+    def reseed(self, seed):
+        """Reseed all the streams, deriving each stream's seed from the given one."""
+        self.seed = seed
+        for stream_name in self.streams:
+            stream_seed = int(hashlib.md5('{seed}:{stream}'.format(seed=seed, stream=stream_name)).hexdigest(), 16)
+            setattr(self, stream_name, random.Random(stream_seed))
+
+
+class StablyHashedClass(type):
+    """The metaclass of StablyHashed, which hashes the classes themselves by name.
+
+    Classes are hashed by memory address too, and the subclasses of StablyHashed (e.g., the
+    occupation and business types) are used as dictionary keys all over, such as in the
+    scores that companies give to job candidates.
+    """
+
+    def __hash__(cls):
+        """Return a hash of this class that is stable across runs."""
+        return hash((cls.__module__, cls.__name__))
+
+
+class StablyHashed(object):
+    """A mixin for simulation objects that get collected into sets or used as dictionary keys.
+
+    By default, an object is hashed by its memory address, which differs from run to run;
+    because the order in which a set is iterated over depends on the hashes of its elements,
+    and because random choices are made as people, lots, businesses, etc. are iterated over,
+    this would cause two runs with the same seed to diverge. Objects of classes that use this
+    mixin are instead hashed by a serial number that is assigned when they are created.
+    """
+
+    __metaclass__ = StablyHashedClass
+    __slots__ = ()  # So that subclasses declaring slots (e.g., the evidence types) have no per-object dictionary
+    serial_numbers = itertools.count()
+
+    def __new__(cls, *args, **kwargs):
+        """Create a new object and assign it the next serial number."""
+        new_object = super(StablyHashed, cls).__new__(cls)
+        new_object.serial_number = next(StablyHashed.serial_numbers)
+        return new_object
+
+    def __hash__(self):
+        """Return a hash of this object that is stable across runs."""
+        return self.serial_number
+
+    def __reduce_ex__(self, protocol):
+        """Return instructions for pickling this object.
+
+        The serial number must be restored before anything else is, since this object may be
+        added to a set (or used as a dictionary key) while the rest of its state is still being
+        unpickled, as happens whenever the object graph has a cycle through this object. Objects
+        of classes that declare slots have no __dict__, in which case their state is given as a
+        (None, slot state) pair, which is the form that pickle itself restores slots from.
+        """
+        try:
+            state = self.__dict__
+        except AttributeError:
+            state = (None, _slot_state(self))
+        return _restore_stably_hashed_object, (self.__class__, self.serial_number), state
+
+    @staticmethod
+    def restart_serial_numbers(next_serial_number=0):
+        """Start assigning serial numbers from the given one.
+
+        This is done from zero for each new gameplay instance, and from wherever the saved gameplay
+        instance had left off when one is loaded from a snapshot.
+
+        @param next_serial_number: The serial number that the next object created will be assigned.
+        """
+        StablyHashed.serial_numbers = itertools.count(next_serial_number)
+
+    @staticmethod
+    def next_serial_number():
+        """Return the serial number that the next object created will be assigned."""
+        next_serial_number = next(StablyHashed.serial_numbers)
+        StablyHashed.serial_numbers = itertools.count(next_serial_number)
+        return next_serial_number
+
+
+def _slot_state(obj):
+    """Return a dictionary mapping the names of the set slots of the given object to their values."""
+    slot_state = {}
+    for cls in type(obj).__mro__:
+        for slot in cls.__dict__.get('__slots__', ()):
+            if slot not in ('serial_number', '__weakref__') and hasattr(obj, slot):
+                slot_state[slot] = getattr(obj, slot)
+    return slot_state
+
+
+def _restore_stably_hashed_object(cls, serial_number):
+    """Recreate an object of a StablyHashed class with the given serial number (used in unpickling)."""
+    restored_object = object.__new__(cls)
+    restored_object.serial_number = serial_number
+    return restored_object
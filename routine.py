@@ -1,6 +1,3 @@
-import random
-
-
 # TODO -- visiting methods don't take into account
 # whether the person they will visit is even home;
 # once we implement a telephone system, have them
@@ -34,6 +31,7 @@ class Routine(object):
         """Return the location at which this person will spend the next timestep, as well as the
         occasion for them doing so.
         """
+        rng = self.person.game.rng.routines
         config = self.person.game.config
         # If they're a kid, potentially send them to school or daycare -- TODO NO DAYCARE IF PARENT HOME
         if not self.person.adult:
@@ -45,13 +43,13 @@ class Routine(object):
                 location, occasion = self.person.home, 'home'  # Kids stay home at night
         # If they have a job...
         elif self.person.occupation and self.person.occupation.shift == self.person.game.time_of_day:
-            if random.random() < config.chance_someone_doesnt_have_to_work_some_day:
-                if random.random() < config.chance_someone_leaves_home_on_day_off[self.person.game.time_of_day]:
+            if rng.random() < config.chance_someone_doesnt_have_to_work_some_day:
+                if rng.random() < config.chance_someone_leaves_home_on_day_off[self.person.game.time_of_day]:
                     location, occasion = self._go_in_public()
                 else:
                     location, occasion = self.person.home, 'home'
-            elif random.random() < config.chance_someone_calls_in_sick_to_work:
-                if random.random() < config.chance_someone_leaves_home_on_sick_day:
+            elif rng.random() < config.chance_someone_calls_in_sick_to_work:
+                if rng.random() < config.chance_someone_leaves_home_on_sick_day:
                     location, occasion = self._go_in_public()
                 else:
                     location, occasion = self.person.home, 'home'
@@ -72,7 +70,7 @@ class Routine(object):
                 chance_of_leaving_home = floor
             elif chance_of_leaving_home > cap:
                 chance_of_leaving_home = cap
-            if random.random() < chance_of_leaving_home:
+            if rng.random() < chance_of_leaving_home:
                 location, occasion = self._go_in_public()
             else:
                 location, occasion = self.person.home, 'home'
@@ -91,7 +89,7 @@ class Routine(object):
     def _go_in_public(self):
         """Return the location in public that this person will go to."""
         config = self.person.game.config
-        if random.random() < config.chance_someone_goes_on_errand_vs_visits_someone:
+        if self.person.game.rng.routines.random() < config.chance_someone_goes_on_errand_vs_visits_someone:
             location, occasion = self._go_on_errand_or_out_for_leisure()
         else:
             person_they_will_visit = self._visit_someone()
@@ -108,11 +106,12 @@ class Routine(object):
     def _go_on_errand_or_out_for_leisure(self):
         """Return the location associated with some errand this person will go on."""
         config = self.person.game.config
+        rng = self.person.game.rng.routines
         # TODO -- if someone goes on one of these errands, have them actually get
         # served by that business, e.g., have them actually get a haircut
         # TODO -- have people become loyal to certain businesses (or maybe not because such small town?)
         # Determine the type of service this errand will be for
-        x = random.random()
+        x = rng.random()
         service_type_probs = config.probabilities_of_errand_for_service_type[self.person.game.time_of_day]
         service_type_of_errand = next(
             # See config.py to understand what's going on here
@@ -122,24 +121,24 @@ class Routine(object):
             b for b in self.person.city.companies if service_type_of_errand in b.services
         ]
         if businesses_in_town_providing_that_service:
-            if random.random() < config.chance_someone_goes_to_closest_business_of_type:
+            if rng.random() < config.chance_someone_goes_to_closest_business_of_type:
                 # Choose between the one closest to your house and the one closest to your work
+                distances_from_home = self.person.city.distances_from(self.person.home.lot)
                 closest_to_home = min(
                     businesses_in_town_providing_that_service,
-                    key=lambda business: self.person.city.distance_between(self.person.home.lot, business.lot)
+                    key=lambda business: distances_from_home[business.lot.index]
                 )
                 if self.person.occupation:
+                    distances_from_work = self.person.city.distances_from(self.person.occupation.company.lot)
                     closest_to_work = min(
                         businesses_in_town_providing_that_service,
-                        key=lambda business: self.person.city.distance_between(
-                            self.person.occupation.company.lot, business.lot
-                        )
+                        key=lambda business: distances_from_work[business.lot.index]
                     )
-                    one_i_will_go_to = closest_to_home if random.random() < 0.5 else closest_to_work
+                    one_i_will_go_to = closest_to_home if rng.random() < 0.5 else closest_to_work
                 else:
                     one_i_will_go_to = closest_to_home
             else:
-                one_i_will_go_to = random.choice(businesses_in_town_providing_that_service)
+                one_i_will_go_to = rng.choice(businesses_in_town_providing_that_service)
         else:
             one_i_will_go_to = None
         # Determine whether the occasion is an errand or just leisure -- in the case of location
@@ -155,7 +154,7 @@ class Routine(object):
     def _visit_someone(self):
         """Return the residence of the person who this person will go visit."""
         config = self.person.game.config
-        x = random.random()
+        x = self.person.game.rng.routines.random()
         relationship_to_person_who_person_who_will_be_visited = next(
             r for r in config.who_someone_visiting_will_visit_probabilities if r[0][0] <= x <= r[0][1]
         )[1]
@@ -181,7 +180,7 @@ class Routine(object):
 
         TODO: Flesh this out.
         """
-        neighbor_they_will_visit = random.choice(list(self.person.neighbors))
+        neighbor_they_will_visit = self.person.game.rng.routines.choice(list(self.person.neighbors))
         return neighbor_they_will_visit
 
     def _visit_a_friend(self):
@@ -189,16 +188,17 @@ class Routine(object):
 
         TODO: Flesh this out.
         """
+        rng = self.person.game.rng.routines
         friends_person_doesnt_live_with = [
             f for f in self.person.friends if f.present and f.home is not self.person.home
         ]
-        if random.random() > 0.5:
+        if rng.random() > 0.5:
             # Visit best friend (who doesn't live with them)
             friend_they_will_visit = max(
                 friends_person_doesnt_live_with, key=lambda friend: self.person.relationships[friend].charge
             )
         else:
-            friend_they_will_visit = random.choice(friends_person_doesnt_live_with)
+            friend_they_will_visit = rng.choice(friends_person_doesnt_live_with)
         return friend_they_will_visit
 
     def _visit_an_immediate_family_member(self):
@@ -206,10 +206,11 @@ class Routine(object):
 
         TODO: Flesh this out.
         """
+        rng = self.person.game.rng.routines
         immediate_family_person_doesnt_live_with = [
             f for f in self.person.immediate_family if f.present and f.home is not self.person.home
         ]
-        immediate_family_they_will_visit = random.choice(immediate_family_person_doesnt_live_with)
+        immediate_family_they_will_visit = rng.choice(immediate_family_person_doesnt_live_with)
         return immediate_family_they_will_visit
 
     def _visit_an_extended_family_member(self):
@@ -220,5 +221,5 @@ class Routine(object):
         extended_family_person_doesnt_live_with = [
             f for f in self.person.extended_family if f.present and f.home is not self.person.home
         ]
-        extended_family_they_will_visit = random.choice(extended_family_person_doesnt_live_with)
+        extended_family_they_will_visit = self.person.game.rng.routines.choice(extended_family_person_doesnt_live_with)
         return extended_family_they_will_visit
\ No newline at end of file
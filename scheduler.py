@@ -0,0 +1,456 @@
+import bisect
+import calendar
+import datetime
+import heapq
+import itertools
+import math
+
+
+# The order in which the happenings that are scheduled for the same timestep get enacted,
+# which mirrors the order of the stages of a timestep in Game.enact_lo_fi_simulation()
+BIRTHDAYS, BUSINESS_OPENING, BUSINESS_CLOSING, BIRTH, SIMULATED_TIMESTEP = range(5)
+# How many timesteps ahead DeteriorationScheduler bounds the chance that a belief facet deteriorates;
+# if no deterioration is sampled within this window, the facet gets looked at again once it has passed
+DETERIORATION_WINDOW = 20
+# These stand in for the chance bound of a facet that is due to be looked at again, and for the timestep
+# due of a facet that is due to be resampled (they're numbers, which neither can be, so that they still
+# compare equal once a snapshot has been loaded)
+LOOK_AGAIN = -1.0
+PENDING = -1
+
+
+def timestep_number(ordinal_date, time_of_day):
+    """Return the number of the timestep with the given ordinal date and time of day.
+
+    Timesteps are numbered such that the day timestep of an ordinal date is twice that date
+    and the night timestep is the one after it.
+    """
+    return ordinal_date*2 + (0 if time_of_day == 'day' else 1)
+
+
+def timesteps_until_success(probability, rng):
+    """Sample the number of per-timestep trials it takes for something with the given chance to happen."""
+    if probability >= 1:
+        return 1
+    return int(math.log(1.0 - rng.random()) / math.log(1.0 - probability)) + 1
+
+
+class LoFiScheduler(object):
+    """A discrete-event engine for lo-fi simulation.
+
+    Rather than walking through every timestep and throwing a coin at each one to decide
+    whether anything happens, this engine keeps a priority queue of scheduled happenings --
+    the days on which someone in town has a birthday, business openings and closings, births (on the mothers' due
+    dates), and the timesteps that get sampled for full simulation of demographics and social
+    life (see Game.enact_lo_fi_timestep()) -- and jumps straight from one to the next. The
+    happenings whose timing is random are scheduled by sampling, from the geometric distribution,
+    the number of timesteps until the next one, which has the same distribution as throwing the
+    per-timestep coin until it comes up heads; as such, a town generated by this engine is
+    statistically like one generated by stepping through the timesteps, but it won't be the
+    same town, even given the same seed.
+    """
+
+    def __init__(self, game):
+        """Initialize a LoFiScheduler object.
+
+        @param game: The gameplay instance whose lo-fi simulation this engine will drive.
+        """
+        self.game = game
+        self.rng = game.rng.demographics
+        self.queue = []  # A heap of (timestep, order, sequence number, handler, argument) tuples
+        self.sequence_numbers = itertools.count()  # Breaks ties, so that handlers never get compared
+        self.timestep = timestep_number(ordinal_date=game.ordinal_date, time_of_day=game.time_of_day)
+        self.companies_scheduled_to_close = set()
+        self.timestep_of_next_births = None  # When the earliest due date in Game.pregnancies comes
+        self.timestep_of_next_birthdays = None  # The next day on which someone in town has a birthday
+
+    def run(self, n_timesteps):
+        """Simulate the given number of timesteps, enacting only the ones that have something scheduled."""
+        game = self.game
+        profiler = game.profiler
+        final_timestep = self.timestep + n_timesteps
+        self._schedule_initial_happenings()
+        while self.queue and self.queue[0][0] <= final_timestep:
+            self.timestep = self.queue[0][0]
+            profiler.begin_timestep(simulation='lo_fi')
+            ordinal_date, night = divmod(self.timestep, 2)
+            game.skip_to_timestep(ordinal_date=ordinal_date, time_of_day='night' if night else 'day')
+            profiler.lap('advance_time')
+            while self.queue and self.queue[0][0] == self.timestep:
+                _, _, _, handler, argument = heapq.heappop(self.queue)
+                handler(argument)
+            game.report_lo_fi_progress()
+            profiler.lap('progress_ticker')
+            profiler.end_timestep(game=game)
+        # Leave the clock where it would be had every timestep been walked through
+        if self.timestep != final_timestep:
+            ordinal_date, night = divmod(final_timestep, 2)
+            game.skip_to_timestep(ordinal_date=ordinal_date, time_of_day='night' if night else 'day')
+
+    def schedule(self, timestep, order, handler, argument=None):
+        """Schedule the given handler to be called with the given argument at the given timestep."""
+        heapq.heappush(self.queue, (timestep, order, next(self.sequence_numbers), handler, argument))
+
+    def _schedule_initial_happenings(self):
+        """Schedule the first happening of each kind."""
+        config = self.game.config
+        self._schedule_birthdays()
+        self._schedule_next(
+            order=BUSINESS_OPENING, handler=self._open_a_business,
+            probability=config.chance_a_business_opens_some_timestep
+        )
+        self._schedule_next(
+            order=SIMULATED_TIMESTEP, handler=self._enact_simulated_timestep,
+            probability=config.chance_of_a_timestep_being_simulated
+        )
+        self._schedule_new_business_closings()
+        self._schedule_births()
+
+    def _schedule_next(self, order, handler, probability, argument=None, earliest_timestep=None):
+        """Schedule the next occurrence of a happening that has the given chance of occurring each timestep."""
+        if probability <= 0:
+            return  # It will never happen
+        earliest_timestep = self.timestep if earliest_timestep is None else max(self.timestep, earliest_timestep)
+        self.schedule(
+            timestep=earliest_timestep + timesteps_until_success(probability=probability, rng=self.rng),
+            order=order, handler=handler, argument=argument
+        )
+
+    def _schedule_new_business_closings(self):
+        """Schedule the closing of every company in town that doesn't already have its closing scheduled."""
+        for business in self.game.city.companies - self.companies_scheduled_to_close:
+            if business.__class__ not in self.game.config.public_company_types:
+                self.companies_scheduled_to_close.add(business)
+                self._schedule_business_closing(business=business)
+
+    def _schedule_business_closing(self, business):
+        """Schedule the closing of the given business, which becomes far likelier once it's anachronistic."""
+        config = self.game.config
+        timestep_of_demise = timestep_number(
+            ordinal_date=datetime.date(max(business.demise, datetime.MINYEAR), 1, 1).toordinal(), time_of_day='day'
+        )
+        if self.timestep < timestep_of_demise:
+            timestep = self.timestep + timesteps_until_success(
+                probability=config.chance_a_business_closes_some_timestep, rng=self.rng
+            )
+            if timestep < timestep_of_demise:
+                self.schedule(
+                    timestep=timestep, order=BUSINESS_CLOSING, handler=self._close_business, argument=business
+                )
+                return
+        # Because the per-timestep chances are memoryless, we can resample from the demise onward
+        self._schedule_next(
+            order=BUSINESS_CLOSING, handler=self._close_business, argument=business,
+            probability=config.chance_a_business_shuts_down_on_timestep_after_its_demise,
+            earliest_timestep=timestep_of_demise-1
+        )
+
+    def _schedule_births(self):
+        """Schedule the delivery of babies for the earliest due date among the game's pregnancies."""
+        pregnancies = self.game.pregnancies
+        if not pregnancies:
+            return
+        timestep = max(timestep_number(ordinal_date=pregnancies[0][0], time_of_day='day'), self.timestep+1)
+        if self.timestep_of_next_births is None or timestep < self.timestep_of_next_births:
+            self.timestep_of_next_births = timestep
+            self.schedule(timestep=timestep, order=BIRTH, handler=self._deliver_babies)
+
+    def _schedule_birthdays(self):
+        """Schedule the celebration of birthdays for the next day on which someone in town has one.
+
+        This gets called again whenever new people may have come to town (by birth or by moving
+        in), since one of them may have a birthday that comes sooner. The next day is looked up in
+        the game's calendar of birthday celebrations (see Game.register_birthday()).
+        """
+        days_with_birthday_celebrations = self.game.days_with_birthday_celebrations
+        if not days_with_birthday_celebrations:
+            return
+        today = datetime.date.fromordinal(self.timestep // 2)
+        # Find the first day on the calendar that comes after today, wrapping around into the next
+        # year if need be; a February 29 is skipped in a year that lacks one, but the leap-year
+        # babies who celebrate on it will then be celebrating on March 1, which is also listed
+        next_birthday = None
+        first = bisect.bisect_right(days_with_birthday_celebrations, (today.month, today.day))
+        for year, days in (
+            (today.year, days_with_birthday_celebrations[first:]), (today.year+1, days_with_birthday_celebrations)
+        ):
+            for month, day in days:
+                if (month, day) != (2, 29) or calendar.isleap(year):
+                    next_birthday = datetime.date(year, month, day)
+                    break
+            if next_birthday:
+                break
+        timestep = timestep_number(ordinal_date=next_birthday.toordinal(), time_of_day='day')
+        if self.timestep_of_next_birthdays is None or timestep < self.timestep_of_next_birthdays:
+            self.timestep_of_next_birthdays = timestep
+            self.schedule(timestep=timestep, order=BIRTHDAYS, handler=self._celebrate_birthdays)
+
+    def _celebrate_birthdays(self, _):
+        """Age everyone whose birthday is today, unless birthdays were since scheduled for an earlier day."""
+        if self.timestep != self.timestep_of_next_birthdays:
+            return
+        self.timestep_of_next_birthdays = None
+        self.game.celebrate_birthdays()
+        self._schedule_birthdays()
+        self.game.profiler.lap('birthdays')
+
+    def _open_a_business(self, _):
+        """Have a new business open, unless the town needs an apartment complex more."""
+        if not self.game.potentially_establish_an_apartment_complex():
+            self.game.establish_a_new_business()
+        self._schedule_new_business_closings()
+        self._schedule_birthdays()
+        self._schedule_next(
+            order=BUSINESS_OPENING, handler=self._open_a_business,
+            probability=self.game.config.chance_a_business_opens_some_timestep
+        )
+        self.game.profiler.lap('businesses')
+
+    def _close_business(self, business):
+        """Have the given business go out of business, if it's still operating and allowed to close."""
+        game = self.game
+        if business not in game.city.companies:
+            self.companies_scheduled_to_close.discard(business)
+        elif business.demise <= game.year or not (
+            # Don't shut down an apartment complex with people living in it,
+            # or an apartment complex that's the only one in town
+            business.__class__.__name__ == 'ApartmentComplex' and business.residents or
+            len(game.city.businesses_of_type('ApartmentComplex')) == 1
+        ):
+            business.go_out_of_business(reason=None)
+            self.companies_scheduled_to_close.discard(business)
+            # Closing a business may have freed up a lot, but it may also have left the town in need
+            # of an apartment complex, which Game.enact_lo_fi_simulation() checks for every timestep
+            game.potentially_establish_an_apartment_complex()
+            self._schedule_new_business_closings()
+            self._schedule_birthdays()
+        else:
+            self._schedule_business_closing(business=business)
+        game.profiler.lap('businesses')
+
+    def _deliver_babies(self, _):
+        """Deliver the babies that are due, unless a delivery was since scheduled for an earlier timestep."""
+        if self.timestep != self.timestep_of_next_births:
+            return
+        self.timestep_of_next_births = None
+        self.game.deliver_babies_that_are_due()
+        self._schedule_births()
+        self._schedule_birthdays()
+        self.game.profiler.lap('births')
+
+    def _enact_simulated_timestep(self, _):
+        """Simulate this timestep's demographics and social life, and schedule the next sampled timestep."""
+        game = self.game
+        game.enact_lo_fi_timestep()
+        game.potentially_establish_an_apartment_complex()
+        self._schedule_new_business_closings()
+        self._schedule_births()
+        self._schedule_birthdays()
+        self._schedule_next(
+            order=SIMULATED_TIMESTEP, handler=self._enact_simulated_timestep,
+            probability=game.config.chance_of_a_timestep_being_simulated
+        )
+
+
+class DeteriorationScheduler(object):
+    """A discrete-event engine for the deterioration of people's mental models during hi-fi simulation.
+
+    On every hi-fi timestep, each facet of a person's mental models of other people, homes, and
+    businesses has a chance of deteriorating (by confabulation, mutation, transference, or forgetting)
+    that depends on the strength of the facet (see MentalModel.chance_of_deterioration()). Rather
+    than throwing that coin for every facet in town on every timestep, this engine samples the
+    timestep at which each facet will next deteriorate and files it in a calendar, so that only
+    the facets that are due get visited.
+
+    Because the strength of a facet decays daily, its chance of deteriorating grows from one
+    timestep to the next. The sampling handles this by thinning: over a window of the next
+    DETERIORATION_WINDOW timesteps, the chance is bounded by the chance at the end of the window
+    (when the facet will be weakest, barring new evidence), and the first timestep at which a coin
+    with that bounded chance would come up heads is sampled from the geometric distribution; once
+    that timestep comes, the facet deteriorates with the probability of its true chance over the
+    bounded one, which makes for exactly the true chance on every timestep. New evidence only ever
+    strengthens a facet, lowering its chance, so the bound stays valid; a new facet being adopted
+    causes the facet to be sampled anew, as does the passing of a window in which nothing came up.
+
+    The engine starts tracking every mental model of every resident the first time it's run, and
+    starts over whenever a timestep goes by without it being run (e.g., during lo-fi simulation,
+    which suspends it); until then, the hooks that keep it up to date do nothing.
+    """
+
+    def __init__(self, game):
+        """Initialize a DeteriorationScheduler object.
+
+        @param game: The gameplay instance whose mental models this engine will deteriorate.
+        """
+        self.game = game
+        self.active = False
+        self.timestep_of_last_run = None
+        # Maps each tracked mental model to a dictionary mapping the feature types of its facets that
+        # may deteriorate to [mental model, feature type, strength floor, timestep due, chance bound,
+        # chance at unit strength, chance without a facet] records; the timestep due is None for a facet
+        # that will never deteriorate, and the chance bound is LOOK_AGAIN if the timestep due marks the
+        # end of a window in which no deterioration came up. (Records are lists, rather than objects,
+        # to spare the garbage collector, since there is one for nearly every facet in town.)
+        self.facets = {}
+        # Maps timesteps to lists of the records that were due then at the time they were filed; a
+        # record whose timestep due has since changed is skipped
+        self.calendar = {}
+        self.owners = set()  # The residents whose mental models are being tracked
+        # Mental models formed, and records of facets that have changed, since the last run; the
+        # timestep due of a record that is pending resampling is PENDING
+        self.mental_models_to_track = []
+        self.facets_to_resample = []
+
+    def suspend(self):
+        """Stop tracking mental models until the next run, e.g., for the duration of a lo-fi simulation."""
+        self.__init__(game=self.game)
+
+    def enact_deteriorations_due(self, timestep_during_gameplay=False):
+        """Deteriorate every facet whose deterioration is due at the current timestep.
+
+        @param timestep_during_gameplay: Whether this is a timestep during gameplay, in which case
+                                         the player character's mental models don't deteriorate.
+        """
+        game = self.game
+        timestep = timestep_number(ordinal_date=game.ordinal_date, time_of_day=game.time_of_day)
+        if self.timestep_of_last_run is not None and timestep != self.timestep_of_last_run+1:
+            self.suspend()  # Timesteps were skipped, so everything must be sampled anew
+        self.timestep_of_last_run = timestep
+        self.active = True
+        residents = game.city.residents
+        for person in residents - self.owners:
+            self.mental_models_to_track.extend(person.mind.mental_models.itervalues())
+        self.owners = set(residents)
+        for mental_model in self.mental_models_to_track:
+            self._track(mental_model=mental_model)
+        self.mental_models_to_track = []
+        for record in self.facets_to_resample:
+            if record[3] == PENDING:  # Otherwise, it's no longer tracked or was already sampled anew
+                self._schedule(record=record, timestep=timestep)
+        self.facets_to_resample = []
+        records = self.calendar.pop(timestep, [])
+        i = 0
+        while i < len(records):  # Records may get filed for this timestep as we go
+            if records[i][3] == timestep:
+                self._enact(record=records[i], timestep=timestep, timestep_during_gameplay=timestep_during_gameplay)
+            i += 1
+            if i == len(records) and timestep in self.calendar:
+                records += self.calendar.pop(timestep)
+
+    def note_new_mental_model(self, mental_model):
+        """Start tracking the facets of a newly formed mental model, as of the next run."""
+        if self.active:
+            self.mental_models_to_track.append(mental_model)
+
+    def note_adopted_belief(self, mental_model, feature_type):
+        """Resample the next deterioration of a facet whose currently held belief has changed, as of the next run."""
+        if self.active:
+            records = self.facets.get(mental_model)
+            if records and feature_type in records:
+                self._note_changed_facet(record=records[feature_type])
+
+    def _note_changed_facet(self, record):
+        """Resample the next deterioration of the facet of the given record, as of the next run."""
+        if record[3] != PENDING:
+            record[3] = PENDING
+            self.facets_to_resample.append(record)
+
+    def _track(self, mental_model):
+        """Start tracking the facets of the given mental model."""
+        if mental_model.subject is mental_model.owner or mental_model in self.facets:
+            return  # People's mental models of themselves don't deteriorate
+        self.facets[mental_model] = records = {}
+        for feature_type, strength_floor in mental_model.features_subject_to_deterioration():
+            # The chance of deterioration is inversely proportional to a facet's strength (above the
+            # floor, if any), except when there is no facet, in which case it's constant
+            chance_at_unit_strength = mental_model.chance_of_deterioration(
+                feature_type=feature_type, strength=1, strength_floor=None
+            )
+            chance_without_facet = mental_model.chance_of_deterioration(
+                feature_type=feature_type, strength=None, strength_floor=strength_floor
+            )
+            records[feature_type] = record = [
+                mental_model, feature_type, strength_floor, None, None, chance_at_unit_strength, chance_without_facet
+            ]
+            self._note_changed_facet(record=record)
+
+    def _untrack(self, record):
+        """Stop tracking the facet of the given record."""
+        mental_model, feature_type = record[:2]
+        record[3] = None
+        del self.facets[mental_model][feature_type]
+        if not self.facets[mental_model]:
+            del self.facets[mental_model]
+
+    def _schedule(self, record, timestep):
+        """Sample the next deterioration of the facet of the given record, from the given timestep on."""
+        game = self.game
+        mental_model, feature_type, strength_floor, _, _, chance_at_unit_strength, chance_without_facet = record
+        # (None of the feature types subject to deterioration are looked up specially, so their
+        # accessors can be used directly; see MentalModel.get_belief_facet_accessors())
+        current_belief_facet = mental_model.belief_facet_accessors[feature_type][0](mental_model)
+        if current_belief_facet is None:
+            # The chance of deterioration (i.e., confabulation) doesn't change over time, so it bounds itself
+            chance_bound = chance_without_facet
+            window = None
+        else:
+            # The facet will be at its weakest on the last day of the window
+            days_until_end_of_window = (timestep + DETERIORATION_WINDOW - 1) // 2 - game.ordinal_date
+            strength = (
+                current_belief_facet.strength *
+                game.config.decay_rate_of_belief_strength_per_day ** days_until_end_of_window
+            )
+            if strength_floor is not None and strength < strength_floor:
+                strength = strength_floor
+            chance_bound = chance_at_unit_strength / strength
+            window = DETERIORATION_WINDOW
+        if chance_bound <= 0:
+            record[3] = None
+            return  # It will never happen
+        if chance_bound > 1.0:
+            chance_bound = 1.0
+        n_timesteps = timesteps_until_success(probability=chance_bound, rng=game.rng.knowledge)
+        if window is not None and n_timesteps > window:
+            timestep_due = record[3] = timestep + window
+            record[4] = LOOK_AGAIN
+        else:
+            timestep_due = record[3] = timestep + n_timesteps - 1
+            record[4] = chance_bound
+        try:
+            self.calendar[timestep_due].append(record)
+        except KeyError:
+            self.calendar[timestep_due] = [record]
+
+    def _enact(self, record, timestep, timestep_during_gameplay):
+        """Deteriorate the facet of the given record with the probability of its true chance over its chance bound."""
+        game = self.game
+        mental_model, feature_type, strength_floor, _, chance_bound, chance_at_unit_strength = record[:6]
+        if chance_bound == LOOK_AGAIN:
+            self._schedule(record=record, timestep=timestep)
+            return
+        owner, subject = mental_model.owner, mental_model.subject
+        if not owner.present or owner.mind.mental_models.get(subject) is not mental_model:
+            self._untrack(record=record)
+            return
+        if not ((timestep_during_gameplay and owner is game.pc) or owner not in self.owners or subject is owner.home or
+                (owner.occupation and subject is owner.occupation.company)):
+            # (Only residents' mental models deteriorate, and not those of their homes and workplaces,
+            # nor the player character's during gameplay)
+            current_belief_facet = mental_model.belief_facet_accessors[feature_type][0](mental_model)
+            if current_belief_facet is None:
+                chance_of_memory_deterioration = record[6]
+            else:
+                strength = current_belief_facet.strength
+                if strength_floor is not None and strength < strength_floor:
+                    strength = strength_floor
+                chance_of_memory_deterioration = chance_at_unit_strength / strength
+            if (chance_of_memory_deterioration >= chance_bound or
+                    game.rng.knowledge.random() * chance_bound < chance_of_memory_deterioration):
+                # Adopting the deteriorated facet would otherwise cause it to be resampled as of the
+                # next run (see note_adopted_belief()), but we can do that right away
+                record[3] = PENDING
+                mental_model.deteriorate_belief_facet(
+                    feature_type=feature_type, current_belief_facet=current_belief_facet
+                )
+        # Whatever happened, sample anew from the next timestep on
+        self._schedule(record=record, timestep=timestep+1)
@@ -0,0 +1,169 @@
+import cPickle
+import cStringIO
+import io
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import zlib
+
+
+# Every snapshot file begins with this magic string, followed by a two-byte format version
+# number, followed by a zlib-compressed stream holding the pickle of the Game object graph and then
+# the files that its event store keeps on disk (see EventStore.write_archive()); the format version
+# must be bumped whenever a change to the codebase would make older snapshots unloadable
+#
+# A snapshot faithfully restores the state of a town, including the state of each of its random
+# streams and the counter from which serial numbers are assigned, but resuming a snapshot is not
+# equivalent to continuing the run that saved it: the order in which a set is iterated over depends
+# on the history of insertions into and deletions from it, not just on its contents, and unpickled
+# sets are rebuilt from scratch. Because random draws are made while iterating over sets of people,
+# lots, businesses, etc., a loaded town will (deterministically) diverge from the original after
+# its first such draw. Loading the same snapshot twice, however, does produce the same history.
+SNAPSHOT_MAGIC = 'TOTTSNAP'
+SNAPSHOT_FORMAT_VERSION = 20
+# The object graph of a town is very deeply nested (people point to relationships, which point
+# to other people, who point to their mental models, and so forth), so pickling and unpickling
+# it requires a much deeper recursion than Python allows by default; we do this work in a helper
+# thread that is given a large enough stack to accommodate the recursion
+SNAPSHOT_RECURSION_LIMIT = 1000000
+SNAPSHOT_THREAD_STACK_SIZE = 512 * 1024 * 1024
+
+
+# Pickled data is streamed through zlib a chunk of about this many bytes at a time, so that
+# neither the full pickle nor its full compression ever has to be held in memory
+SNAPSHOT_CHUNK_SIZE = 1024 * 1024
+
+
+def save(game, filename):
+    """Save a snapshot of the entire object graph of a gameplay instance to a file.
+
+    The snapshot is written to a temporary file alongside the given one, which is only renamed
+    to the given filename once it's complete, so that a save that fails partway through never
+    leaves a truncated snapshot in place of a good one.
+
+    @param game: The Game object to save.
+    @param filename: The path to which the snapshot will be written.
+    """
+    temporary_filename = filename + '.tmp'
+    try:
+        with open(temporary_filename, 'wb') as snapshot_file:
+            snapshot_file.write(SNAPSHOT_MAGIC)
+            snapshot_file.write(struct.pack('>H', SNAPSHOT_FORMAT_VERSION))
+            # The pickler writes many small strings, which the buffered writer collects into chunks
+            # before they are handed off to be compressed
+            compressed_file = io.BufferedWriter(
+                _CompressingWriter(snapshot_file=snapshot_file), buffer_size=SNAPSHOT_CHUNK_SIZE
+            )
+            pickler = cPickle.Pickler(compressed_file, cPickle.HIGHEST_PROTOCOL)
+            _run_with_deep_recursion(pickler.dump, game)
+            game.events.write_archive(stream=compressed_file)
+            compressed_file.close()
+        os.rename(temporary_filename, filename)
+    except BaseException:
+        if os.path.exists(temporary_filename):
+            os.remove(temporary_filename)
+        raise
+
+
+def load(filename):
+    """Load a gameplay instance from a snapshot file that was written by save().
+
+    @param filename: The path to the snapshot file.
+    """
+    with open(filename, 'rb') as snapshot_file, tempfile.TemporaryFile() as pickle_file:
+        magic = snapshot_file.read(len(SNAPSHOT_MAGIC))
+        if magic != SNAPSHOT_MAGIC:
+            raise Exception('{} is not a Talk of the Town snapshot file'.format(filename))
+        format_version = struct.unpack('>H', snapshot_file.read(2))[0]
+        if format_version != SNAPSHOT_FORMAT_VERSION:
+            raise Exception(
+                '{} is a snapshot of format version {}, but only version {} snapshots can be loaded'.format(
+                    filename, format_version, SNAPSHOT_FORMAT_VERSION
+                )
+            )
+        # The pickle is decompressed, a chunk at a time, into an anonymous temporary file, which is
+        # then mapped into memory and read through a cStringIO object; the unpickler makes a call
+        # to read() for nearly every opcode, and only these are fast when reading from a cStringIO
+        # object, while the mapped pages (unlike a string holding the whole pickle) are backed by
+        # the file, so they don't count against the heap and can be evicted under memory pressure
+        decompressor = zlib.decompressobj()
+        compressed_data = snapshot_file.read(SNAPSHOT_CHUNK_SIZE)
+        while compressed_data:
+            pickle_file.write(decompressor.decompress(compressed_data))
+            compressed_data = snapshot_file.read(SNAPSHOT_CHUNK_SIZE)
+        pickle_file.write(decompressor.flush())
+        pickle_file.flush()
+        mapped_pickle = mmap.mmap(pickle_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            snapshot_stream = cStringIO.StringIO(mapped_pickle)
+            unpickler = cPickle.Unpickler(snapshot_stream)
+            game = _run_with_deep_recursion(unpickler.load)
+            # The unpickler stops reading at the end of the pickle, which is where the archive begins
+            game.events.read_archive(stream=snapshot_stream)
+            return game
+        finally:
+            mapped_pickle.close()
+
+
+class _CompressingWriter(io.RawIOBase):
+    """A raw stream that compresses everything written to it into an underlying snapshot file."""
+
+    # The buffered stream that wraps this one checks whether it's closed on every call, and the
+    # 'closed' property that IOBase provides to Python subclasses is slow to look up, so we keep
+    # track of this ourselves
+    closed = False
+
+    def __init__(self, snapshot_file):
+        """Initialize a _CompressingWriter object.
+
+        @param snapshot_file: The open file to which compressed data will be written.
+        """
+        super(_CompressingWriter, self).__init__()
+        self.snapshot_file = snapshot_file
+        self.compressor = zlib.compressobj(1)
+
+    def writable(self):
+        """Return True, since this stream may be written to."""
+        return True
+
+    def write(self, data):
+        """Compress the given data into the snapshot file, and return the number of bytes consumed."""
+        data = memoryview(data).tobytes()
+        self.snapshot_file.write(self.compressor.compress(data))
+        return len(data)
+
+    def close(self):
+        """Finish the compressed stream (but leave the snapshot file itself open)."""
+        if not self.closed:
+            self.snapshot_file.write(self.compressor.flush())
+            self.closed = True
+
+
+def _run_with_deep_recursion(function, *args):
+    """Call the given function in a helper thread that affords a very deep recursion, and return its result."""
+    result, error = [], []
+
+    def target():
+        try:
+            result.append(function(*args))
+        except Exception:
+            error.append(sys.exc_info())
+
+    original_recursion_limit = sys.getrecursionlimit()
+    original_stack_size = threading.stack_size()
+    sys.setrecursionlimit(SNAPSHOT_RECURSION_LIMIT)
+    threading.stack_size(SNAPSHOT_THREAD_STACK_SIZE)
+    try:
+        helper_thread = threading.Thread(target=target)
+        helper_thread.start()
+        helper_thread.join()
+    finally:
+        threading.stack_size(original_stack_size)
+        sys.setrecursionlimit(original_recursion_limit)
+    if error:
+        exception_type, exception, traceback = error[0]
+        raise exception_type, exception, traceback
+    return result[0]
@@ -15,6 +15,9 @@ print '\nIt is now the {date}, in the town of {city}, pop. {population}.\n'.form
     city=game.city.name,
     population=game.city.population
 )
+# # Save a snapshot of this town, so that later sessions can skip worldgen by
+# # loading it instead (with: game = Game.load('town.snapshot'))
+# game.save('town.snapshot')
 # # Print out businesses in town
 # print '\nThe following companies currently operate in {city}:\n'.format(
 #     city=game.city.name
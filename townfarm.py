@@ -0,0 +1,164 @@
+import cPickle
+import gc
+import os
+import random
+import sys
+import traceback
+from game import Game
+
+
+class TownFarm(object):
+    """A farm that spawns many independent gameplay sessions from a single generated town.
+
+    The town is generated (or loaded from a snapshot) once, in this process; each session
+    is then run in a child process that is forked from this one. Because forking is
+    copy-on-write, every session starts from the exact same town without it having to be
+    re-simulated or explicitly copied, and whatever a session does to its town (e.g.,
+    simulating timesteps or having conversations) is private to that session. Note that
+    the data that sessions only read (e.g., the Names corpora, the NLG/NLU grammars, and the
+    city's path distances) only starts out shared: CPython updates the reference count of
+    every object it touches, which writes to the page holding that object, so each page
+    that a session reads from gets copied into that session all the same. What does stay
+    shared are the pages that a session never touches.
+    """
+
+    def __init__(self, game=None, snapshot_filename=None):
+        """Initialize a TownFarm object.
+
+        @param game: A Game object whose town has already been established; if neither this nor
+                     snapshot_filename is passed, a new town will be generated.
+        @param snapshot_filename: The path to a snapshot file (written by Game.save()) from
+                                  which the town will be loaded.
+        """
+        if game:
+            self.game = game
+        elif snapshot_filename:
+            self.game = Game.load(filename=snapshot_filename)
+        else:
+            self.game = Game()
+            self.game.establish_setting()
+        self.sessions = set()  # Sessions that have been spawned and not yet collected
+
+    def spawn(self, session_function, *args, **kwargs):
+        """Spawn a new gameplay session, and return a Session object that can be used to collect its result.
+
+        @param session_function: A function that will be called with this farm's Game object
+                                 (followed by any additional arguments passed here) in the child
+                                 process; its return value, which must be picklable, will be sent
+                                 back to this process as the result of the session.
+        """
+        # Collect garbage now, so that the child processes don't each redo this work (which
+        # would also cause the pages holding the town to be copied into each of them)
+        gc.collect()
+        # Flush the event store's buffered writes to disk, else the child process would inherit
+        # a copy of them (and write them out a second time)
+        self.game.events.flush()
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # This is the child process
+            os.close(read_end)
+            self._run_session(session_function, args, kwargs, write_end)
+        os.close(write_end)
+        session = Session(farm=self, pid=pid, read_end=read_end)
+        self.sessions.add(session)
+        return session
+
+    def _run_session(self, session_function, args, kwargs, write_end):
+        """Run a gameplay session in a child process and send its result to the parent process.
+
+        This method never returns -- the child process exits once the result has been sent.
+        """
+        exit_status = 0
+        try:
+            # Reseed the game's random streams (from the OS's source of randomness, since the
+            # global random state is also inherited), since otherwise every session would
+            # inherit the same random state and thus unfold identically
+            self.game.rng.reseed(seed=random.SystemRandom().randint(0, sys.maxint))
+            # Have this session spill its events to a log of its own, since the parent process
+            # (and the other sessions) will keep writing to the one that was inherited
+            self.game.events.branch()
+            try:
+                outcome = (True, session_function(self.game, *args, **kwargs))
+            except Exception:
+                outcome = (False, traceback.format_exc())
+                exit_status = 1
+            # Pickle the outcome in full before sending any of it, so that an outcome that can't
+            # be pickled gets reported as a failure, rather than leaving a partial pickle in the pipe
+            try:
+                pickled_outcome = cPickle.dumps(outcome, cPickle.HIGHEST_PROTOCOL)
+            except Exception:
+                pickled_outcome = cPickle.dumps((False, traceback.format_exc()), cPickle.HIGHEST_PROTOCOL)
+                exit_status = 1
+            with os.fdopen(write_end, 'wb') as result_pipe:
+                result_pipe.write(pickled_outcome)
+        except BaseException:
+            exit_status = 1
+        finally:
+            # Exit without running any cleanup that belongs to the parent process
+            os._exit(exit_status)
+
+    def collect_all(self):
+        """Wait for all spawned sessions to finish, and return a list of their results.
+
+        Every session is waited for before any failure is raised, so that no child process
+        is left behind; the exception that is raised names each session that failed.
+        """
+        sessions = list(self.sessions)
+        for session in sessions:
+            session.wait()
+        failed_sessions = [session for session in sessions if not session.succeeded]
+        if failed_sessions:
+            raise Exception('\n'.join(session.failure_report() for session in failed_sessions))
+        return [session.result() for session in sessions]
+
+
+class Session(object):
+    """A gameplay session running in a child process that was spawned by a TownFarm."""
+
+    def __init__(self, farm, pid, read_end):
+        """Initialize a Session object."""
+        self.farm = farm
+        self.pid = pid
+        self.read_end = read_end
+        self.finished = False
+        self.succeeded = None
+        self.outcome = None  # Either the session's return value or, if it failed, a description of its failure
+        self.exit_status = None  # The status with which the child process exited
+
+    def __str__(self):
+        """Return string representation."""
+        return "Gameplay session in {town} (process {pid})".format(town=self.farm.game.city.name, pid=self.pid)
+
+    def wait(self):
+        """Wait for this session to finish, and record whether it succeeded, along with its outcome."""
+        if self.finished:
+            return
+        with os.fdopen(self.read_end, 'rb') as result_pipe:
+            try:
+                self.succeeded, self.outcome = cPickle.load(result_pipe)
+            except Exception as error:  # The child process died before (or while) sending its result
+                self.succeeded = False
+                self.outcome = 'No complete result was received ({}: {})'.format(error.__class__.__name__, error)
+        _, status = os.waitpid(self.pid, 0)
+        if os.WIFSIGNALED(status):
+            self.exit_status = -os.WTERMSIG(status)
+        else:
+            self.exit_status = os.WEXITSTATUS(status)
+        if self.exit_status != 0 and self.succeeded:
+            # The result came through, but the child process didn't exit cleanly after sending it
+            self.succeeded = False
+            self.outcome = 'The session finished, but its process exited abnormally'
+        self.finished = True
+        self.farm.sessions.discard(self)
+
+    def failure_report(self):
+        """Return a description of how this session failed."""
+        return '{} failed with exit status {}:\n{}'.format(self, self.exit_status, self.outcome)
+
+    def result(self):
+        """Wait for this session to finish, and return its result."""
+        self.wait()
+        if not self.succeeded:
+            raise Exception(self.failure_report())
+        return self.outcome
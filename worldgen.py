@@ -0,0 +1,86 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from game import Game
+
+
+def generate_towns(seeds, n_workers, output_directory, quiet=True):
+    """Generate a batch of towns in parallel, saving each one as a snapshot file.
+
+    Each town is generated in its own worker process (a fresh one for every town, since
+    some classes keep running counters that would otherwise carry over from one town to
+    the next), so throughput scales with the number of workers up to the number of cores.
+
+    @param seeds: An iterable of seeds for the random number generator, one per town.
+    @param n_workers: The number of worker processes to run at once.
+    @param output_directory: The directory to which town snapshots will be written.
+    @param quiet: Whether to silence the worldgen progress output of the worker processes.
+    @return: A list of summaries (dictionaries) of the generated towns, in the order of
+             the given seeds.
+    """
+    if not os.path.isdir(output_directory):
+        os.makedirs(output_directory)
+    jobs = [(seed, output_directory, quiet) for seed in seeds]
+    pool = multiprocessing.Pool(processes=n_workers, maxtasksperchild=1)
+    try:
+        summaries = pool.map(_generate_town, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return summaries
+
+
+def _generate_town(job):
+    """Generate a single town and save it to a snapshot file, returning a summary of the town."""
+    seed, output_directory, quiet = job
+    if quiet:
+        sys.stdout = open(os.devnull, 'w')
+    filename = os.path.join(output_directory, 'town_{seed}.snapshot'.format(seed=seed))
+    summary = {
+        'seed': seed, 'filename': None, 'error': None,
+        'name': None, 'population': None, 'n_events': None,
+        'worldgen_time': None, 'save_time': None,
+    }
+    start_time = time.time()
+    game = None
+    try:
+        game = Game(seed=seed)
+        game.establish_setting()
+        summary['worldgen_time'] = time.time() - start_time
+        game.save(filename=filename)
+        summary['save_time'] = time.time() - start_time - summary['worldgen_time']
+        summary['filename'] = filename
+        summary['name'] = game.city.name
+        summary['population'] = game.city.population
+        summary['n_events'] = len(game.events)
+    except Exception:
+        # Don't let one bad town sink the whole batch
+        summary['error'] = traceback.format_exc()
+    finally:
+        # Worker processes exit without running atexit handlers, so the event store
+        # has to be closed here (which deletes its log from disk)
+        if game:
+            game.events.close()
+    return summary
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a batch of towns in parallel.')
+    parser.add_argument('seeds', type=int, nargs='+', help='a seed for each town to generate')
+    parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count(), help='number of worker processes')
+    parser.add_argument('--out', default='towns', help='directory to write town snapshots to')
+    arguments = parser.parse_args()
+    batch_start_time = time.time()
+    for town_summary in generate_towns(
+            seeds=arguments.seeds, n_workers=arguments.workers, output_directory=arguments.out
+    ):
+        if town_summary['error']:
+            print 'Seed {seed}: failed\n{error}'.format(**town_summary)
+        else:
+            print 'Seed {seed}: {name}, pop. {population}, {n_events} events ({worldgen_time:.1f}s)'.format(
+                **town_summary
+            )
+    print 'Generated {n} towns in {seconds:.1f}s'.format(n=len(arguments.seeds), seconds=time.time()-batch_start_time)